@@ -2,15 +2,17 @@
 
 @author: Fabrice Normandin
 """
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from . import helpers, utils, wrappers
+from .compiled_parser import CompiledParser
 from .conflicts import ConflictResolution
-from .decorators import main
 from .help_formatter import SimpleHelpFormatter
-from .helpers import (
-    Partial,
-    Serializable,
+from .helpers.fields import (
     choice,
-    config_for,
     field,
     flag,
     list_field,
@@ -18,22 +20,56 @@ from .helpers import (
     subgroups,
     subparsers,
 )
+from .parse_stats import ParseStats
 from .parsing import (
     ArgumentGenerationMode,
     ArgumentParser,
     DashVariant,
     NestedMode,
+    ParseResult,
     ParsingError,
     parse,
     parse_known_args,
+    parse_many,
 )
 from .replace import replace, replace_subgroups
 from .utils import InconsistentArgumentError
 
+if TYPE_CHECKING:
+    from .decorators import main
+    from .helpers import Partial, Serializable, config_for
+
+# NOTE: These attributes are imported lazily (PEP 562), on first access, so that scripts which
+# only parse arguments don't pay for importing the serialization, partial and decorator helpers.
+_lazy_attributes: dict[str, tuple[str, str]] = {
+    "main": (".decorators", "main"),
+    "Partial": (".helpers.partial", "Partial"),
+    "config_for": (".helpers.partial", "config_for"),
+    "Serializable": (".helpers.serialization", "Serializable"),
+}
+_lazy_submodules = ["decorators", "docstring", "parser_cache"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_submodules:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _lazy_attributes[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
+
+
 __all__ = [
     "ArgumentGenerationMode",
     "ArgumentParser",
     "choice",
+    "CompiledParser",
     "config_for",
     "ConflictResolution",
     "DashVariant",
@@ -46,7 +82,10 @@ __all__ = [
     "mutable_field",
     "NestedMode",
     "parse_known_args",
+    "parse_many",
     "parse",
+    "ParseResult",
+    "ParseStats",
     "ParsingError",
     "Partial",
     "replace",
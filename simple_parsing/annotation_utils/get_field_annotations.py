@@ -3,15 +3,19 @@ import inspect
 import sys
 import types
 import typing
+import weakref
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import InitVar
-from itertools import dropwhile
 from logging import getLogger as get_logger
-from typing import Any, Optional, get_type_hints
+from typing import Any, Optional
+
+from ..parse_stats import tracked
 
 logger = get_logger(__name__)
 
+get_type_hints = tracked("typing.get_type_hints")(typing.get_type_hints)
+
 # NOTE: This dict is used to enable forward compatibility with things such as `tuple[int, str]`,
 # `list[float]`, etc. when using `from __future__ import annotations`.
 forward_refs_to_types = {
@@ -164,14 +168,65 @@ def get_field_type_from_annotations(some_class: type, field_name: str) -> type:
     Then we need to actually first make this forward-compatibility 'patch' so that we
     don't run into a "`type` object is not subscriptable" error.
 
+    NOTE: The annotations of all the fields of the class are resolved at once, the first time this
+    is called for the class, and the resolved types are cached.
+
     NOTE: If you get errors of this kind from the function below, then you might want to add an
     entry to the `forward_refs_to_types` dict above.
     """
+    field_types = _field_types_cache.get(some_class)
+    if field_types is not None and field_name in field_types:
+        return field_types[field_name]
+
+    field_types, unresolved_field_types = _resolve_field_types(some_class)
+    # NOTE: The annotations that can't be evaluated aren't cached, so that they can be evaluated
+    # later, e.g. once a forward reference is defined. The types that refer to the class itself
+    # (e.g. `children: list[Node]`) aren't cached either, since they would keep the class alive.
+    try:
+        _field_types_cache[some_class] = {
+            name: field_type
+            for name, field_type in field_types.items()
+            if not _refers_to(field_type, some_class)
+        }
+    except TypeError:
+        pass
+
+    if field_name in field_types:
+        return field_types[field_name]
+    if field_name not in unresolved_field_types:
+        raise ValueError(f"Field {field_name} not found in annotations of class {some_class}")
+    field_type = unresolved_field_types[field_name]
+    logger.warning(
+        f"Unable to evaluate forward reference {field_type} for field '{field_name}'.\n"
+        f"Leaving it as-is."
+    )
+    return field_type
+
+
+# The resolved type annotations of the fields of each class.
+# NOTE: The classes are weakly referenced, so that classes defined in local scopes (e.g. in tests)
+# can be garbage-collected.
+_field_types_cache: weakref.WeakKeyDictionary[type, dict[str, Any]] = weakref.WeakKeyDictionary()
 
+
+def _refers_to(field_type: Any, some_class: type) -> bool:
+    """Returns whether the type annotation is, or contains, the given class."""
+    if field_type is some_class:
+        return True
+    if isinstance(field_type, (list, tuple)):
+        # e.g. the arguments of `Callable[[int], str]`.
+        return any(_refers_to(arg, some_class) for arg in field_type)
+    return any(_refers_to(arg, some_class) for arg in typing.get_args(field_type))
+
+
+def _resolve_field_types(some_class: type) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Evaluates the type annotations of all the fields of the class.
+
+    Returns the evaluated annotations, and the annotations that couldn't be evaluated (as-is).
+    """
     # Pretty hacky: Modify the type annotations of the class (preferably a copy of the class
     # if possible, to avoid modifying things in-place), and replace  the `a | b`-type
     # expressions with `Union[a, b]`, so that `get_type_hints` doesn't raise an error.
-    # The type of the field might be a string when using `from __future__ import annotations`.
 
     # The type of the field might be a string when using `from __future__ import annotations`.
     # Get the local and global namespaces to pass to the `get_type_hints` function.
@@ -181,43 +236,77 @@ def get_field_type_from_annotations(some_class: type, field_name: str) -> type:
     # NOTE: Get the local namespace of the calling function / module where this class is defined,
     # and use it to get the correct type of the field, if it is a forward reference.
     frame = inspect.currentframe()
-    # stack = []
     while frame.f_back is not None and frame.f_locals.get(some_class.__name__) is not some_class:
-        # stack.append(frame)
         frame = frame.f_back
     # Found the frame with the dataclass definition. Update the locals. This makes it possible to
     # use dataclasses defined in local scopes!
     if frame is not None:
         local_ns.update(frame.f_locals)
 
-    # Get the global_ns in the module starting from the deepest base until the module with the field_name last definition.
-    global_ns = {}
-    classes_to_iterate = list(
-        dropwhile(
-            lambda cls: field_name not in getattr(cls, "__annotations__", {}), some_class.mro()
-        )
-    )
-    for base_cls in reversed(classes_to_iterate):
-        global_ns.update(sys.modules[base_cls.__module__].__dict__)
+    mro = some_class.mro()
+    class_annotations = [getattr(cls, "__annotations__", {}) for cls in mro]
+    all_annotations = collections.ChainMap(*class_annotations)
 
+    # NOTE: Without a global namespace, `get_type_hints` evaluates the annotations of each class of
+    # the MRO in the namespace of the module of that class.
     try:
         with _initvar_patcher():
-            annotations_dict = get_type_hints(some_class, localns=local_ns, globalns=global_ns)
-    except TypeError:
-        annotations_dict = collections.ChainMap(
-            *[getattr(cls, "__annotations__", {}) for cls in some_class.mro()]
+            annotations_dict = get_type_hints(some_class, localns=local_ns)
+    except (NameError, TypeError):
+        annotations_dict = all_annotations
+
+    # NOTE: `get_type_hints` might not find some annotations, e.g. when they are set on the
+    # metaclass.
+    field_types: dict[str, Any] = {}
+    string_field_types: dict[str, str] = {}
+    for field_name in all_annotations:
+        field_type = _to_old_style_annotation(
+            annotations_dict.get(field_name, all_annotations[field_name])
         )
+        if isinstance(field_type, str):
+            string_field_types[field_name] = field_type
+        else:
+            field_types[field_name] = field_type
+
+    # The annotations that are still strings are evaluated with the modules from the deepest base
+    # until the class where the field was last defined.
+    unresolved_field_types: dict[str, Any] = {}
+    fields_per_class: dict[type, dict[str, str]] = {}
+    for field_name, field_type in string_field_types.items():
+        defining_class = next(
+            cls for cls, annotations in zip(mro, class_annotations) if field_name in annotations
+        )
+        fields_per_class.setdefault(defining_class, {})[field_name] = field_type
 
-    if field_name not in annotations_dict:
-        raise ValueError(f"Field {field_name} not found in annotations of class {some_class}")
-
-    field_type = annotations_dict[field_name]
-
-    if sys.version_info[:2] >= (3, 7) and isinstance(field_type, typing.ForwardRef):
+    for defining_class, annotations in fields_per_class.items():
+        global_ns = {}
+        for base_cls in reversed(mro[mro.index(defining_class) :]):
+            global_ns.update(sys.modules[base_cls.__module__].__dict__)
+        # Pretty hacky:
+        # In order to use `get_type_hints`, we need to pass it a class. We can't just ask it to
+        # evaluate a single annotation. Therefore, we create a temporary class and set it's
+        # __annotation__ attribute, which is introspected by `get_type_hints`.
+        # All the annotations are first evaluated at once, and then one at a time if that fails.
+        try:
+            field_types.update(_evaluate_annotations(annotations, global_ns, local_ns))
+            continue
+        except Exception:
+            pass
+        for field_name, field_type in annotations.items():
+            try:
+                field_types.update(
+                    _evaluate_annotations({field_name: field_type}, global_ns, local_ns)
+                )
+            except Exception:
+                unresolved_field_types[field_name] = field_type
+    return field_types, unresolved_field_types
+
+
+def _to_old_style_annotation(field_type: Any) -> Any:
+    if isinstance(field_type, typing.ForwardRef):
         # Weird bug happens when mixing postponed evaluation of type annotations + forward
         # references: The ForwardRefs are left as-is, and not evaluated!
-        forward_arg = field_type.__forward_arg__
-        field_type = forward_arg
+        field_type = field_type.__forward_arg__
 
     if sys.version_info >= (3, 10) and isinstance(field_type, types.UnionType):
         # In python >= 3.10, int | float is allowed. Therefore, just to be consistent, we want
@@ -227,26 +316,15 @@ def get_field_type_from_annotations(some_class: type, field_name: str) -> type:
 
     if isinstance(field_type, str) and "|" in field_type:
         field_type = _get_old_style_annotation(field_type)
+    return field_type
 
-        # Pretty hacky:
-        # In order to use `get_type_hints`, we need to pass it a class. We can't just ask it to
-        # evaluate a single annotation. Therefore, we create a temporary class and set it's
-        # __annotation__ attribute, which is introspected by `get_type_hints`.
-
-    try:
-
-        class Temp_:
-            pass
 
-        Temp_.__annotations__ = {field_name: field_type}
-        with _initvar_patcher():
-            annotations_dict = get_type_hints(Temp_, globalns=global_ns, localns=local_ns)
-        field_type = annotations_dict[field_name]
-    except Exception:
-        logger.warning(
-            f"Unable to evaluate forward reference {field_type} for field '{field_name}'.\n"
-            f"Leaving it as-is."
-        )
-        field_type = field_type
+def _evaluate_annotations(
+    annotations: dict[str, Any], global_ns: dict[str, Any], local_ns: dict[str, Any]
+) -> dict[str, Any]:
+    class Temp_:
+        pass
 
-    return field_type
+    Temp_.__annotations__ = annotations
+    with _initvar_patcher():
+        return get_type_hints(Temp_, globalns=global_ns, localns=local_ns)
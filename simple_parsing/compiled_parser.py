@@ -0,0 +1,122 @@
+"""A frozen version of an `ArgumentParser`, which can be shared between threads.
+
+Adding the arguments of an `ArgumentParser` modifies the parser and its wrappers, which isn't
+thread-safe. Once all the arguments are added however, parsing doesn't modify the parser anymore.
+The `CompiledParser` adds all the arguments once, and then only exposes the methods that parse
+arguments or format the help, so it can be used by multiple threads at the same time.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from argparse import Namespace, _
+from collections.abc import Iterable, Iterator, Sequence
+from typing import IO, TYPE_CHECKING, Any, NoReturn
+
+from .parse_stats import track
+
+if TYPE_CHECKING:
+    from .conflicts import ConflictResolution
+    from .parsing import ArgumentParser, ParseResult
+    from .wrappers import DashVariant
+    from .wrappers.field_wrapper import ArgumentGenerationMode, NestedMode
+
+
+class CompiledParser:
+    """A frozen, thread-safe `ArgumentParser`, created with `ArgumentParser.compile`.
+
+    The arguments are added for the subgroups and config files chosen in the command-line
+    arguments given to `compile`, and the chosen subgroups become the defaults. Parsing arguments
+    that choose other subgroups or config files is an error.
+    """
+
+    __slots__ = ("_parser", "_lock")
+
+    _parser: ArgumentParser
+    _lock: threading.Lock
+
+    def __init__(self, parser: ArgumentParser):
+        if not parser._preprocessing_done:
+            raise RuntimeError("Use `ArgumentParser.compile()` to create a compiled parser.")
+        object.__setattr__(self, "_parser", parser)
+        # Formatting the help retrieves the docstrings and modifies the actions, and the parsers of
+        # sub-commands add their arguments when they are first used.
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is frozen, can't set attribute {name!r}.")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is frozen, can't delete attribute {name!r}.")
+
+    @property
+    def conflict_resolution(self) -> ConflictResolution:
+        return self._parser.conflict_resolution
+
+    @property
+    def add_option_string_dash_variants(self) -> DashVariant:
+        return self._parser.add_option_string_dash_variants
+
+    @property
+    def argument_generation_mode(self) -> ArgumentGenerationMode:
+        return self._parser.argument_generation_mode
+
+    @property
+    def nested_mode(self) -> NestedMode:
+        return self._parser.nested_mode
+
+    def parse_known_args(
+        self, args: Sequence[str] | None = None, namespace: Namespace | None = None
+    ) -> tuple[Namespace, list[str]]:
+        from .parsing import _ArgumentsNotReusableError
+
+        args = sys.argv[1:] if args is None else list(args)
+        namespace = Namespace() if namespace is None else namespace
+        try:
+            with self._parser._collecting_stats(), track("parse_known_args"):
+                if self._parser._subparsers is None:
+                    return self._parser._parse_known_args_prepared(args, namespace)
+                with self._lock:
+                    return self._parser._parse_known_args_prepared(args, namespace)
+        except _ArgumentsNotReusableError as error:
+            # Report it like the other errors: print the usage and exit.
+            self._parser.error(str(error))
+
+    def parse_args(
+        self, args: Sequence[str] | None = None, namespace: Namespace | None = None
+    ) -> Namespace:
+        parsed_args, unparsed_args = self.parse_known_args(args, namespace)
+        if unparsed_args:
+            self._parser.error(_("unrecognized arguments: %s") % " ".join(unparsed_args))
+        return parsed_args
+
+    def parse_many(
+        self, args_list: Iterable[str | Sequence[str]], namespace: Namespace | None = None
+    ) -> list[ParseResult[Namespace]]:
+        """Parses each list of arguments, returning the errors instead of exiting.
+
+        See `ArgumentParser.parse_many` for more info.
+        """
+        return list(self.iter_parse_many(args_list, namespace=namespace))
+
+    def iter_parse_many(
+        self, args_list: Iterable[str | Sequence[str]], namespace: Namespace | None = None
+    ) -> Iterator[ParseResult[Namespace]]:
+        for args in args_list:
+            if self._parser._subparsers is None:
+                yield self._parser._parse_one(args, namespace=namespace)
+                continue
+            with self._lock:
+                result = self._parser._parse_one(args, namespace=namespace)
+            yield result
+
+    def format_usage(self) -> str:
+        with self._lock:
+            return self._parser.format_usage()
+
+    def format_help(self) -> str:
+        with self._lock:
+            return self._parser.format_help()
+
+    def print_help(self, file: IO[str] | None = None) -> None:
+        self._parser._print_message(self.format_help(), sys.stdout if file is None else file)
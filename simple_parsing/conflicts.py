@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import enum
+import heapq
 from collections import defaultdict
 from logging import getLogger
 from typing import NamedTuple
 
+from .parse_stats import tracked
 from .wrappers import DataclassWrapper, FieldWrapper
 
 logger = getLogger(__name__)
@@ -57,10 +59,121 @@ def unflatten(possibly_related_wrappers: list[DataclassWrapper]) -> list[Datacla
     return [wrapper for wrapper in possibly_related_wrappers if wrapper.parent is None]
 
 
+class _OptionStringIndex:
+    """Index from option strings to the fields that use them, updated as prefixes change.
+
+    Conflicts are returned in the same order as in `ConflictResolver.get_conflict`: the conflict
+    on the option string that appears first when going through the fields (and their option
+    strings) in order. Instead of going through all the fields after each fix, only the option
+    strings of the fields whose prefix was changed are updated.
+    """
+
+    def __init__(self, wrappers: list[DataclassWrapper]):
+        field_wrappers = [field for wrapper in wrappers for field in wrapper.fields]
+        assert len(field_wrappers) == len(set(field_wrappers)), "duplicates?"
+        self._ordinals: dict[FieldWrapper, int] = {f: i for i, f in enumerate(field_wrappers)}
+        self._option_strings: dict[FieldWrapper, list[str]] = {}
+        # Prefix of each field when its option strings were computed.
+        self._prefixes: dict[FieldWrapper, str] = {}
+        self._fields: dict[str, list[FieldWrapper]] = defaultdict(list)
+        # Heap of (position of the option string, option string) for the possible conflicts.
+        # Entries can be outdated, they are checked when popped.
+        self._possible_conflicts: list[tuple[tuple[int, int], str]] = []
+        for field_wrapper in field_wrappers:
+            self._add(field_wrapper)
+
+    def update(self, field_wrappers: list[FieldWrapper]) -> None:
+        """Updates the option strings of the given fields (after their prefix was changed)."""
+        for field_wrapper in field_wrappers:
+            self._remove(field_wrapper)
+        for field_wrapper in field_wrappers:
+            self._add(field_wrapper)
+
+    def refresh(self, wrappers: list[DataclassWrapper]) -> None:
+        """Updates the index after wrappers were added to (or removed from) the tree.
+
+        Only the option strings of the new fields, and of the fields whose prefix was changed, are
+        computed again. This is used when resolving subgroups, where the tree of wrappers grows
+        with each nesting level.
+        """
+        field_wrappers = [field for wrapper in wrappers for field in wrapper.fields]
+        assert len(field_wrappers) == len(set(field_wrappers)), "duplicates?"
+        self._ordinals = {f: i for i, f in enumerate(field_wrappers)}
+        outdated = [
+            field_wrapper
+            for field_wrapper, prefix in self._prefixes.items()
+            if field_wrapper not in self._ordinals or field_wrapper.prefix != prefix
+        ]
+        for field_wrapper in outdated:
+            self._remove(field_wrapper)
+        # The order of the fields changed, so the positions of the option strings did too.
+        for fields in self._fields.values():
+            fields.sort(key=self._ordinals.__getitem__)
+        self._possible_conflicts = [
+            (self._position(option_string), option_string)
+            for option_string, fields in self._fields.items()
+            if len(fields) > 1
+        ]
+        heapq.heapify(self._possible_conflicts)
+        for field_wrapper in field_wrappers:
+            if field_wrapper not in self._option_strings:
+                self._add(field_wrapper)
+
+    def get_conflict(self) -> Conflict | None:
+        while self._possible_conflicts:
+            position, option_string = self._possible_conflicts[0]
+            fields = self._fields.get(option_string, [])
+            if len(fields) < 2:
+                heapq.heappop(self._possible_conflicts)
+                continue
+            current_position = self._position(option_string)
+            if current_position != position:
+                heapq.heapreplace(self._possible_conflicts, (current_position, option_string))
+                continue
+            return Conflict(option_string, fields.copy())
+        return None
+
+    def _position(self, option_string: str) -> tuple[int, int]:
+        first_field = self._fields[option_string][0]
+        return (
+            self._ordinals[first_field],
+            self._option_strings[first_field].index(option_string),
+        )
+
+    def _add(self, field_wrapper: FieldWrapper) -> None:
+        option_strings = field_wrapper.option_strings
+        self._option_strings[field_wrapper] = option_strings
+        self._prefixes[field_wrapper] = field_wrapper.prefix
+        ordinal = self._ordinals[field_wrapper]
+        for option_string in option_strings:
+            fields = self._fields[option_string]
+            # Keep the fields in the same order as in the list of wrappers.
+            index = len(fields)
+            while index > 0 and self._ordinals[fields[index - 1]] > ordinal:
+                index -= 1
+            fields.insert(index, field_wrapper)
+            if len(fields) > 1:
+                heapq.heappush(
+                    self._possible_conflicts, (self._position(option_string), option_string)
+                )
+
+    def _remove(self, field_wrapper: FieldWrapper) -> None:
+        del self._prefixes[field_wrapper]
+        for option_string in self._option_strings.pop(field_wrapper):
+            fields = self._fields[option_string]
+            fields.remove(field_wrapper)
+            if not fields:
+                del self._fields[option_string]
+
+
 class ConflictResolver:
-    def __init__(self, conflict_resolution=ConflictResolution.AUTO):
+    def __init__(
+        self, conflict_resolution=ConflictResolution.AUTO, max_attempts: int | None = None
+    ):
         self.conflict_resolution = conflict_resolution
-        self.max_attempts = 50
+        # Maximum number of conflicts to fix. When `None`, a bound is computed from the number of
+        # fields and their nesting, since each fix makes the prefix of at least one field longer.
+        self.max_attempts = max_attempts
 
     def resolve_and_flatten(self, wrappers: list[DataclassWrapper]) -> list[DataclassWrapper]:
         """Given the list of all dataclass wrappers, find and resolve any conflicts between fields.
@@ -68,6 +181,19 @@ class ConflictResolver:
         Returns the new list of (possibly mutated in-place) dataclass wrappers. This returned list
         is flattened, i.e. it contains all the dataclass wrappers and their children.
         """
+        wrappers_flat, _ = self._resolve_and_flatten(wrappers)
+        return wrappers_flat
+
+    @tracked("conflict_resolution")
+    def _resolve_and_flatten(
+        self, wrappers: list[DataclassWrapper], index: _OptionStringIndex | None = None
+    ) -> tuple[list[DataclassWrapper], _OptionStringIndex]:
+        """Same as `resolve_and_flatten`, but also returns the index of the option strings.
+
+        When given the index from a previous call on the same tree of wrappers (for example before
+        adding the wrappers of the chosen subgroups), only the option strings of the new fields
+        are computed.
+        """
         from simple_parsing.parsing import _assert_no_duplicates, _flatten_wrappers
 
         wrappers = wrappers.copy()
@@ -78,10 +204,15 @@ class ConflictResolver:
         dests = [w.dest for w in wrappers_flat]
         assert len(dests) == len(set(dests)), f"shouldn't be any duplicates: {wrappers_flat}"
 
-        conflict = self.get_conflict(wrappers_flat)
+        if index is None or self.conflict_resolution == ConflictResolution.ALWAYS_MERGE:
+            index = _OptionStringIndex(wrappers_flat)
+        else:
+            index.refresh(wrappers_flat)
+        conflict = index.get_conflict()
 
         # current and maximum number of attempts. When reached, raises an error.
         cur_attempts = 0
+        max_attempts = self.max_attempts or self._max_attempts(wrappers_flat)
         while conflict:
             message: str = (
                 "The following wrappers are in conflict, as they share the "
@@ -96,18 +227,22 @@ class ConflictResolver:
 
             elif self.conflict_resolution == ConflictResolution.EXPLICIT:
                 self._fix_conflict_explicit(conflict)
+                index.update(conflict.wrappers)
 
             elif self.conflict_resolution == ConflictResolution.ALWAYS_MERGE:
                 wrappers_flat = self._fix_conflict_merge(conflict, wrappers_flat)
+                # The merge changes the wrappers themselves, so the index is rebuilt.
+                index = _OptionStringIndex(wrappers_flat)
 
             elif self.conflict_resolution == ConflictResolution.AUTO:
                 self._fix_conflict_auto(conflict)
+                index.update(conflict.wrappers)
 
-            conflict = self.get_conflict(wrappers_flat)
+            conflict = index.get_conflict()
             cur_attempts += 1
-            if cur_attempts == self.max_attempts:
+            if cur_attempts == max_attempts:
                 raise ConflictResolutionError(
-                    f"Reached maximum number of attempts ({self.max_attempts}) "
+                    f"Reached maximum number of attempts ({max_attempts}) "
                     "while trying to solve the conflicting argument names. "
                     "This is either a bug, or there is something weird going "
                     "on with your class hierarchy/argument names... \n"
@@ -122,8 +257,20 @@ class ConflictResolver:
                     "&title=BUG: ConflictResolutionError"
                 )
 
+        # Check the index against a full scan of the option strings (skipped with `python -O`).
         assert not self._conflict_exists(wrappers_flat)
-        return wrappers_flat
+        return wrappers_flat, index
+
+    def _max_attempts(self, wrappers_flat: list[DataclassWrapper]) -> int:
+        """Upper bound on the number of fixes needed to resolve all the conflicts.
+
+        Each fix either merges wrappers (ALWAYS_MERGE), or adds at least one word from the
+        destination of a field to its prefix (AUTO, EXPLICIT), which can only happen as many times
+        as there are words in that destination.
+        """
+        return 1 + len(wrappers_flat) + sum(
+            len(wrapper.dest.split(".")) * len(wrapper.fields) for wrapper in wrappers_flat
+        )
 
     def resolve(self, wrappers: list[DataclassWrapper]) -> list[DataclassWrapper]:
         return unflatten(self.resolve_and_flatten(wrappers))
@@ -8,18 +8,28 @@ import functools
 import inspect
 
 # from inspect import
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from logging import getLogger
+from typing import TYPE_CHECKING
 
-import docstring_parser as dp
-from docstring_parser.common import Docstring
+from .parse_stats import tracked
 
-dp_parse = functools.lru_cache(2048)(dp.parse)
-inspect_getsource = functools.lru_cache(2048)(inspect.getsource)
+if TYPE_CHECKING:
+    from docstring_parser.common import Docstring
+
+inspect_getsource = functools.lru_cache(2048)(tracked("inspect.getsource")(inspect.getsource))
 inspect_getdoc = functools.lru_cache(2048)(inspect.getdoc)
 logger = getLogger(__name__)
 
 
+@functools.lru_cache(2048)
+def dp_parse(text: str) -> Docstring:
+    """Parses a docstring with `docstring_parser`, which is only imported when first needed."""
+    import docstring_parser as dp
+
+    return dp.parse(text)
+
+
 @dataclass
 class AttributeDocString:
     """Simple dataclass for holding the comments of a given field."""
@@ -104,10 +114,23 @@ def get_attribute_docstring(
     return created_docstring
 
 
-@functools.lru_cache(2048)
 def _get_attribute_docstring(dataclass: type, field_name: str) -> AttributeDocString | None:
     """Gets the AttributeDocString of the given field in the given dataclass.
 
+    Doesn't inspect base classes.
+    """
+    attribute_docstring = _get_attribute_docstrings(dataclass).get(field_name)
+    if attribute_docstring is None:
+        return None
+    # Return a copy, since the result may be modified when accumulating from the base classes.
+    return replace(attribute_docstring)
+
+
+@functools.lru_cache(2048)
+def _get_attribute_docstrings(dataclass: type) -> dict[str, AttributeDocString]:
+    """Gets the AttributeDocString of all the fields defined in the given dataclass.
+
+    The source code of the class is only split and scanned once, rather than once per field.
     Doesn't inspect base classes.
     """
     try:
@@ -116,19 +139,18 @@ def _get_attribute_docstring(dataclass: type, field_name: str) -> AttributeDocSt
         logger.debug(
             UserWarning(
                 f"Couldn't retrieve the source code of class {dataclass} "
-                f"(in order to retrieve the docstring of field {field_name}): {e}"
+                f"(in order to retrieve the docstrings of its fields): {e}"
             )
         )
-        return None
+        return {}
 
     # Parse docstring to use as help strings
-    desc_from_cls_docstring = ""
+    descs_from_cls_docstring: dict[str, str] = {}
     cls_docstring = inspect_getdoc(dataclass)
     if cls_docstring:
         docstring: Docstring = dp_parse(cls_docstring)
         for param in docstring.params:
-            if param.arg_name == field_name:
-                desc_from_cls_docstring = param.description or ""
+            descs_from_cls_docstring[param.arg_name] = param.description or ""
 
     # NOTE: We want to skip the docstring lines.
     # NOTE: Currently, we just remove the __doc__ from the source. It's perhaps a bit crude,
@@ -138,31 +160,24 @@ def _get_attribute_docstring(dataclass: type, field_name: str) -> AttributeDocSt
         # note: does this remove the whitespace though?
 
     code_lines: list[str] = source.splitlines()
-    # the first line is the class definition (OR the decorator!), we skip it.
-    start_line_index = 1
-    # starting at the second line, there might be the docstring for the class.
-    # We want to skip over that until we reach an attribute definition.
-    while start_line_index < len(code_lines):
-        if _contains_field_definition(code_lines[start_line_index]):
-            break
-        start_line_index += 1
-
-    lines_with_field_defs = [
-        (index, line) for index, line in enumerate(code_lines) if _contains_field_definition(line)
-    ]
-    for i, line in lines_with_field_defs:
-        if _line_contains_definition_for(line, field_name):
-            # we found the line with the definition of this field.
-            comment_above = _get_comment_ending_at_line(code_lines, i - 1)
-            comment_inline = _get_inline_comment_at_line(code_lines, i)
-            docstring_below = _get_docstring_starting_at_line(code_lines, i + 1)
-            return AttributeDocString(
-                comment_above,
-                comment_inline,
-                docstring_below,
-                desc_from_cls_docstring=desc_from_cls_docstring,
-            )
-    return None
+    attribute_docstrings: dict[str, AttributeDocString] = {}
+    for i, line in enumerate(code_lines):
+        if not _contains_field_definition(line):
+            continue
+        field_name = _get_field_name_at_line(line)
+        if field_name is None or field_name in attribute_docstrings:
+            # Only the first definition of a field is used.
+            continue
+        comment_above = _get_comment_ending_at_line(code_lines, i - 1)
+        comment_inline = _get_inline_comment_at_line(code_lines, i)
+        docstring_below = _get_docstring_starting_at_line(code_lines, i + 1)
+        attribute_docstrings[field_name] = AttributeDocString(
+            comment_above,
+            comment_inline,
+            docstring_below,
+            desc_from_cls_docstring=descs_from_cls_docstring.get(field_name, ""),
+        )
+    return attribute_docstrings
 
 
 def _contains_field_definition(line: str) -> bool:
@@ -221,9 +236,20 @@ def _line_contains_definition_for(line: str, field_name: str) -> bool:
     line = line.strip()
     if not _contains_field_definition(line):
         return False
-    attribute, _, type_and_value_assignment = line.partition(":")
+    return _get_field_name_at_line(line) == field_name
+
+
+def _get_field_name_at_line(line: str) -> str | None:
+    """Returns the name of the field defined at the given line, if any.
+
+    >>> _get_field_name_at_line("    foobaz: int = 123  #: The foobaz property")
+    'foobaz'
+    >>> _get_field_name_at_line("a = {'b': 1}") is None
+    True
+    """
+    attribute, _, type_and_value_assignment = line.strip().partition(":")
     attribute = attribute.strip()  # remove any whitespace after the attribute name.
-    return attribute.isidentifier() and attribute == field_name
+    return attribute if attribute.isidentifier() else None
 
 
 def _is_empty(line_str: str) -> bool:
@@ -1,7 +1,7 @@
 import argparse
 from argparse import ONE_OR_MORE, OPTIONAL, PARSER, REMAINDER, ZERO_OR_MORE, Action
 from logging import getLogger
-from typing import Optional
+from typing import Callable, Optional
 
 from .wrappers.field_metavar import get_metavar
 
@@ -9,6 +9,52 @@ TEMPORARY_TOKEN = "<__TEMP__>"
 logger = getLogger(__name__)
 
 
+class LazyHelp:
+    """A help string (or argument group description) which is only computed when needed.
+
+    Retrieving the docstring of a field requires reading and scanning the source code of its
+    dataclass, which is wasted work unless a help message is actually displayed. The
+    `ArgumentParser` resolves these values right before formatting its help.
+    """
+
+    __slots__ = ("_fn", "_value", "_resolved")
+
+    def __init__(self, fn: Callable[[], Optional[str]]):
+        self._fn = fn
+        self._value: Optional[str] = None
+        self._resolved = False
+
+    def resolve(self) -> Optional[str]:
+        if not self._resolved:
+            self._value = self._fn()
+            self._resolved = True
+        return self._value
+
+    def __add__(self, other: str) -> "LazyHelp":
+        # Some actions (e.g. our `BooleanOptionalAction`) append to the help string.
+        return LazyHelp(lambda: (self.resolve() or "") + other)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyHelp):
+            other = other.resolve()
+        return self.resolve() == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        # NOTE: Don't resolve the value here, since the arguments are often logged.
+        if self._resolved:
+            return repr(self._value)
+        return f"{type(self).__name__}({self._fn!r})"
+
+
+def resolve_lazy_help(value):
+    """Returns the help string (or description) if it is a `LazyHelp`, else the value itself."""
+    if isinstance(value, LazyHelp):
+        return value.resolve()
+    return value
+
+
 class SimpleHelpFormatter(
     argparse.ArgumentDefaultsHelpFormatter,
     argparse.MetavarTypeHelpFormatter,
@@ -1,19 +1,47 @@
 """Collection of helper classes and functions to reduce boilerplate code."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .fields import *
-from .flatten import FlattenedAccess
-from .hparams import HyperParameters
-from .partial import Partial, config_for
-from .serialization import FrozenSerializable, Serializable, SimpleJsonEncoder, encode
-
-try:
-    from .serialization import YamlSerializable
-except ImportError:
-    pass
-
-# For backward compatibility purposes
-JsonSerializable = Serializable
-SimpleEncoder = SimpleJsonEncoder
+
+if TYPE_CHECKING:
+    from .flatten import FlattenedAccess
+    from .hparams import HyperParameters
+    from .partial import Partial, config_for
+    from .serialization import (
+        FrozenSerializable,
+        Serializable,
+        SimpleJsonEncoder,
+        YamlSerializable,
+        encode,
+    )
+
+    # For backward compatibility purposes
+    JsonSerializable = Serializable
+    SimpleEncoder = SimpleJsonEncoder
+
+# NOTE: These attributes are imported lazily (PEP 562), on first access, since some of them (e.g.
+# the hparams and serialization helpers) are costly to import and unused by most scripts.
+_lazy_attributes: dict[str, tuple[str, str]] = {
+    "FlattenedAccess": (".flatten", "FlattenedAccess"),
+    "HyperParameters": (".hparams", "HyperParameters"),
+    "Partial": (".partial", "Partial"),
+    "config_for": (".partial", "config_for"),
+    "FrozenSerializable": (".serialization", "FrozenSerializable"),
+    "Serializable": (".serialization", "Serializable"),
+    "SimpleJsonEncoder": (".serialization", "SimpleJsonEncoder"),
+    "YamlSerializable": (".serialization", "YamlSerializable"),
+    "encode": (".serialization", "encode"),
+    # For backward compatibility purposes
+    "JsonSerializable": (".serialization", "Serializable"),
+    "SimpleEncoder": (".serialization", "SimpleJsonEncoder"),
+}
+
+_lazy_submodules = ["flatten", "hparams", "nested_partial", "partial", "serialization"]
+
 __all__ = [
     "FlattenedAccess",
     "HyperParameters",
@@ -24,3 +52,18 @@ __all__ = [
     "SimpleJsonEncoder",
     "encode",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_submodules:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _lazy_attributes[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
@@ -1,27 +1,133 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .decoding import *
 from .encoding import *
-from .serializable import (
-    FrozenSerializable,
-    Serializable,
-    SerializableMixin,
-    dump,
-    dump_json,
-    dump_yaml,
-    dumps,
-    dumps_json,
-    dumps_yaml,
-    from_dict,
-    load,
-    load_json,
-    load_yaml,
-    save,
-    save_json,
-    save_yaml,
-    to_dict,
-)
-
-try:
+
+if TYPE_CHECKING:
+    from .config_store import ConfigStore
+    from .serializable import (
+        FrozenSerializable,
+        LoadResult,
+        Serializable,
+        SerializableMixin,
+        dump,
+        dump_json,
+        dump_yaml,
+        dumps,
+        dumps_json,
+        dumps_yaml,
+        file_cache,
+        from_dict,
+        from_dicts,
+        load,
+        load_dir,
+        load_json,
+        load_jsonl,
+        load_many,
+        load_yaml,
+        only_use_registered_dc_types,
+        read_file,
+        register_dc_type,
+        save,
+        save_json,
+        save_jsonl,
+        save_yaml,
+        to_dict,
+    )
     from .yaml_serialization import YamlSerializable
-except ImportError:
-    pass
-JsonSerializable = Serializable
+
+    JsonSerializable = Serializable
+
+# NOTE: These attributes are imported lazily (PEP 562), on first access.
+_lazy_attributes: dict[str, tuple[str, str]] = {
+    **{
+        name: (".serializable", name)
+        for name in [
+            "FrozenSerializable",
+            "LoadResult",
+            "Serializable",
+            "SerializableMixin",
+            "dump",
+            "dump_json",
+            "dump_yaml",
+            "dumps",
+            "dumps_json",
+            "dumps_yaml",
+            "file_cache",
+            "from_dict",
+            "from_dicts",
+            "load",
+            "load_dir",
+            "load_json",
+            "load_jsonl",
+            "load_many",
+            "load_yaml",
+            "only_use_registered_dc_types",
+            "read_file",
+            "register_dc_type",
+            "save",
+            "save_json",
+            "save_jsonl",
+            "save_yaml",
+            "to_dict",
+        ]
+    },
+    "ConfigStore": (".config_store", "ConfigStore"),
+    "JsonSerializable": (".serializable", "Serializable"),
+    "YamlSerializable": (".yaml_serialization", "YamlSerializable"),
+}
+
+
+# NOTE: Listing the lazy attributes here makes them available with `from ... import *`.
+__all__ = [
+    # .decoding
+    "DecodingFnCacheInfo",
+    "FieldDecoder",
+    "UnsafeCastingWarning",
+    "decode_dict",
+    "decode_enum",
+    "decode_field",
+    "decode_fields",
+    "decode_list",
+    "decode_literal",
+    "decode_ndarray",
+    "decode_optional",
+    "decode_set",
+    "decode_tuple",
+    "decode_union",
+    "decoding_fn_for_type",
+    "get_decoding_fn",
+    "get_field_decoders",
+    "no_op",
+    "register_decoding_fn",
+    "try_constructor",
+    "try_functions",
+    # .encoding
+    "SimpleJsonEncoder",
+    "copy_mode",
+    "encode",
+    "encode_dict",
+    "encode_enum",
+    "encode_list",
+    "encode_namespace",
+    "encode_path",
+    "get_passthrough_types",
+    # Lazy attributes.
+    *_lazy_attributes,
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _lazy_attributes[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
@@ -0,0 +1,156 @@
+"""A directory of saved dataclasses, where the identical nested dataclasses are only stored once."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import is_dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from simple_parsing.utils import DataclassT, compute_identity
+
+from .serializable import DC_TYPE_KEY, from_dict, get_extension, to_dict
+
+logger = getLogger(__name__)
+
+# The key of the dicts that replace the nested dataclasses in the stored documents.
+REF_KEY = "_ref_"
+
+
+class ConfigStore:
+    """Content-addressed store for dataclasses, which saves each distinct nested dataclass once.
+
+    Each dataclass is saved as a document (see `to_dict`) in which the dataclass fields are
+    replaced with a `{REF_KEY: <key>}` reference to the document of the nested dataclass. The
+    documents also contain the type of their dataclass (see `DC_TYPE_KEY`), so that subgroups and
+    Union fields are loaded with the right type. The key of a document is a hash of its content and
+    type (see `compute_identity`), so runs that share the same sub-configs (e.g. the same
+    optimizer) share the same documents on disk.
+
+    NOTE: The dataclasses in lists and dicts are saved as-is in the document that contains them,
+    without their type, like `to_dict` does. The same goes for the dataclasses defined in
+    functions, since their type can't be saved.
+
+    Args:
+        root: The directory where the documents are saved. Created if it doesn't exist.
+        suffix: The extension of the documents, which determines their format.
+        hash_size: The number of characters of the keys of the documents.
+
+    >>> from dataclasses import dataclass, field
+    >>> @dataclass
+    ... class Optimizer:
+    ...     lr: float = 0.1
+    >>> @dataclass
+    ... class Run:
+    ...     seed: int = 0
+    ...     optimizer: Optimizer = field(default_factory=Optimizer)
+    >>> import tempfile
+    >>> store = ConfigStore(tempfile.mkdtemp())
+    >>> keys = [store.save(Run(seed=seed)) for seed in range(3)]
+    >>> len(list(store.root.iterdir()))  # The 3 runs and their (shared) optimizer.
+    4
+    >>> keys[1] in store
+    True
+    """
+
+    def __init__(self, root: str | Path, suffix: str = ".json", hash_size: int = 16):
+        self.root = Path(root)
+        self.suffix = suffix
+        self.hash_size = hash_size
+        # NOTE: `Path(".json").suffix` is empty, so a dummy file name is used.
+        self.format = get_extension("document" + suffix)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # The keys of the documents that are known to be saved.
+        self._saved: set[str] = set()
+        # The documents of the nested dataclasses that were loaded, by key.
+        self._subtrees: dict[str, dict[str, Any]] = {}
+
+    def save(self, obj: Any) -> str:
+        """Saves the dataclass `obj`, and returns the key to use to load it back."""
+        if not is_dataclass(obj) or isinstance(obj, type):
+            raise ValueError(f"Can only save dataclass instances, not {obj!r}")
+        # NOTE: The documents are written right away, so the values don't need to be copied.
+        return self._save(to_dict(obj, save_dc_types=True, copy_mode="none"))
+
+    def load(
+        self, cls: type[DataclassT], key: str, drop_extra_fields: bool | None = None
+    ) -> DataclassT:
+        """Loads an instance of `cls` from the document with the given key.
+
+        The nested dataclasses that were already loaded from this store are cached, so that their
+        documents are only read once.
+        """
+        if drop_extra_fields is None and getattr(cls, "decode_into_subclasses", None) is not None:
+            drop_extra_fields = not getattr(cls, "decode_into_subclasses")
+        d = self._resolve(self._read(key))
+        return from_dict(cls, d, drop_extra_fields=drop_extra_fields)
+
+    def path(self, key: str) -> Path:
+        """Returns the path of the document with the given key."""
+        return self.root / f"{key}{self.suffix}"
+
+    def clear_cache(self) -> None:
+        """Forgets the documents that were saved and the nested dataclasses that were loaded."""
+        self._saved.clear()
+        self._subtrees.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._saved or self.path(key).exists()
+
+    def _save(self, document: dict[str, Any]) -> str:
+        """Saves the dict of a dataclass, after saving the dicts of the nested dataclasses."""
+        document = {
+            name: {REF_KEY: self._save(value)}
+            if isinstance(value, dict) and DC_TYPE_KEY in value
+            else value
+            for name, value in document.items()
+        }
+        key = compute_identity(
+            self.hash_size,
+            **{
+                name: json.dumps(value, sort_keys=True, default=repr)
+                for name, value in document.items()
+            },
+        )
+        if key not in self:
+            self._write(key, document)
+        self._saved.add(key)
+        return key
+
+    def _write(self, key: str, document: dict[str, Any]) -> None:
+        # Write to a temporary file first, so that a document is never partially written.
+        fd, temp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb" if self.format.binary else "w") as f:
+                self.format.dump(document, f)
+            os.replace(temp_path, self.path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _read(self, key: str) -> dict[str, Any]:
+        with open(self.path(key), "rb" if self.format.binary else "r") as f:
+            return self.format.load(f)
+
+    def _resolve(self, value: Any) -> Any:
+        """Replaces the references in `value` with the dicts of the nested dataclasses.
+
+        NOTE: New dicts and lists are always created, so the loaded dataclasses don't share any
+        mutable values with the cached documents.
+        """
+        if isinstance(value, dict):
+            if len(value) == 1 and REF_KEY in value:
+                return self._resolve(self._subtree(value[REF_KEY]))
+            return {k: self._resolve(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(v) for v in value]
+        return value
+
+    def _subtree(self, key: str) -> dict[str, Any]:
+        subtree = self._subtrees.get(key)
+        if subtree is None:
+            subtree = self._subtrees[key] = self._read(key)
+        return subtree
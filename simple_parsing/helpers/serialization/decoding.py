@@ -4,14 +4,15 @@ from __future__ import annotations
 import inspect
 import sys
 import warnings
+import weakref
 from collections import OrderedDict
 from collections.abc import Mapping
-from dataclasses import Field
+from dataclasses import MISSING, Field, fields
 from enum import Enum
 from functools import partial
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, NamedTuple, TypeVar, get_args, get_origin
 
 from simple_parsing.annotation_utils.get_field_annotations import (
     evaluate_string_annotation,
@@ -39,12 +40,104 @@ T = TypeVar("T")
 K = TypeVar("K")
 V = TypeVar("V")
 
+
+# The compiled decoders of the fields of each dataclass.
+# NOTE: The classes are weakly referenced, so that classes defined in local scopes (e.g. in tests)
+# can be garbage-collected.
+_field_decoders: weakref.WeakKeyDictionary[type, tuple[FieldDecoder, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# The decoding functions of each type annotation. (See `_decoding_fn_cache_key`.)
+# NOTE: This is cleared whenever the registered decoding functions change. The annotations with
+# classes that can be garbage-collected (e.g. defined in a function) aren't cached here, since the
+# decoding functions would keep these classes alive. Their field decoders are still cached in the
+# `_field_decoders` of the dataclasses that use them.
+_decoding_fn_cache: dict[Any, Callable[..., Any]] = {}
+_decoding_fn_cache_stats = {"hits": 0, "misses": 0, "uncacheable": 0}
+
+
+def _clear_compiled_decoders() -> None:
+    _field_decoders.clear()
+    _decoding_fn_cache.clear()
+
+
+class _DecodingFnsRegistry(dict):
+    """Dict of the registered decoding functions, which discards the compiled decoders when it
+    is modified (see `get_field_decoders`).
+
+    The registered classes are also indexed by their name and qualified name, to find the
+    decoding functions of string annotations (see `get_decoding_fn`).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._classes_by_name: dict[str, list[type]] | None = None
+
+    def classes_with_name(self, name: str) -> list[type]:
+        """Returns the registered classes whose `__name__` or `__qualname__` is `name`."""
+        if self._classes_by_name is None:
+            # NOTE: The index is created again on the first lookup after entries are removed.
+            self._classes_by_name = {}
+            for key in self:
+                self._add_to_index(key)
+        return self._classes_by_name.get(name, [])
+
+    def _add_to_index(self, key: Any) -> None:
+        if self._classes_by_name is None or not inspect.isclass(key):
+            return
+        self._classes_by_name.setdefault(key.__name__, []).append(key)
+        if key.__qualname__ != key.__name__:
+            self._classes_by_name.setdefault(key.__qualname__, []).append(key)
+
+    def _changed(self) -> None:
+        self._classes_by_name = None
+        _clear_compiled_decoders()
+
+    def __setitem__(self, key, value) -> None:
+        is_new_key = key not in self
+        super().__setitem__(key, value)
+        if is_new_key:
+            # NOTE: New entries are added to the index directly.
+            self._add_to_index(key)
+        _clear_compiled_decoders()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+
 # Dictionary mapping from types/type annotations to their decoding functions.
-_decoding_fns: dict[type[T], Callable[[Any], T]] = {
-    # the 'primitive' types are decoded using the type fn as a constructor.
-    t: t
-    for t in [str, bytes]
-}
+_decoding_fns: _DecodingFnsRegistry = _DecodingFnsRegistry(
+    {
+        # the 'primitive' types are decoded using the type fn as a constructor.
+        t: t
+        for t in [str, bytes]
+    }
+)
 
 
 def register_decoding_fn(
@@ -141,41 +234,262 @@ def decode_field(
 
     decoding_function = get_decoding_fn(field_type)
 
-    _kwargs = dict(category=UnsafeCastingWarning) if sys.version_info >= (3, 11) else {}
-
-    with warnings.catch_warnings(record=True, **_kwargs) as warning_messages:
+    with _catch_unsafe_casting_warnings() as warning_messages:
         if is_dataclass_type(field_type) and drop_extra_fields is not None:
             # Pass the drop_extra_fields argument to the decoding function.
             decoded_value = decoding_function(raw_value, drop_extra_fields=drop_extra_fields)
         else:
             decoded_value = decoding_function(raw_value)
 
-    for warning_message in warning_messages.copy():
-        if not isinstance(warning_message.message, UnsafeCastingWarning):
-            warnings.warn_explicit(
-                message=warning_message.message,
-                category=warning_message.category,
-                filename=warning_message.filename,
-                lineno=warning_message.lineno,
-                # module=warning_message.module,
-                # registry=warning_message.registry,
-                # module_globals=warning_message.module_globals,
-            )
-            warning_messages.remove(warning_message)
+    _report_warnings(name, field_type, raw_value, decoded_value, warning_messages)
+    return decoded_value
+
+
+def _catch_unsafe_casting_warnings() -> warnings.catch_warnings:
+    _kwargs = dict(category=UnsafeCastingWarning) if sys.version_info >= (3, 11) else {}
+    return warnings.catch_warnings(record=True, **_kwargs)
+
+
+def _report_warnings(
+    name: str,
+    field_type: Any,
+    raw_value: Any,
+    decoded_value: Any,
+    warning_messages: list[warnings.WarningMessage],
+    report_unsafe_casting: bool = True,
+) -> None:
+    """Re-emits the warnings caught while decoding a field.
 
-    if warning_messages:
+    The `UnsafeCastingWarning`s are replaced by a single `RuntimeWarning` that describes the field,
+    unless `report_unsafe_casting` is False, in which case they are also re-emitted as-is.
+    """
+    unsafe_casting = False
+    for warning_message in warning_messages:
+        if report_unsafe_casting and isinstance(warning_message.message, UnsafeCastingWarning):
+            unsafe_casting = True
+            continue
+        warnings.warn_explicit(
+            message=warning_message.message,
+            category=warning_message.category,
+            filename=warning_message.filename,
+            lineno=warning_message.lineno,
+            # module=warning_message.module,
+            # registry=warning_message.registry,
+            # module_globals=warning_message.module_globals,
+        )
+
+    if unsafe_casting:
         warnings.warn(
             RuntimeWarning(
                 f"Unsafe casting occurred when deserializing field '{name}' of type {field_type}: "
                 f"raw value: {raw_value!r}, decoded value: {decoded_value!r}."
             )
         )
-    return decoded_value
 
 
-# NOTE: Disabling the caching here might help avoid some bugs, and it's unclear if this has that
-# much of a performance impact.
-def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
+class FieldDecoder(NamedTuple):
+    """How to decode the value of a field of a dataclass, as returned by `get_field_decoders`."""
+
+    field: Field
+    """The field of the dataclass."""
+
+    field_type: Any
+    """The (evaluated) type annotation of the field."""
+
+    decoding_fn: Callable[..., Any]
+    """Function used to decode the raw value of the field."""
+
+    passes_drop_extra_fields: bool
+    """Whether the `drop_extra_fields` argument is passed to `decoding_fn`, when it is set."""
+
+    custom: bool
+    """Whether `decoding_fn` was set by the user in the metadata of the field.
+
+    The unsafe casting warnings of custom decoding functions are re-emitted as-is.
+    """
+
+    required: bool
+    """Whether a warning is logged when the field is missing from the dict."""
+
+    def decode(self, raw_value: Any, drop_extra_fields: bool | None = None) -> Any:
+        if self.passes_drop_extra_fields and drop_extra_fields is not None:
+            return self.decoding_fn(raw_value, drop_extra_fields=drop_extra_fields)
+        return self.decoding_fn(raw_value)
+
+
+def get_field_decoders(dataclass_type: type) -> tuple[FieldDecoder, ...]:
+    """Returns the decoders for the fields of the dataclass, creating them on the first call.
+
+    The type annotations of the fields are evaluated, and their decoding functions are fetched
+    only once for each dataclass type. The decoders are discarded when the registered decoding
+    functions change.
+    """
+    field_decoders = _field_decoders.get(dataclass_type)
+    if field_decoders is None:
+        field_decoders = tuple(
+            _make_field_decoder(field, dataclass_type) for field in fields(dataclass_type)
+        )
+        _field_decoders[dataclass_type] = field_decoders
+    return field_decoders
+
+
+def _make_field_decoder(field: Field, containing_dataclass: type) -> FieldDecoder:
+    required = (
+        field.metadata.get("to_dict", True)
+        and field.default is MISSING
+        and field.default_factory is MISSING
+    )
+    field_type = field.type
+    custom_decoding_fn = field.metadata.get("decoding_fn")
+    if custom_decoding_fn is not None:
+        return FieldDecoder(
+            field,
+            field_type,
+            decoding_fn=custom_decoding_fn,
+            passes_drop_extra_fields=False,
+            custom=True,
+            required=required,
+        )
+
+    if isinstance(field_type, str):
+        try:
+            field_type = evaluate_string_annotation(field_type, containing_dataclass)
+        except Exception:
+            # NOTE: The annotation might only become valid later (e.g. a forward reference to a
+            # class that isn't defined yet), so it gets evaluated each time the field is decoded.
+            return FieldDecoder(
+                field,
+                field_type,
+                decoding_fn=partial(
+                    decode_field, field, containing_dataclass=containing_dataclass
+                ),
+                passes_drop_extra_fields=True,
+                custom=False,
+                required=required,
+            )
+
+    return FieldDecoder(
+        field,
+        field_type,
+        decoding_fn=get_decoding_fn(field_type),
+        passes_drop_extra_fields=is_dataclass_type(field_type),
+        custom=False,
+        required=required,
+    )
+
+
+def decode_fields(
+    dataclass_type: type, obj_dict: dict[str, Any], drop_extra_fields: bool | None = None
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Decodes the values of the fields of the dataclass, popping them from `obj_dict`.
+
+    The warnings raised while decoding are caught once for all the fields, and reported the same
+    way as in `decode_field`.
+
+    Returns:
+        The decoded values of the `init=True` fields, and of the `init=False` fields.
+    """
+    init_args: dict[str, Any] = {}
+    non_init_args: dict[str, Any] = {}
+    keys = list(obj_dict.keys())
+    field_decoders = get_field_decoders(dataclass_type)
+    # The field decoder, raw value, decoded value and number of caught warnings before each field.
+    decoded: list[tuple[FieldDecoder, Any, Any, int]] = []
+    try:
+        with _catch_unsafe_casting_warnings() as warning_messages:
+            for field_decoder in field_decoders:
+                name = field_decoder.field.name
+                if name not in obj_dict:
+                    if field_decoder.required:
+                        logger.warning(
+                            f"Couldn't find the field '{name}' in the dict with keys {keys}"
+                        )
+                    continue
+                raw_value = obj_dict.pop(name)
+                num_warnings = len(warning_messages)
+                field_value = field_decoder.decode(raw_value, drop_extra_fields=drop_extra_fields)
+                decoded.append((field_decoder, raw_value, field_value, num_warnings))
+
+                if field_decoder.field.init:
+                    init_args[name] = field_value
+                else:
+                    non_init_args[name] = field_value
+    finally:
+        if warning_messages:
+            _report_decoded_fields_warnings(decoded, warning_messages)
+    return init_args, non_init_args
+
+
+def _report_decoded_fields_warnings(
+    decoded: list[tuple[FieldDecoder, Any, Any, int]],
+    warning_messages: list[warnings.WarningMessage],
+) -> None:
+    ends = [num_warnings for *_, num_warnings in decoded[1:]] + [len(warning_messages)]
+    for (field_decoder, raw_value, field_value, start), end in zip(decoded, ends):
+        if start != end:
+            _report_warnings(
+                field_decoder.field.name,
+                field_decoder.field_type,
+                raw_value,
+                field_value,
+                warning_messages[start:end],
+                report_unsafe_casting=not field_decoder.custom,
+            )
+
+
+class DecodingFnCacheInfo(NamedTuple):
+    """Statistics of the cache of `get_decoding_fn`."""
+
+    hits: int
+    misses: int
+    uncacheable: int
+    """Number of calls with an annotation that can't be used as a key (e.g. unhashable)."""
+    currsize: int
+
+
+def _decoding_fn_cache_key(type_annotation: Any, scope: str | None = None) -> Any:
+    """Returns the key of the annotation in the cache of `get_decoding_fn`.
+
+    NOTE: The annotation can't be used as the key directly, because some annotations compare equal
+    even though they don't have the same decoding function, e.g. `Union[int, float]` and
+    `Union[float, int]` (the types of a Union are tried in order). The values that aren't types
+    (e.g. of a `Literal`) are also keyed with their type, since `1`, `1.0` and `True` are equal.
+    The string annotations and forward references are keyed with the module where they are
+    evaluated (`scope`).
+    """
+    if isinstance(type_annotation, str):
+        return (str, type_annotation, scope)
+    if is_forward_ref(type_annotation):
+        return (type(type_annotation), get_forward_arg(type_annotation), scope)
+    args = get_args(type_annotation)
+    if not args:
+        if isinstance(type_annotation, type):
+            return type_annotation
+        return (type(type_annotation), type_annotation)
+    return (
+        get_origin(type_annotation),
+        tuple(_decoding_fn_cache_key(arg, scope) for arg in args),
+    )
+
+
+def _can_be_garbage_collected(key: Any) -> bool:
+    """Returns whether a class of the cache key isn't an attribute of its module.
+
+    These classes (e.g. defined in a function, or created dynamically) can be garbage-collected.
+    """
+    if isinstance(key, tuple):
+        return any(_can_be_garbage_collected(item) for item in key)
+    if not isinstance(key, type):
+        return False
+    value: Any = sys.modules.get(key.__module__)
+    for name in key.__qualname__.split("."):
+        value = getattr(value, name, None)
+    return value is not key
+
+
+def get_decoding_fn(
+    type_annotation: type[T] | str, containing_class: type | None = None
+) -> Callable[..., T]:
     """Fetches/Creates a decoding function for the given type annotation.
 
     This decoding function can then be used to create an instance of the type
@@ -183,8 +497,8 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
 
     This function inspects the type annotation and creates the right decoding
     function recursively in a "dynamic-programming-ish" fashion.
-    NOTE: We cache the results in a `functools.lru_cache` decorator to avoid
-    wasteful calls to the function. This makes this process pretty efficient.
+    NOTE: The results are cached, and the cache is cleared when a decoding function is registered.
+    The statistics of the cache are returned by `get_decoding_fn.cache_info()`.
 
     Args:
         t (Type[T]):
@@ -196,11 +510,48 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
             - Dict[Tuple[int, int], List[str]]
             - List[List[List[List[Tuple[int, str]]]]]
             - etc.
+        containing_class (Type, optional): The class where the annotation is used. String
+            annotations and forward references are evaluated in the module of this class.
 
     Returns:
         Callable[[Any], T]:
             A function that decodes a 'raw' value to an instance of type `t`.
     """
+    scope = containing_class.__module__ if containing_class is not None else None
+    try:
+        key = _decoding_fn_cache_key(type_annotation, scope)
+        decoding_fn = _decoding_fn_cache.get(key)
+    except TypeError:
+        # The annotation (or one of its arguments) is unhashable.
+        _decoding_fn_cache_stats["uncacheable"] += 1
+        return _get_decoding_fn(type_annotation, containing_class)
+
+    if decoding_fn is not None:
+        _decoding_fn_cache_stats["hits"] += 1
+        return decoding_fn
+    _decoding_fn_cache_stats["misses"] += 1
+    decoding_fn = _get_decoding_fn(type_annotation, containing_class)
+    if not _can_be_garbage_collected(key):
+        _decoding_fn_cache[key] = decoding_fn
+    return decoding_fn
+
+
+def _decoding_fn_cache_info() -> DecodingFnCacheInfo:
+    return DecodingFnCacheInfo(**_decoding_fn_cache_stats, currsize=len(_decoding_fn_cache))
+
+
+def _decoding_fn_cache_clear() -> None:
+    _decoding_fn_cache.clear()
+    _decoding_fn_cache_stats.update(hits=0, misses=0, uncacheable=0)
+
+
+get_decoding_fn.cache_info = _decoding_fn_cache_info  # type: ignore[attr-defined]
+get_decoding_fn.cache_clear = _decoding_fn_cache_clear  # type: ignore[attr-defined]
+
+
+def _get_decoding_fn(
+    type_annotation: type[T] | str, containing_class: type | None = None
+) -> Callable[..., T]:
     from .serializable import from_dict
 
     logger.debug(f"Getting the decoding function for {type_annotation!r}")
@@ -209,9 +560,7 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
         # Check first if there are any matching registered decoding functions.
         # TODO: Might be better to actually use the scope of the field, right?
         matching_entries = {
-            key: decoding_fn
-            for key, decoding_fn in _decoding_fns.items()
-            if (inspect.isclass(key) and key.__name__ == type_annotation)
+            key: _decoding_fns[key] for key in _decoding_fns.classes_with_name(type_annotation)
         }
         if len(matching_entries) == 1:
             _, decoding_fn = matching_entries.popitem()
@@ -228,12 +577,12 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
             return try_functions(*(decoding_fn for _, decoding_fn in matching_entries.items()))
         else:
             # Try to evaluate the string annotation.
-            t = evaluate_string_annotation(type_annotation)
+            t = evaluate_string_annotation(type_annotation, containing_class)
 
     elif is_forward_ref(type_annotation):
         forward_arg: str = get_forward_arg(type_annotation)
         # Recurse until we've resolved the forward reference.
-        return get_decoding_fn(forward_arg)
+        return get_decoding_fn(forward_arg, containing_class)
 
     else:
         t = type_annotation
@@ -242,9 +591,14 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
 
     # T should now be a type or one of the objects from the typing module.
 
-    if t in _decoding_fns:
+    try:
+        registered_decoding_fn = _decoding_fns.get(t)
+    except TypeError:
+        # The annotation is unhashable, so it can't have a dedicated decoding function.
+        registered_decoding_fn = None
+    if registered_decoding_fn is not None:
         # The type has a dedicated decoding function.
-        return _decoding_fns[t]
+        return registered_decoding_fn
 
     if is_dataclass_type(t):
         return partial(from_dict, t)
@@ -302,6 +656,10 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
         possible_vals = get_type_arguments(t)
         return decode_literal(*possible_vals)
 
+    if _is_ndarray_type(t):
+        logger.debug(f"Decoding a numpy array field: {t}")
+        return decode_ndarray
+
     # Unknown type.
     warnings.warn(
         UserWarning(
@@ -487,6 +845,27 @@ def decode_literal(*possible_vals: Any) -> Callable[[Any], Any]:
     return _decode_literal
 
 
+def _is_ndarray_type(t: Any) -> bool:
+    # NOTE: This checks the name of the type to avoid importing numpy.
+    return (
+        getattr(t, "__module__", None) == "numpy" and getattr(t, "__qualname__", None) == "ndarray"
+    )
+
+
+def decode_ndarray(val: Any) -> Any:
+    """Decoding function for numpy arrays, which keeps the arrays (e.g. memory-mapped) as-is.
+
+    Args:
+        val (Any): A numpy array, or a (nested) list of values.
+
+    Returns:
+        np.ndarray: The array.
+    """
+    import numpy as np
+
+    return val if isinstance(val, np.ndarray) else np.asarray(val)
+
+
 def no_op(v: T) -> T:
     """Decoding function that gives back the value as-is.
 
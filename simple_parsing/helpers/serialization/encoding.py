@@ -8,19 +8,39 @@ import numpy as np
 def encode_ndarray(obj: np.ndarray) -> str:
     return obj.tostring()
 """
+import contextvars
 import copy
 import json
 from argparse import Namespace
-from collections.abc import Hashable, Mapping
+from collections.abc import Hashable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import fields, is_dataclass
 from enum import Enum
 from functools import singledispatch
 from logging import getLogger
 from os import PathLike
-from typing import Any, Union
+from typing import Any, Callable, Literal, Union
 
 logger = getLogger(__name__)
 
+CopyMode = Literal["deep", "shallow", "none"]
+"""How `encode` copies the values that it doesn't know how to convert.
+
+- "deep" (default): The values are deep-copied, so the result doesn't share any (mutable) objects
+  with the encoded object.
+- "shallow": The values are shallow-copied. This is cheaper, and is enough when the result is
+  serialized right away (e.g. when saving to a file).
+- "none": The values are used as-is, so the result might share objects with the encoded object.
+
+In all cases, the values of immutable types (see `IMMUTABLE_TYPES`) are used as-is.
+"""
+
+# Types whose instances can't be modified, so that they never need to be copied when encoding.
+# NOTE: `tuple` and `frozenset` aren't included, since they might contain mutable objects.
+IMMUTABLE_TYPES: tuple[type, ...] = (str, bytes, int, float, complex, bool, type(None), range)
+
+_copy_mode: contextvars.ContextVar[CopyMode] = contextvars.ContextVar("copy_mode", default="deep")
+
 
 class SimpleJsonEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
@@ -75,6 +95,8 @@ def encode(obj: Any) -> Any:
     (see the docs for singledispatch).
     """
     try:
+        if type(obj) in IMMUTABLE_TYPES:
+            return obj
         if is_dataclass(obj):
             # logger.debug(f"encoding object {obj} of class {type(obj)}")
             d: dict[str, Any] = dict()
@@ -86,14 +108,54 @@ def encode(obj: Any) -> Any:
                     logger.error(f"Unable to encode field {field.name}: {e}")
                     raise e
             return d
-        else:
-            # logger.debug(f"Deepcopying object {obj} of type {type(obj)}")
-            return copy.deepcopy(obj)
+        mode = _copy_mode.get()
+        if mode == "none":
+            return obj
+        if mode == "shallow":
+            return copy.copy(obj)
+        # logger.debug(f"Deepcopying object {obj} of type {type(obj)}")
+        return copy.deepcopy(obj)
     except Exception as e:
         logger.debug(f"Cannot encode object {obj}: {e}")
         raise e
 
 
+# The number of times an encoding function was registered with `encode`. This is used to discard
+# what was computed from the registry (e.g. the compiled `to_dict` encoders) when it changes.
+# NOTE: `len(encode.registry)` isn't enough, since registering a function for a type that already
+# has one replaces it.
+_registry_version: int = 0
+
+_singledispatch_register = encode.register
+
+
+def _register(cls: Any, func: Callable | None = None) -> Any:
+    """Same as the `register` of `singledispatch`, but also counts the registrations."""
+    global _registry_version
+    registered = _singledispatch_register(cls, func)
+    if func is None and registered is not cls:
+        # `cls` is a type, and `registered` is a decorator that registers the function.
+        decorator = registered
+
+        def register_function(function: Callable) -> Callable:
+            global _registry_version
+            function = decorator(function)
+            _registry_version += 1
+            return function
+
+        return register_function
+    _registry_version += 1
+    return registered
+
+
+encode.register = _register  # type: ignore
+
+
+def _get_registry_version() -> int:
+    """Returns a number that changes each time an encoding function is registered."""
+    return _registry_version
+
+
 @encode.register(list)
 @encode.register(tuple)
 # @encode.register(Sequence) # Would also encompass `str!`
@@ -104,16 +166,18 @@ def encode_list(obj: Union[list[Any], set[Any], tuple[Any, ...]]) -> list[Any]:
     # TODO: Also, with this, we also need to convert back to the right type when
     # deserializing, which is totally doable for the fields of dataclasses,
     # but maybe not for other stuff.
-    return list(map(encode, obj))
+    passthrough_types = get_passthrough_types()
+    return [item if type(item) in passthrough_types else encode(item) for item in obj]
 
 
 @encode.register(Mapping)
 def encode_dict(obj: Mapping) -> dict[Any, Any]:
     constructor = type(obj)
     result = constructor()
+    passthrough_types = get_passthrough_types()
     for k, v in obj.items():
-        k_ = encode(k)
-        v_ = encode(v)
+        k_ = k if type(k) in passthrough_types else encode(k)
+        v_ = v if type(v) in passthrough_types else encode(v)
         if isinstance(k_, Hashable):
             result[k_] = v_
         else:
@@ -139,3 +203,36 @@ def encode_namespace(obj: Namespace) -> Any:
 @encode.register(Enum)
 def encode_enum(obj: Enum) -> str:
     return obj.name
+
+
+@contextmanager
+def copy_mode(mode: CopyMode) -> Iterator[None]:
+    """Sets how `encode` copies the values that it doesn't know how to convert (see `CopyMode`)."""
+    if mode not in ("deep", "shallow", "none"):
+        raise ValueError(f"Unknown copy mode {mode!r}, expected 'deep', 'shallow' or 'none'.")
+    token = _copy_mode.set(mode)
+    try:
+        yield
+    finally:
+        _copy_mode.reset(token)
+
+
+# The immutable types that `encode` returns unchanged, and the version of the registry of `encode`
+# when they were computed.
+_passthrough_types: frozenset[type] = frozenset()
+_passthrough_types_registry_version: int = -1
+
+
+def get_passthrough_types() -> frozenset[type]:
+    """Returns the types whose values `encode` gives back unchanged, without making a copy.
+
+    These are the `IMMUTABLE_TYPES` for which no other encoding function was registered.
+    """
+    global _passthrough_types, _passthrough_types_registry_version
+    if _registry_version != _passthrough_types_registry_version:
+        default_encoder = encode.dispatch(object)
+        _passthrough_types = frozenset(
+            t for t in IMMUTABLE_TYPES if encode.dispatch(t) is default_encoder
+        )
+        _passthrough_types_registry_version = _registry_version
+    return _passthrough_types
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+import copy
+import importlib.util
 import json
 import pickle
+import re
+import sys
+import threading
 import warnings
+import weakref
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, as_completed
 from dataclasses import MISSING, Field, dataclass, fields, is_dataclass
-from functools import partial
+from functools import cache, partial, update_wrapper
 from importlib import import_module
 from itertools import chain
 from logging import getLogger
 from pathlib import Path
 from types import ModuleType
-from typing import IO, Any, Callable, ClassVar, TypeVar, Union
+from typing import IO, TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple, TypeVar, Union
 
-from typing_extensions import Protocol
+from typing_extensions import Protocol, Self
 
+from simple_parsing.parse_stats import tracked
 from simple_parsing.utils import (
     DataclassT,
     all_subclasses,
@@ -23,8 +32,16 @@ from simple_parsing.utils import (
     is_optional,
 )
 
-from .decoding import decode_field, register_decoding_fn
-from .encoding import SimpleJsonEncoder, encode
+from .decoding import decode_fields, register_decoding_fn
+from .encoding import (
+    IMMUTABLE_TYPES,
+    CopyMode,
+    SimpleJsonEncoder,
+    _get_registry_version,
+    encode,
+    get_passthrough_types,
+)
+from .encoding import copy_mode as _copy_mode
 
 DumpFn = Callable[[Any, IO], None]
 DumpsFn = Callable[[Any], str]
@@ -35,28 +52,40 @@ logger = getLogger(__name__)
 
 D = TypeVar("D", bound="SerializableMixin")
 
-try:
+if TYPE_CHECKING:
     import yaml
 
-    def ordered_dict_constructor(loader: yaml.Loader, node: yaml.Node):
-        # NOTE(ycho): `deep` has to be true for `construct_yaml_seq`.
-        value = loader.construct_sequence(node, deep=True)
-        return OrderedDict(*value)
 
-    def ordered_dict_representer(dumper: yaml.Dumper, instance: OrderedDict) -> yaml.Node:
-        # NOTE(ycho): nested list for compatibility with PyYAML's representer
-        node = dumper.represent_sequence("OrderedDict", [list(instance.items())])
-        return node
+def ordered_dict_constructor(loader: yaml.Loader, node: yaml.Node):
+    # NOTE(ycho): `deep` has to be true for `construct_yaml_seq`.
+    value = loader.construct_sequence(node, deep=True)
+    return OrderedDict(*value)
+
+
+def ordered_dict_representer(dumper: yaml.Dumper, instance: OrderedDict) -> yaml.Node:
+    # NOTE(ycho): nested list for compatibility with PyYAML's representer
+    node = dumper.represent_sequence("OrderedDict", [list(instance.items())])
+    return node
+
+
+@cache
+def _import_yaml() -> ModuleType:
+    """Imports `yaml` and registers the OrderedDict representer and constructors.
+
+    This is only done when yaml is first used, so that importing simple_parsing doesn't import
+    yaml.
+    """
+    import yaml
 
     yaml.add_representer(OrderedDict, ordered_dict_representer)
+    if yaml.__with_libyaml__:
+        yaml.add_representer(OrderedDict, ordered_dict_representer, Dumper=yaml.CDumper)
     yaml.add_constructor("OrderedDict", ordered_dict_constructor)
     yaml.add_constructor(
         "tag:yaml.org,2002:python/object/apply:collections.OrderedDict",
         ordered_dict_constructor,
     )
-
-except ImportError:
-    pass
+    return yaml
 
 
 class FormatExtension(Protocol):
@@ -71,9 +100,110 @@ class FormatExtension(Protocol):
         ...
 
 
-class JSONExtension(FormatExtension):
-    load = staticmethod(json.load)
-    dump = staticmethod(json.dump)
+@cache
+def _is_installed(module_name: str) -> bool:
+    return importlib.util.find_spec(module_name) is not None
+
+
+class _default_instance_method:
+    """Method that is called on the default instance of the class when called on the class.
+
+    This keeps `JSONExtension.load(f)` working like the static methods of the other formats, while
+    using the backend of the instance (`json_extension`).
+    """
+
+    def __init__(self, method: Callable):
+        self.method = method
+        update_wrapper(self, method)  # type: ignore[arg-type]
+
+    def __get__(self, instance: Any, owner: type[_BackendSelection]) -> Callable:
+        if instance is None:
+            instance = owner._get_default()
+        return self.method.__get__(instance, owner)
+
+
+class _BackendSelection:
+    """Selects the library used by a `FormatExtension` to load and dump files.
+
+    The first available backend of `backends` (the fastest) is used, unless `backend` is set.
+    """
+
+    backends: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, backend: str | None = None):
+        self.backend = backend
+
+    @classmethod
+    def _get_default(cls) -> Self:
+        """Returns the instance that is used when the methods are called on the class."""
+        default = cls.__dict__.get("_default")
+        if default is None:
+            default = cls()
+            setattr(cls, "_default", default)
+        return default
+
+    @property
+    def backend(self) -> str | None:
+        """The backend to use, or None to use the fastest available backend."""
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: str | None) -> None:
+        if backend is not None and backend not in self.backends:
+            raise ValueError(
+                f"Unknown backend {backend!r} for {type(self).__name__}, expected one of "
+                f"{self.backends}."
+            )
+        self._backend = backend
+
+    def available_backends(self) -> list[str]:
+        return [backend for backend in self.backends if self._is_available(backend)]
+
+    def get_backend(self) -> str:
+        """Returns the backend that is used, i.e. `backend` if set, else the fastest available."""
+        if self._backend is not None:
+            return self._backend
+        return self.available_backends()[0]
+
+    def _is_available(self, backend: str) -> bool:
+        raise NotImplementedError
+
+
+class JSONExtension(_BackendSelection, FormatExtension):
+    """JSON files, loaded with `orjson` when it is installed, and `json` otherwise.
+
+    NOTE: Files are only written with `orjson` when the "orjson" backend is selected explicitly,
+    since its output is different from that of `json` (e.g. NaN is written as null).
+    """
+
+    backends: ClassVar[tuple[str, ...]] = ("orjson", "json")
+
+    def _is_available(self, backend: str) -> bool:
+        return backend == "json" or _is_installed(backend)
+
+    @_default_instance_method
+    def load(self, io: IO) -> Any:
+        if self.get_backend() == "orjson":
+            import orjson  # type: ignore
+
+            text = io.read()
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                if self._backend == "orjson":
+                    raise
+                # NOTE: `json` accepts some things that `orjson` doesn't, e.g. NaN and Infinity.
+                return json.loads(text)
+        return json.load(io)
+
+    @_default_instance_method
+    def dump(self, obj: Any, io: IO, **kwargs) -> None:
+        if self._backend == "orjson":
+            import orjson  # type: ignore
+
+            io.write(orjson.dumps(obj, **kwargs).decode())
+            return
+        return json.dump(obj, io, **kwargs)
 
 
 class PickleExtension(FormatExtension):
@@ -82,17 +212,36 @@ class PickleExtension(FormatExtension):
     dump: ClassVar[Callable[[Any, IO[bytes]], None]] = staticmethod(pickle.dump)
 
 
-class YamlExtension(FormatExtension):
-    def load(self, io: IO) -> Any:
-        import yaml
+class YamlExtension(_BackendSelection, FormatExtension):
+    """YAML files, loaded and dumped with the libyaml bindings of PyYAML when it was built with
+    them, and with the pure-python implementation of PyYAML otherwise.
 
-        return yaml.safe_load(io)
+    The libyaml backend uses the `CSafeLoader` and `CDumper` classes, which behave like the
+    `SafeLoader` and `Dumper` classes used by `yaml.safe_load` and `yaml.dump`.
+    """
 
-    def dump(self, obj: Any, io: IO, **kwargs) -> None:
-        import yaml
+    backends: ClassVar[tuple[str, ...]] = ("libyaml", "python")
 
+    def _is_available(self, backend: str) -> bool:
+        return backend == "python" or _import_yaml().__with_libyaml__
+
+    @_default_instance_method
+    def load(self, io: IO | str) -> Any:
+        yaml = _import_yaml()
+        loader = yaml.CSafeLoader if self.get_backend() == "libyaml" else yaml.SafeLoader
+        return yaml.load(io, Loader=loader)
+
+    @_default_instance_method
+    def dump(self, obj: Any, io: IO | None, **kwargs) -> Any:
+        yaml = _import_yaml()
+        dumper = yaml.CDumper if self.get_backend() == "libyaml" else yaml.Dumper
+        kwargs.setdefault("Dumper", dumper)
         return yaml.dump(obj, io, **kwargs)
 
+    @_default_instance_method
+    def dumps(self, obj: Any, **kwargs) -> str:
+        return self.dump(obj, None, **kwargs)
+
 
 class NumpyExtension(FormatExtension):
     binary: bool = True
@@ -142,15 +291,15 @@ class TOMLExtension(FormatExtension):
         return tomli_w.dump(obj, io, **kwargs)
 
 
-json_extension = JSONExtension()
-yaml_extension = YamlExtension()
+json_extension = JSONExtension._get_default()
+yaml_extension = YamlExtension._get_default()
 
 
 extensions: dict[str, FormatExtension] = {
-    ".json": JSONExtension(),
+    ".json": json_extension,
     ".pkl": PickleExtension(),
-    ".yaml": YamlExtension(),
-    ".yml": YamlExtension(),
+    ".yaml": yaml_extension,
+    ".yml": yaml_extension,
     ".npy": NumpyExtension(),
     ".pth": TorchExtension(),
     ".toml": TOMLExtension(),
@@ -168,6 +317,44 @@ def get_extension(path: str | Path) -> FormatExtension:
         )
 
 
+# The dataclass types that can be used in the `DC_TYPE_KEY` entries of the dicts, by their path.
+# NOTE: Only the types registered with `register_dc_type` and the subclasses of `SerializableMixin`
+# are here. Saving a type doesn't register it, since the registered types can be loaded from
+# untrusted files (see `only_use_registered_dc_types`).
+_registered_dc_types: dict[str, type] = {}
+# The types located (and imported, if needed) from the `DC_TYPE_KEY` entries of the dicts.
+_located_dc_types: dict[str, Any] = {}
+_only_registered_dc_types: bool = False
+
+
+def register_dc_type(dc_type: type, path: str | None = None) -> None:
+    """Registers a dataclass type that can be created from the `DC_TYPE_KEY` entry of a dict.
+
+    `path` defaults to the `<module>.<qualname>` of the type, which is what `to_dict` saves.
+    """
+    _registered_dc_types[path or _get_dc_type_path(dc_type)] = dc_type
+
+
+def only_use_registered_dc_types(only_registered: bool = True) -> None:
+    """Sets whether only registered types can be created from the `DC_TYPE_KEY` entries of dicts.
+
+    When True, `from_dict` raises an error when the type isn't registered (with `register_dc_type`
+    or by subclassing `Serializable`), instead of importing it. This should be used when loading
+    files that might come from untrusted sources, since they could otherwise import any module.
+    """
+    global _only_registered_dc_types
+    _only_registered_dc_types = only_registered
+
+
+def _get_dc_type_path(dc_type: type) -> str:
+    return dc_type.__module__ + "." + dc_type.__qualname__
+
+
+# The index of the subclasses of each `SerializableMixin` subclass.
+# NOTE: This is cleared whenever a new subclass of `SerializableMixin` is created.
+_subclass_indices: dict[type, SubclassIndex] = {}
+
+
 class SerializableMixin:
     """Makes a dataclass serializable to and from dictionaries.
 
@@ -217,12 +404,20 @@ class SerializableMixin:
         cls.decode_into_subclasses = decode_into_subclasses or False
         if cls not in SerializableMixin.subclasses:
             SerializableMixin.subclasses.append(cls)
+        _subclass_indices.clear()
+        if "<locals>" not in cls.__qualname__:
+            register_dc_type(cls)
 
         encode.register(cls, cls.to_dict)
         register_decoding_fn(cls, cls.from_dict)
 
     def to_dict(
-        self, dict_factory: type[dict] = dict, recurse: bool = True, save_dc_types: bool = False
+        self,
+        dict_factory: type[dict] = dict,
+        recurse: bool = True,
+        save_dc_types: bool = False,
+        copy_mode: CopyMode | None = None,
+        only_non_default: bool = False,
     ) -> dict:
         """Serializes this dataclass to a dict.
 
@@ -232,7 +427,12 @@ class SerializableMixin:
         detaching `Tensor` objects before serializing the dataclass to a dict).
         """
         return to_dict(
-            self, dict_factory=dict_factory, recurse=recurse, save_dc_types=save_dc_types
+            self,
+            dict_factory=dict_factory,
+            recurse=recurse,
+            save_dc_types=save_dc_types,
+            copy_mode=copy_mode,
+            only_non_default=only_non_default,
         )
 
     @classmethod
@@ -253,8 +453,10 @@ class SerializableMixin:
         """
         return from_dict(cls, obj, drop_extra_fields=drop_extra_fields)
 
-    def dump(self, fp: IO[str], dump_fn: DumpFn = json.dump) -> None:
-        dump(self, fp=fp, dump_fn=dump_fn)
+    def dump(
+        self, fp: IO[str], dump_fn: DumpFn = json.dump, copy_mode: CopyMode | None = None
+    ) -> None:
+        dump(self, fp=fp, dump_fn=dump_fn, copy_mode=copy_mode)
 
     def dump_json(self, fp: IO[str], dump_fn: DumpFn = json.dump, **kwargs) -> None:
         return dump_json(self, fp, dump_fn=dump_fn, **kwargs)
@@ -352,15 +554,29 @@ class SerializableMixin:
             cls (Type[D]): A dataclass type to load.
             path (Union[str, Path]): Path to a yaml-formatted file.
             load_fn ([type], optional): Loading function to use. Defaults to
-                None, in which case `yaml.safe_load` is used.
+                None, in which case `yaml_extension.load` is used.
 
         Returns:
             D: an instance of the dataclass.
         """
         return load_yaml(cls, path, load_fn=load_fn, drop_extra_fields=drop_extra_fields, **kwargs)
 
-    def save(self, path: str | Path, format: FormatExtension | None = None) -> None:
-        save(self, path=path, format=format)
+    def save(
+        self,
+        path: str | Path,
+        format: FormatExtension | None = None,
+        copy_mode: CopyMode | None = None,
+        array_sidecars: bool = False,
+        only_non_default: bool = False,
+    ) -> None:
+        save(
+            self,
+            path=path,
+            format=format,
+            copy_mode=copy_mode,
+            array_sidecars=array_sidecars,
+            only_non_default=only_non_default,
+        )
 
     def _save(self, path: str | Path, format: FormatExtension = json_extension, **kwargs) -> None:
         save(self, path=path, format=format, **kwargs)
@@ -482,6 +698,8 @@ def load(
     path: Path | str | IO,
     drop_extra_fields: bool | None = None,
     load_fn: LoadFn | None = None,
+    array_sidecars: bool = False,
+    only_non_default: bool = False,
 ) -> DataclassT:
     """Loads an instance of `cls` from the given file.
 
@@ -517,6 +735,12 @@ def load(
                 ".pth": torch.load,
                 ".pkl": pickle.load,
             }
+        array_sidecars (bool, optional): Whether the numpy arrays were saved in separate files
+            with `save(..., array_sidecars=True)`. When True, these arrays are memory-mapped, so
+            they are only read from disk when they are used. Defaults to False.
+        only_non_default (bool, optional): Whether the file was saved with
+            `save(..., only_non_default=True)`. When True, the values in the file are merged onto
+            the default values of the fields of the saved type (or of `cls`). Defaults to False.
 
     Raises:
         RuntimeError: If the extension of `path` is unsupported.
@@ -537,6 +761,15 @@ def load(
             "A loading function must be passed, since we got an io stream, and the "
             "extension can't be retrieved."
         )
+    if array_sidecars:
+        name = path if isinstance(path, Path) else getattr(path, "name", None)
+        if not isinstance(name, (str, Path)):
+            raise ValueError("Can't load the arrays of a stream that doesn't have a file name.")
+        d = _read_array_sidecars(d, Path(name).parent)
+    if only_non_default:
+        # Use the defaults of the saved type, which can be a subclass of `cls`.
+        dc_type = _get_dc_type(d[DC_TYPE_KEY]) if DC_TYPE_KEY in d else cls
+        d = _merge_default_values(d, _get_defaults(dc_type))
     # Convert the dict into an instance of the class.
     if drop_extra_fields is None and getattr(cls, "decode_into_subclasses", None) is not None:
         drop_extra_fields = not getattr(cls, "decode_into_subclasses")
@@ -590,13 +823,12 @@ def loads_yaml(
     load_fn: LoadsFn | None = None,
     **kwargs,
 ) -> DataclassT:
-    import yaml
-
-    load_fn = load_fn or yaml.safe_load
+    load_fn = load_fn or yaml_extension.load
     return loads(cls, s, drop_extra_fields=drop_extra_fields, load_fn=partial(load_fn, **kwargs))
 
 
-def read_file(path: str | Path) -> dict:
+@tracked("read_file")
+def read_file(path: str | Path, cache: bool = False) -> dict:
     """Returns the contents of the given file as a dictionary.
 
     Uses the right function depending on `path.suffix`:
@@ -607,28 +839,201 @@ def read_file(path: str | Path) -> dict:
         ".pth": torch.load,
         ".pkl": pickle.load,
     }
+
+    When `cache` is True, the contents of text and toml files (yaml, json, toml) are kept in
+    `file_cache`, so that the file is only read again once it is modified. A copy of the contents
+    is returned, so the cache can't be modified by the caller.
     """
     format = get_extension(path)
+    # NOTE: Toml files are read in binary mode, but only contain the same values as json files.
+    if cache and (not format.binary or isinstance(format, TOMLExtension)):
+        return file_cache.get(path, format)
     with open(path, mode="rb" if format.binary else "r") as f:
         return format.load(f)
 
 
+class FileCacheInfo(NamedTuple):
+    """Statistics of a `FileCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FileCache:
+    """A bounded (least-recently-used) cache of the contents of files.
+
+    The entries are keyed by the resolved path of the file, and are only used while the
+    modification time and size of the file stay the same.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Path, tuple[int, int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, path: str | Path, format: FormatExtension) -> Any:
+        """Returns a copy of the contents of the file, reading it with `format` if needed."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(path)
+                self._hits += 1
+                return _copy_file_contents(entry[2])
+            self._misses += 1
+
+        with open(path, mode="rb" if format.binary else "r") as f:
+            contents = format.load(f)
+        with self._lock:
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, contents)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return _copy_file_contents(contents)
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Removes the given file from the cache, or all the files if `path` is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path).resolve(), None)
+
+    def cache_info(self) -> FileCacheInfo:
+        with self._lock:
+            return FileCacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+
+# The cache used by `read_file(..., cache=True)`, e.g. for the config files of the `ArgumentParser`.
+file_cache = FileCache()
+
+
+def _copy_file_contents(value: Any) -> Any:
+    # NOTE: This is much faster than `copy.deepcopy` for the dicts and lists of json/yaml files.
+    if type(value) in (dict, OrderedDict):
+        return type(value)((k, _copy_file_contents(v)) for k, v in value.items())
+    if type(value) is list:
+        return [_copy_file_contents(v) for v in value]
+    if type(value) in IMMUTABLE_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
 def save(
     obj: Any,
     path: str | Path,
     format: FormatExtension | None = None,
     save_dc_types: bool = False,
+    copy_mode: CopyMode | None = None,
+    array_sidecars: bool = False,
+    only_non_default: bool = False,
     **kwargs,
 ) -> None:
-    """Save the given dataclass or dictionary to the given file."""
+    """Save the given dataclass or dictionary to the given file.
+
+    Since the dict is written to the file right away, passing `copy_mode="shallow"` avoids making
+    deep copies of the values that `encode` doesn't know how to convert.
+
+    When `array_sidecars` is True, the numpy arrays are saved in binary `.npy` files next to `path`
+    instead of in the file itself. The file only contains the name of the `.npy` file of each
+    array. Use `load(..., array_sidecars=True)` to load them back.
+
+    When `only_non_default` is True, only the values that are different from the defaults are
+    saved (see `to_dict`). Use `load(..., only_non_default=True)` to load the file.
+    """
+    if array_sidecars and copy_mode is None:
+        # The arrays are written to disk right away: don't copy them.
+        copy_mode = "none"
     if not isinstance(obj, dict):
-        obj = to_dict(obj, save_dc_types=save_dc_types)
+        obj = to_dict(
+            obj,
+            save_dc_types=save_dc_types,
+            copy_mode=copy_mode,
+            only_non_default=only_non_default,
+        )
+    if array_sidecars:
+        obj = _write_array_sidecars(obj, Path(path), names=set())
     if format is None:
         format = get_extension(path)
     with open(path, mode="wb" if format.binary else "w") as f:
         return format.dump(obj, f, **kwargs)
 
 
+# The key of the dicts that replace the numpy arrays saved with `save(..., array_sidecars=True)`.
+NDARRAY_KEY = "_ndarray_"
+
+
+def _write_array_sidecars(obj: Any, path: Path, names: set[str], key: str = "") -> Any:
+    """Saves the numpy arrays in `obj` to `.npy` files next to `path`, and replaces them with a
+    `{NDARRAY_KEY: <file name>}` dict.
+
+    The file of each array is named after `path` and the keys leading to the array, e.g.
+    `config.json.layers.0.weights.npy`.
+    """
+    if isinstance(obj, dict):
+        if _is_array_reference(obj):
+            raise ValueError(
+                f"Can't save {obj} with `array_sidecars=True`: it would be loaded as an array."
+            )
+        return {
+            k: _write_array_sidecars(v, path, names, key=f"{key}.{k}" if key else str(k))
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [
+            _write_array_sidecars(v, path, names, key=f"{key}.{i}" if key else str(i))
+            for i, v in enumerate(obj)
+        ]
+    # NOTE: If numpy wasn't imported, then there can't be any arrays.
+    np = sys.modules.get("numpy")
+    if np is None or not isinstance(obj, np.ndarray):
+        return obj
+    # NOTE: The suffix is kept, so that `config.json` and `config.yaml` don't share their arrays.
+    name = path.name + "." + re.sub(r"[^\w.-]", "_", key)
+    # NOTE: The file names with ".." are refused when loading.
+    name = re.sub(r"\.\.+", ".", name)
+    while name in names:
+        name += "_"
+    names.add(name)
+    file_name = f"{name}.npy"
+    np.save(path.with_name(file_name), obj, allow_pickle=False)
+    return {NDARRAY_KEY: file_name}
+
+
+def _is_array_reference(obj: dict) -> bool:
+    return len(obj) == 1 and NDARRAY_KEY in obj
+
+
+def _read_array_sidecars(obj: Any, directory: Path) -> Any:
+    """Replaces the `{NDARRAY_KEY: <file name>}` dicts in `obj` with memory-mapped numpy arrays.
+
+    NOTE: `save(..., array_sidecars=True)` refuses to save other dicts that look like these.
+    """
+    if isinstance(obj, dict):
+        if _is_array_reference(obj):
+            import numpy as np
+
+            file_name = obj[NDARRAY_KEY]
+            if (
+                not isinstance(file_name, str)
+                or not file_name.endswith(".npy")
+                or "/" in file_name
+                or "\\" in file_name
+                or ".." in file_name
+            ):
+                raise ValueError(f"Invalid file name for a numpy array: {file_name!r}")
+            return np.load(directory / file_name, mmap_mode="r", allow_pickle=False)
+        return {k: _read_array_sidecars(v, directory) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_read_array_sidecars(v, directory) for v in obj]
+    return obj
+
+
 def save_yaml(obj, path: str | Path, **kwargs) -> None:
     save(obj, path, format=yaml_extension, **kwargs)
 
@@ -637,6 +1042,175 @@ def save_json(obj, path: str | Path, **kwargs) -> None:
     save(obj, path, format=json_extension, **kwargs)
 
 
+def from_dicts(
+    cls: type[DataclassT], dicts: Iterable[dict[str, Any]], drop_extra_fields: bool | None = None
+) -> Iterator[DataclassT]:
+    """Lazily decodes an instance of the dataclass `cls` from each of the given dicts.
+
+    This is equivalent to calling `from_dict` on each dict, but the dicts are only consumed as the
+    returned iterator is advanced, so they can come from a stream (e.g. a large file).
+    """
+    for d in dicts:
+        yield from_dict(cls, d, drop_extra_fields=drop_extra_fields)
+
+
+def load_jsonl(
+    cls: type[DataclassT],
+    path: str | Path,
+    drop_extra_fields: bool | None = None,
+    load_fn: LoadsFn = json.loads,
+) -> Iterator[DataclassT]:
+    """Lazily loads an instance of `cls` from each line of the given JSON Lines file.
+
+    The lines are read and decoded one at a time as the returned iterator is advanced, so the
+    memory used doesn't depend on the size of the file. Empty lines are skipped.
+
+    Args:
+        cls (Type[D]): A dataclass type to load.
+        path (Union[str, Path]): Path to a JSON Lines file, with one json object per line.
+        drop_extra_fields (bool, optional): Whether to drop extra fields or
+            to decode the dictionary into the first subclass with matching
+            fields. Defaults to None, in which case we use the value of
+            `cls.decode_into_subclasses`.
+            For more info, see `cls.from_dict`.
+        load_fn ([type], optional): Function used to parse each line. Defaults to json.loads.
+
+    Returns:
+        Iterator[D]: The instances of `cls`, in the same order as the lines of the file.
+    """
+    if drop_extra_fields is None and getattr(cls, "decode_into_subclasses", None) is not None:
+        drop_extra_fields = not getattr(cls, "decode_into_subclasses")
+    with open(path) as f:
+        lines = (line for line in f if line.strip())
+        yield from from_dicts(cls, map(load_fn, lines), drop_extra_fields=drop_extra_fields)
+
+
+def save_jsonl(
+    objs: Iterable[Any],
+    path: str | Path,
+    save_dc_types: bool = False,
+    dump_fn: DumpsFn = json.dumps,
+    copy_mode: CopyMode | None = None,
+    **kwargs,
+) -> None:
+    """Saves the given dataclasses or dictionaries to a JSON Lines file, one per line.
+
+    The objects are encoded and written one at a time, so `objs` can be a generator.
+    """
+    kwargs.setdefault("cls", SimpleJsonEncoder)
+    with open(path, "w") as f:
+        for obj in objs:
+            if not isinstance(obj, dict):
+                obj = to_dict(obj, save_dc_types=save_dc_types, copy_mode=copy_mode)
+            f.write(dump_fn(obj, **kwargs))
+            f.write("\n")
+
+
+class LoadResult(NamedTuple):
+    """The result of loading one of the files passed to `load_many`."""
+
+    path: Path
+    """The path of the file."""
+
+    value: Any = None
+    """The instance loaded from the file, or None if it couldn't be loaded."""
+
+    error: Exception | None = None
+    """The exception raised while loading the file, if any."""
+
+
+def load_many(
+    cls: type[DataclassT],
+    paths: Iterable[str | Path],
+    drop_extra_fields: bool | None = None,
+    executor: Executor | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> Iterator[LoadResult]:
+    """Loads an instance of `cls` from each of the given files, optionally in parallel.
+
+    The exceptions raised while loading a file are caught, and returned in the `error` attribute
+    of the `LoadResult` of that file.
+
+    Args:
+        cls (Type[D]): A dataclass type to load.
+        paths (Iterable[str | Path]): The paths of the files to load.
+        drop_extra_fields (bool, optional): See `load`.
+        executor (Executor, optional): The executor used to load the files. A `ProcessPoolExecutor`
+            is best when parsing the files is the bottleneck (e.g. with yaml), and a
+            `ThreadPoolExecutor` when reading them is. In the case of processes, `cls` must be
+            importable from the worker processes (i.e. not defined in a function). Defaults to
+            None, in which case the files are loaded one after another, in this thread.
+        chunksize (int, optional): The number of files loaded by each task submitted to
+            `executor`. Larger chunks reduce the communication overhead with the worker processes.
+            Defaults to 1.
+        ordered (bool, optional): Whether to return the results in the same order as `paths`, or
+            as soon as they are ready. Defaults to True.
+
+    Returns:
+        Iterator[LoadResult]: The result of loading each file.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize should be at least 1, got {chunksize}")
+    paths = [Path(path) for path in paths]
+    if executor is None:
+        yield from _load_chunk(cls, paths, drop_extra_fields)
+        return
+
+    chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+    futures = {
+        executor.submit(_load_chunk, cls, chunk, drop_extra_fields): chunk for chunk in chunks
+    }
+    for future in futures if ordered else as_completed(futures):
+        try:
+            yield from future.result()
+        except Exception as e:
+            # e.g. when `cls` or the loaded instances can't be sent between processes.
+            yield from (LoadResult(path, error=e) for path in futures[future])
+
+
+def load_dir(
+    cls: type[DataclassT],
+    directory: str | Path,
+    pattern: str = "*",
+    drop_extra_fields: bool | None = None,
+    executor: Executor | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> Iterator[LoadResult]:
+    """Loads an instance of `cls` from each file in `directory` that matches `pattern`.
+
+    Only the files with a registered extension (see `extensions`) are loaded, in the order of their
+    paths. Use a pattern like "**/*.yaml" to also load the files in subdirectories.
+    See `load_many` for a description of the other arguments.
+    """
+    paths = sorted(
+        path
+        for path in Path(directory).glob(pattern)
+        if path.suffix in extensions and path.is_file()
+    )
+    return load_many(
+        cls,
+        paths,
+        drop_extra_fields=drop_extra_fields,
+        executor=executor,
+        chunksize=chunksize,
+        ordered=ordered,
+    )
+
+
+def _load_chunk(
+    cls: type[DataclassT], paths: list[Path], drop_extra_fields: bool | None
+) -> list[LoadResult]:
+    results: list[LoadResult] = []
+    for path in paths:
+        try:
+            results.append(LoadResult(path, load(cls, path, drop_extra_fields=drop_extra_fields)))
+        except Exception as e:
+            results.append(LoadResult(path, error=e))
+    return results
+
+
 def load_yaml(
     cls: type[T],
     path: str | Path,
@@ -650,65 +1224,85 @@ def load_yaml(
         cls (Type[T]): A dataclass type to load.
         path (Union[str, Path]): Path to a yaml-formatted file.
         load_fn ([type], optional): Loading function to use. Defaults to
-            None, in which case `yaml.safe_load` is used.
+            None, in which case `yaml_extension.load` is used.
 
     Returns:
         T: an instance of the dataclass.
     """
-    import yaml
-
     if load_fn is None:
-        load_fn = yaml.safe_load
+        load_fn = yaml_extension.load
     return load(cls, path, drop_extra_fields=drop_extra_fields, load_fn=partial(load_fn, **kwargs))
 
 
-def dump(dc, fp: IO[str], dump_fn: DumpFn = json.dump) -> None:
+def dump(dc, fp: IO[str], dump_fn: DumpFn = json.dump, copy_mode: CopyMode | None = None) -> None:
     # Convert `dc` into a dict if needed.
     if not isinstance(dc, dict):
-        dc = to_dict(dc)
+        dc = to_dict(dc, copy_mode=copy_mode)
     # Serialize that dict to the file using dump_fn.
     dump_fn(dc, fp)
 
 
-def dump_json(dc, fp: IO[str], dump_fn: DumpFn = json.dump, **kwargs) -> None:
-    return dump(dc, fp, dump_fn=partial(dump_fn, **kwargs))
-
+def dump_json(
+    dc, fp: IO[str], dump_fn: DumpFn = json.dump, copy_mode: CopyMode | None = None, **kwargs
+) -> None:
+    return dump(dc, fp, dump_fn=partial(dump_fn, **kwargs), copy_mode=copy_mode)
 
-def dump_yaml(dc, fp: IO[str], dump_fn: DumpFn | None = None, **kwargs) -> None:
-    import yaml
 
+def dump_yaml(
+    dc, fp: IO[str], dump_fn: DumpFn | None = None, copy_mode: CopyMode | None = None, **kwargs
+) -> None:
     if dump_fn is None:
-        dump_fn = yaml.dump
-    return dump(dc, fp, dump_fn=partial(dump_fn, **kwargs))
+        dump_fn = yaml_extension.dump
+    return dump(dc, fp, dump_fn=partial(dump_fn, **kwargs), copy_mode=copy_mode)
 
 
-def dumps(dc, dump_fn: DumpsFn = json.dumps) -> str:
+def dumps(dc, dump_fn: DumpsFn = json.dumps, copy_mode: CopyMode | None = None) -> str:
     if not isinstance(dc, dict):
-        dc = to_dict(dc)
+        dc = to_dict(dc, copy_mode=copy_mode)
     return dump_fn(dc)
 
 
-def dumps_json(dc, dump_fn: DumpsFn = json.dumps, **kwargs) -> str:
+def dumps_json(
+    dc, dump_fn: DumpsFn = json.dumps, copy_mode: CopyMode | None = None, **kwargs
+) -> str:
     kwargs.setdefault("cls", SimpleJsonEncoder)
-    return dumps(dc, dump_fn=partial(dump_fn, **kwargs))
-
+    return dumps(dc, dump_fn=partial(dump_fn, **kwargs), copy_mode=copy_mode)
 
-def dumps_yaml(dc, dump_fn: DumpsFn | None = None, **kwargs) -> str:
-    import yaml
 
+def dumps_yaml(
+    dc, dump_fn: DumpsFn | None = None, copy_mode: CopyMode | None = None, **kwargs
+) -> str:
     if dump_fn is None:
-        dump_fn = yaml.dump
-    return dumps(dc, dump_fn=partial(dump_fn, **kwargs))
+        dump_fn = yaml_extension.dumps
+    return dumps(dc, dump_fn=partial(dump_fn, **kwargs), copy_mode=copy_mode)
 
 
 DC_TYPE_KEY = "_type_"
 
 
+def _get_dc_type(path: str) -> Any:
+    """Returns the type saved at the `DC_TYPE_KEY` entry of a dict."""
+    dc_type = _registered_dc_types.get(path)
+    if dc_type is not None:
+        return dc_type
+    if _only_registered_dc_types:
+        raise ImportError(
+            f"Refusing to load the type {path!r}, since it isn't registered. Register it with "
+            f"`register_dc_type`, or allow other types with `only_use_registered_dc_types(False)`."
+        )
+    dc_type = _located_dc_types.get(path)
+    if dc_type is None:
+        dc_type = _located_dc_types[path] = _locate(path)
+    return dc_type
+
+
 def to_dict(
     dc: DataclassT,
     dict_factory: type[dict] = dict,
     recurse: bool = True,
     save_dc_types: bool = False,
+    copy_mode: CopyMode | None = None,
+    only_non_default: bool = False,
 ) -> dict:
     """Serializes this dataclass to a dict.
 
@@ -719,59 +1313,269 @@ def to_dict(
 
     When `save_dc_types` is True, the type of each dataclass field is saved in the dict of that
     field at a `DC_TYPE_KEY` entry.
+
+    `copy_mode` sets how the values that `encode` doesn't know how to convert are copied (see
+    `CopyMode`). Values of immutable types (str, int, bytes, etc.) are never copied. When None
+    (default), the mode of the enclosing `to_dict` call is used, or "deep" if there isn't one.
+
+    When `only_non_default` is True, only the fields whose value is different from their default
+    value are included. The nested dataclasses are compared with the default value of their field,
+    and are saved completely (with their type) when their type is different, e.g. when another
+    subgroup is selected. The type of `dc` is always saved, so that the default values of that type
+    are used when loading. Use `load(..., only_non_default=True)` to load the resulting files.
     """
     if not is_dataclass(dc):
         raise ValueError("to_dict should only be called on a dataclass instance.")
+    dataclass_type = dc if isinstance(dc, type) else type(dc)
+    encoder = _get_dict_encoder(dataclass_type, dict_factory, recurse, save_dc_types)
+    if copy_mode is None:
+        d = encoder(dc)
+    else:
+        with _copy_mode(copy_mode):
+            d = encoder(dc)
+    if only_non_default:
+        d = _remove_default_values(d, dc, _get_defaults(dataclass_type))
+        # Save the type, so that its default values are used when loading (e.g. for a subclass).
+        if DC_TYPE_KEY not in d and "<locals>" not in dataclass_type.__qualname__:
+            d = dict_factory({DC_TYPE_KEY: _get_dc_type_path(dataclass_type), **d})
+    return d
+
+
+# The compiled encoding functions of each dataclass type, for each (dict_factory, recurse,
+# save_dc_types).
+# NOTE: The dataclass types are weakly referenced, so that the dataclasses defined in local scopes
+# (e.g. in tests) can be garbage-collected.
+_dict_encoders: weakref.WeakKeyDictionary[
+    type, dict[tuple[type[dict], bool, bool], Callable[[Any], dict]]
+] = weakref.WeakKeyDictionary()
+# The version of the registry of `encode` when the encoders were compiled.
+_dict_encoders_registry_version: int = -1
+
 
-    d: dict[str, Any] = dict_factory()
+def _get_dict_encoder(
+    dataclass_type: type, dict_factory: type[dict], recurse: bool, save_dc_types: bool
+) -> Callable[[Any], dict]:
+    """Returns the (cached) function that encodes instances of `dataclass_type` into a dict.
+
+    The compiled encoders are discarded when an encoding function is registered with `encode`,
+    since it might change how the values of the fields should be encoded.
+    """
+    global _dict_encoders_registry_version
+    if _get_registry_version() != _dict_encoders_registry_version:
+        _dict_encoders.clear()
+        _dict_encoders_registry_version = _get_registry_version()
+
+    encoders = _dict_encoders.get(dataclass_type)
+    if encoders is None:
+        encoders = _dict_encoders[dataclass_type] = {}
+    key = (dict_factory, recurse, save_dc_types)
+    encoder = encoders.get(key)
+    if encoder is None:
+        encoder = encoders[key] = _compile_dict_encoder(dataclass_type, *key)
+    return encoder
+
+
+def _compile_dict_encoder(
+    dataclass_type: type, dict_factory: type[dict], recurse: bool, save_dc_types: bool
+) -> Callable[[Any], dict]:
+    """Generates a function that encodes instances of `dataclass_type` into a dict.
+
+    The generated function does the same thing as looping over the fields of the dataclass, but the
+    metadata of the fields is only looked at once, here. The values of the fields whose type is
+    one of `get_passthrough_types()` are used as-is, since `encode` would return them unchanged.
+    """
+    namespace: dict[str, Any] = {
+        "dict_factory": dict_factory,
+        "is_dataclass": is_dataclass,
+        "atomic_types": get_passthrough_types(),
+        "encode_value": _encode_field_value,
+        "warn_local_dataclass": _warn_local_dataclass,
+        "to_dict": partial(
+            to_dict, dict_factory=dict_factory, recurse=recurse, save_dc_types=save_dc_types
+        ),
+    }
+    lines = ["def encoder(obj):", "    d = dict_factory()"]
 
     if save_dc_types:
-        class_name = dc.__class__.__qualname__
-        module = type(dc).__module__
+        class_name = dataclass_type.__qualname__
         if "<locals>" in class_name:
-            # Don't save the type of function-scoped dataclasses.
-            warnings.warn(
-                RuntimeWarning(
-                    f"Dataclass type {type(dc)} is defined in a function scope, which might cause "
-                    f"issues when deserializing the containing dataclass. Refusing to save the "
-                    f"type of this dataclass in the serialized dictionary."
-                )
-            )
+            # NOTE: The encoder doesn't refer to the dataclass type, which is weakly referenced.
+            namespace["dataclass_type"] = str(dataclass_type)
+            lines.append("    warn_local_dataclass(dataclass_type)")
         else:
-            d[DC_TYPE_KEY] = module + "." + class_name
-
-    for f in fields(dc):
-        name = f.name
-        value = getattr(dc, name)
+            dc_type_path = _get_dc_type_path(dataclass_type)
+            lines.append(f"    d[{DC_TYPE_KEY!r}] = {dc_type_path!r}")
 
+    for i, f in enumerate(fields(dataclass_type)):
         # Do not include in dict if some corresponding flag was set in metadata.
-        include_in_dict = f.metadata.get("to_dict", True)
-        if not include_in_dict:
+        if not f.metadata.get("to_dict", True):
             continue
+        name = f.name
+        lines.append(f"    value = obj.{name}")
 
         custom_encoding_fn = f.metadata.get("encoding_fn")
         if custom_encoding_fn:
             # Use a custom encoding function if there is one.
-            d[name] = custom_encoding_fn(value)
+            namespace[f"encoding_fn_{i}"] = custom_encoding_fn
+            lines.append(f"    d[{name!r}] = encoding_fn_{i}(value)")
             continue
 
-        encoding_fn = encode
-        # TODO: Make a variant of the serialization tests that use the static functions everywhere.
-        if is_dataclass(value) and recurse:
-            encoded = to_dict(
-                value, dict_factory=dict_factory, recurse=recurse, save_dc_types=save_dc_types
-            )
-            logger.debug(f"Encoded dataclass field {name}: {encoded}")
-        else:
+        lines.append("    if type(value) in atomic_types:")
+        lines.append(f"        d[{name!r}] = value")
+        if recurse:
+            lines.append("    elif is_dataclass(value):")
+            lines.append(f"        d[{name!r}] = to_dict(value)")
+        lines.append("    else:")
+        lines.append(f"        d[{name!r}] = encode_value(value)")
+    lines.append("    return d")
+
+    exec("\n".join(lines), namespace)
+    encoder = namespace["encoder"]
+    encoder.__qualname__ = f"to_dict[{dataclass_type.__qualname__}]"
+    return encoder
+
+
+def _encode_field_value(value: Any) -> Any:
+    try:
+        return encode(value)
+    except Exception as e:
+        logger.error(
+            f"Unable to encode value {value} of type {type(value)}! Leaving it as-is. (exception: {e})"
+        )
+        return value
+
+
+def _warn_local_dataclass(dataclass_type: type | str) -> None:
+    # Don't save the type of function-scoped dataclasses.
+    warnings.warn(
+        RuntimeWarning(
+            f"Dataclass type {dataclass_type} is defined in a function scope, which might cause "
+            f"issues when deserializing the containing dataclass. Refusing to save the "
+            f"type of this dataclass in the serialized dictionary."
+        )
+    )
+
+
+class _Defaults(NamedTuple):
+    """The encoded default values of the fields of a dataclass."""
+
+    dataclass_type: type
+    """The type of the dataclass."""
+
+    values: dict[str, Any]
+    """The encoded default value of each field, or the `_Defaults` of the (nested) dataclass."""
+
+
+# The default values of the fields of each dataclass type (the `values` of its `_Defaults`).
+# NOTE: The dataclass types are weakly referenced, so that the dataclasses defined in local scopes
+# (e.g. in tests) can be garbage-collected. The `_Defaults` aren't stored, since they refer to their
+# dataclass type.
+_defaults: weakref.WeakKeyDictionary[type, dict[str, Any]] = weakref.WeakKeyDictionary()
+# The version of the registry of `encode` when the defaults were computed.
+_defaults_registry_version: int = -1
+
+
+def _get_defaults(dataclass_type: type) -> _Defaults:
+    """Returns the (cached) default values of the fields of `dataclass_type`.
+
+    The fields without a default value, or whose default factory raises an error, are left out.
+    """
+    global _defaults_registry_version
+    if _get_registry_version() != _defaults_registry_version:
+        _defaults.clear()
+        _defaults_registry_version = _get_registry_version()
+
+    values = _defaults.get(dataclass_type)
+    if values is None:
+        values = _defaults[dataclass_type] = _make_defaults(dataclass_type).values
+    return _Defaults(dataclass_type, values)
+
+
+def _make_defaults(dataclass_type: type, instance: Any = None) -> _Defaults:
+    """Encodes the values of the fields of `instance`, or the default values of the fields."""
+    values: dict[str, Any] = {}
+    for f in fields(dataclass_type):
+        if not f.metadata.get("to_dict", True):
+            continue
+        if instance is not None:
+            value = getattr(instance, f.name)
+        elif f.default is not MISSING:
+            value = f.default
+        elif f.default_factory is not MISSING:
             try:
-                encoded = encoding_fn(value)
+                value = f.default_factory()
             except Exception as e:
-                logger.error(
-                    f"Unable to encode value {value} of type {type(value)}! Leaving it as-is. (exception: {e})"
+                logger.debug(f"Unable to create the default value of field {f.name}: {e}")
+                continue
+        else:
+            continue
+
+        encoding_fn = f.metadata.get("encoding_fn")
+        if encoding_fn:
+            values[f.name] = encoding_fn(value)
+        elif is_dataclass(value) and not isinstance(value, type):
+            values[f.name] = _make_defaults(type(value), value)
+        else:
+            values[f.name] = _encode_field_value(value)
+    return _Defaults(dataclass_type, values)
+
+
+def _remove_default_values(d: dict, dc: Any, defaults: _Defaults) -> dict:
+    """Removes the entries of `d` (the dict of the dataclass `dc`) that have their default value."""
+    result = type(d)()
+    for name, encoded in d.items():
+        default = defaults.values.get(name, MISSING)
+        if name == DC_TYPE_KEY:
+            result[name] = encoded
+        elif isinstance(default, _Defaults) and isinstance(encoded, dict):
+            value = getattr(dc, name)
+            if type(value) is default.dataclass_type:
+                nested = _remove_default_values(encoded, value, default)
+                if nested.keys() - {DC_TYPE_KEY}:
+                    result[name] = nested
+            else:
+                # e.g. another subgroup: Save the type, so that the right one is used when loading.
+                result[name] = (
+                    to_dict(value, save_dc_types=True) if is_dataclass(value) else encoded
                 )
-                encoded = value
-        d[name] = encoded
-    return d
+        elif default is MISSING or encoded != default:
+            result[name] = encoded
+    return result
+
+
+def _merge_default_values(d: dict[str, Any], defaults: _Defaults) -> dict[str, Any]:
+    """Adds the default values to the dict `d` saved with `to_dict(..., only_non_default=True)`.
+
+    NOTE: The default values are copied, so they can't be modified by the caller.
+    """
+    result = {
+        name: _copy_default_value(default)
+        for name, default in defaults.values.items()
+        if name not in d
+    }
+    for name, value in d.items():
+        default = defaults.values.get(name)
+        if (
+            isinstance(default, _Defaults)
+            and isinstance(value, dict)
+            and (
+                DC_TYPE_KEY not in value
+                or _get_dc_type(value[DC_TYPE_KEY]) is default.dataclass_type
+            )
+        ):
+            value = _merge_default_values(value, default)
+        result[name] = value
+    return result
+
+
+def _copy_default_value(value: Any) -> Any:
+    if isinstance(value, _Defaults):
+        return {name: _copy_default_value(v) for name, v in value.values.items()}
+    if isinstance(value, dict):
+        return {k: _copy_default_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_default_value(v) for v in value]
+    return value
 
 
 def from_dict(
@@ -807,15 +1611,9 @@ def from_dict(
 
     obj_dict: dict[str, Any] = d.copy()
 
-    init_args: dict[str, Any] = {}
-    non_init_args: dict[str, Any] = {}
-
     if DC_TYPE_KEY in obj_dict:
         target = obj_dict.pop(DC_TYPE_KEY)
-        # module, dc_type = target.rsplit(".", 1)
-        live_dc_type = _locate(target)
-        # live_module = importlib.import_module(module)
-        # live_dc_type = getattr(live_module, dc_type)
+        live_dc_type = _get_dc_type(target)
         return from_dict(live_dc_type, obj_dict, drop_extra_fields=drop_extra_fields)
 
     if drop_extra_fields is None:
@@ -831,29 +1629,13 @@ def from_dict(
             drop_extra_fields = False
 
     logger.debug(f"from_dict for {cls}, drop extra fields: {drop_extra_fields}")
-    for field in fields(cls) if is_dataclass(cls) else []:
-        name = field.name
-        if name not in obj_dict:
-            if (
-                field.metadata.get("to_dict", True)
-                and field.default is MISSING
-                and field.default_factory is MISSING
-            ):
-                logger.warning(
-                    f"Couldn't find the field '{name}' in the dict with keys " f"{list(d.keys())}"
-                )
-            continue
-
-        raw_value = obj_dict.pop(name)
-        field_value = decode_field(
-            field, raw_value, containing_dataclass=cls, drop_extra_fields=drop_extra_fields
+    init_args: dict[str, Any] = {}
+    non_init_args: dict[str, Any] = {}
+    if is_dataclass(cls):
+        init_args, non_init_args = decode_fields(
+            cls, obj_dict, drop_extra_fields=drop_extra_fields
         )
 
-        if field.init:
-            init_args[name] = field_value
-        else:
-            non_init_args[name] = field_value
-
     extra_args = obj_dict
 
     # If there are arguments left over in the dict after taking all fields.
@@ -867,31 +1649,15 @@ def from_dict(
             # fields.
             logger.debug(f"Missing field names: {extra_args.keys()}")
 
-            # Find all the "registered" subclasses of `cls`. (from Serializable)
-            derived_classes: list[type[DataclassT]] = []
-
-            for subclass in all_subclasses(cls):
-                if subclass is not cls:
-                    derived_classes.append(subclass)
-            logger.debug(f"All derived classes of {cls} available: {derived_classes}")
-
             # All the arguments that the dataclass should be able to accept in
             # its 'init'.
             req_init_field_names = set(chain(extra_args, init_args))
 
-            # Sort the derived classes by their number of init fields, so that
-            # we choose the first one with all the required fields.
-            derived_classes.sort(key=lambda dc: len(get_init_fields(dc)))
-
-            for child_class in derived_classes:
-                logger.debug(f"child class: {child_class.__name__}, mro: {child_class.mro()}")
-                child_init_fields: dict[str, Field] = get_init_fields(child_class)
-                child_init_field_names = set(child_init_fields.keys())
-
-                if child_init_field_names >= req_init_field_names:
-                    # `child_class` is the first class with all required fields.
-                    logger.debug(f"Using class {child_class} instead of {cls}")
-                    return from_dict(child_class, d, drop_extra_fields=False)
+            child_class = get_subclass_index(cls).smallest_superset(req_init_field_names)
+            if child_class is not None:
+                # `child_class` is the first class with all required fields.
+                logger.debug(f"Using class {child_class} instead of {cls}")
+                return from_dict(child_class, d, drop_extra_fields=False)
 
     init_args.update(extra_args)
     try:
@@ -916,6 +1682,53 @@ def get_init_fields(dataclass: type) -> dict[str, Field]:
     return result
 
 
+class SubclassIndex:
+    """Index of the init fields of the subclasses of a dataclass, used to find the subclass with
+    the fewest init fields that accepts a given set of field names.
+
+    The subclasses are sorted by their number of init fields, and each field name is mapped to the
+    positions of the subclasses that have it.
+    """
+
+    def __init__(self, cls: type):
+        subclasses = [subclass for subclass in all_subclasses(cls) if subclass is not cls]
+        init_field_names = {subclass: get_init_fields(subclass).keys() for subclass in subclasses}
+        subclasses.sort(key=lambda subclass: len(init_field_names[subclass]))
+        self.subclasses: list[type] = subclasses
+        self.positions: dict[str, set[int]] = {}
+        for position, subclass in enumerate(subclasses):
+            for field_name in init_field_names[subclass]:
+                self.positions.setdefault(field_name, set()).add(position)
+
+    def smallest_superset(self, field_names: set[str]) -> type | None:
+        """Returns the subclass with the fewest init fields whose init fields include all the given
+        field names, or None if there is no such subclass."""
+        if not field_names:
+            return self.subclasses[0] if self.subclasses else None
+        # Intersect the positions of the subclasses with each field, starting with the rarest field.
+        postings = sorted(
+            (self.positions.get(field_name, set()) for field_name in field_names), key=len
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        if not candidates:
+            return None
+        return self.subclasses[min(candidates)]
+
+
+def get_subclass_index(cls: type) -> SubclassIndex:
+    """Returns the index of the subclasses of `cls`.
+
+    The index is cached for subclasses of `SerializableMixin`, since creating one of their
+    subclasses clears the cache. It is created again for each call for other dataclasses.
+    """
+    if not (isinstance(cls, type) and issubclass(cls, SerializableMixin)):
+        return SubclassIndex(cls)
+    index = _subclass_indices.get(cls)
+    if index is None:
+        index = _subclass_indices[cls] = SubclassIndex(cls)
+    return index
+
+
 def get_first_non_None_type(optional_type: type | tuple[type, ...]) -> type | None:
     if not isinstance(optional_type, tuple):
         optional_type = get_args(optional_type)
@@ -4,12 +4,7 @@ from logging import getLogger
 from pathlib import Path
 from typing import IO
 
-try:
-    import yaml
-except ImportError:
-    pass
-
-from .serializable import D, Serializable
+from .serializable import D, Serializable, yaml_extension
 
 logger = getLogger(__name__)
 
@@ -18,19 +13,20 @@ class YamlSerializable(Serializable):
     """Convenience class, just sets different `load_fn` and `dump_fn` defaults for the `dump`,
     `dumps`, `load`, `loads` methods of `Serializable`.
 
-    Uses the `yaml.safe_load` and `yaml.dump` for loading and dumping.
+    Uses `yaml_extension` (`yaml.safe_load` and `yaml.dump`, or their libyaml equivalents) for
+    loading and dumping.
 
     Requires the pyyaml package.
     """
 
     def dump(self, fp: IO[str], dump_fn=None, **kwargs) -> None:
         if dump_fn is None:
-            dump_fn = yaml.dump
+            dump_fn = yaml_extension.dump
         dump_fn(self.to_dict(), fp, **kwargs)
 
     def dumps(self, dump_fn=None, **kwargs) -> str:
         if dump_fn is None:
-            dump_fn = yaml.dump
+            dump_fn = yaml_extension.dumps
         return dump_fn(self.to_dict(), **kwargs)
 
     @classmethod
@@ -42,7 +38,7 @@ class YamlSerializable(Serializable):
         **kwargs,
     ) -> D:
         if load_fn is None:
-            load_fn = yaml.safe_load
+            load_fn = yaml_extension.load
 
         return super().load(path, drop_extra_fields=drop_extra_fields, load_fn=load_fn, **kwargs)
 
@@ -55,7 +51,7 @@ class YamlSerializable(Serializable):
         **kwargs,
     ) -> D:
         if load_fn is None:
-            load_fn = yaml.safe_load
+            load_fn = yaml_extension.load
         return super().loads(s, drop_extra_fields=drop_extra_fields, load_fn=load_fn, **kwargs)
 
     @classmethod
@@ -67,5 +63,5 @@ class YamlSerializable(Serializable):
         **kwargs,
     ) -> D:
         if load_fn is None:
-            load_fn = yaml.safe_load
+            load_fn = yaml_extension.load
         return super()._load(fp, drop_extra_fields=drop_extra_fields, load_fn=load_fn, **kwargs)
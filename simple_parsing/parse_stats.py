@@ -0,0 +1,153 @@
+"""Opt-in instrumentation of the different phases of parsing.
+
+When enabled (with `ArgumentParser(collect_stats=True)` or with the `collect_stats` context
+manager), the wall time and the number of calls of each phase of parsing are recorded in a
+`ParseStats` object: loading config files, resolving conflicts and subgroups, adding the
+arguments, running argparse, and creating the dataclasses. Some expensive helpers
+(`typing.get_type_hints`, `inspect.getsource` and `read_file`) are also counted.
+
+When disabled, each phase only costs a lookup of a context variable.
+
+>>> from dataclasses import dataclass
+>>> from simple_parsing import ArgumentParser
+>>> @dataclass
+... class Config:
+...     lr: float = 0.1
+>>> parser = ArgumentParser(collect_stats=True)
+>>> _ = parser.add_arguments(Config, dest="config")
+>>> parser.parse_args(["--lr", "0.5"]).config
+Config(lr=0.5)
+>>> parser.stats["parse_known_args"].calls
+1
+>>> parser.stats["instantiate_dataclasses"].calls
+1
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import threading
+import time
+from collections.abc import Iterator
+from typing import Callable, TypeVar
+
+C = TypeVar("C", bound=Callable)
+
+_current_stats: contextvars.ContextVar[ParseStats | None] = contextvars.ContextVar(
+    "current_parse_stats", default=None
+)
+_disabled = contextlib.nullcontext()
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    """Number of calls and total wall time of a phase."""
+
+    calls: int = 0
+    time: float = 0.0
+    """Total wall time in seconds, including the time spent in the phases nested in this one."""
+
+
+class ParseStats:
+    """Wall time and number of calls of each phase of parsing, keyed by the name of the phase."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+        # The same parser (and the same stats) can be used from multiple threads.
+        self._lock = threading.Lock()
+
+    def __getitem__(self, phase: str) -> PhaseStats:
+        return self.phases.get(phase, PhaseStats())
+
+    def __contains__(self, phase: str) -> bool:
+        return phase in self.phases
+
+    def reset(self) -> None:
+        with self._lock:
+            self.phases.clear()
+
+    @contextlib.contextmanager
+    def track(self, phase: str) -> Iterator[None]:
+        """Records the time spent in the block as a call to the given phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                phase_stats = self.phases.setdefault(phase, PhaseStats())
+                phase_stats.calls += 1
+                phase_stats.time += elapsed
+
+    def summary(self) -> str:
+        """Returns a table of the phases, sorted by decreasing total time."""
+        phases = sorted(self.phases.items(), key=lambda item: item[1].time, reverse=True)
+        width = max((len(phase) for phase in self.phases), default=5)
+        lines = [f"{'phase':<{width}}  {'calls':>7}  {'time (ms)':>10}"]
+        for phase, phase_stats in phases:
+            milliseconds = phase_stats.time * 1000
+            lines.append(f"{phase:<{width}}  {phase_stats.calls:>7}  {milliseconds:>10.3f}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.phases})"
+
+
+@contextlib.contextmanager
+def collect_stats(stats: ParseStats | None = None) -> Iterator[ParseStats]:
+    """Records the stats of all the parsing done in this block (in the current thread).
+
+    >>> import simple_parsing
+    >>> from dataclasses import dataclass
+    >>> @dataclass
+    ... class Config:
+    ...     lr: float = 0.1
+    >>> with collect_stats() as stats:
+    ...     _ = simple_parsing.parse(Config, args="--lr 0.2")
+    >>> stats["argparse"].calls
+    1
+    """
+    stats = ParseStats() if stats is None else stats
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextlib.contextmanager
+def untracked() -> Iterator[None]:
+    """Doesn't record anything in the current stats in this block."""
+    token = _current_stats.set(None)
+    try:
+        yield
+    finally:
+        _current_stats.reset(token)
+
+
+def track(phase: str) -> contextlib.AbstractContextManager[None]:
+    """Records the time spent in the block in the current stats, if they are being collected."""
+    stats = _current_stats.get()
+    if stats is None:
+        return _disabled
+    return stats.track(phase)
+
+
+def tracked(phase: str) -> Callable[[C], C]:
+    """Decorator that records the calls to the function in the current stats, if any."""
+
+    def _decorator(fn: C) -> C:
+        @functools.wraps(fn)
+        def _wrapper(*args, **kwargs):
+            stats = _current_stats.get()
+            if stats is None:
+                return fn(*args, **kwargs)
+            with stats.track(phase):
+                return fn(*args, **kwargs)
+
+        return _wrapper  # type: ignore
+
+    return _decorator
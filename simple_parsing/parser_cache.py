@@ -0,0 +1,181 @@
+"""Opt-in, persistent on-disk cache for the argv-independent parts of building a parser.
+
+Building the tree of `DataclassWrapper`s and `FieldWrapper`s involves resolving the conflicts
+between the option strings of all the fields, and retrieving the docstrings of all the fields from
+their source code. The results of this work only depend on the dataclasses (and on the source
+files where they are defined) and on the options of the `ArgumentParser`, so they can be saved on
+disk and reused by later processes.
+
+NOTE: The argparse keyword arguments of the fields (e.g. their `type` function or their `action`)
+are often closures or classes which can't be reliably persisted, so they are still recreated from
+the dataclass fields. Only the plain values (option strings, prefixes, help strings and group
+descriptions) are stored.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .wrappers import DataclassWrapper
+
+if TYPE_CHECKING:
+    from .parsing import ArgumentParser
+
+logger = getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+"""Version of the format of the cache entries. Bump this when changing what is stored."""
+
+
+class ParserCache:
+    """Stores the resolved option strings, prefixes, help strings and descriptions of a parser.
+
+    Each entry is keyed on:
+    - the dataclass types, their destinations, prefixes and field names;
+    - the path, modification time and size of the source file of each class in their MRO;
+    - the options of the parser (conflict resolution, dash variants, argument generation mode,
+      nested mode and prefix chars).
+
+    When any of these change, a new entry is created. Entries are written atomically, so that
+    multiple processes (for example multiple ranks of a distributed job) can share the same cache
+    directory.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+
+    def get_key(self, parser: ArgumentParser, wrappers: list[DataclassWrapper]) -> str | None:
+        """Returns the key of the cache entry for this parser, or None if it can't be cached."""
+        from .conflicts import ConflictResolution
+        from .parsing import _flatten_wrappers
+
+        if parser.conflict_resolution == ConflictResolution.ALWAYS_MERGE:
+            # Merging changes the structure of the tree of wrappers, which we don't store.
+            return None
+
+        key_parts: list[Any] = [
+            CACHE_FORMAT_VERSION,
+            list(sys.version_info[:2]),
+            parser.conflict_resolution.name,
+            str(parser.add_option_string_dash_variants),
+            parser.argument_generation_mode.name,
+            parser.nested_mode.name,
+            parser.prefix_chars,
+        ]
+        source_files: dict[str, list[int]] = {}
+        for wrapper in _flatten_wrappers(wrappers):
+            dataclass = wrapper.dataclass
+            key_parts.append(
+                [
+                    wrapper.dest,
+                    wrapper.prefix,
+                    f"{dataclass.__module__}.{dataclass.__qualname__}",
+                    [[f.name, f.prefix, f.aliases] for f in wrapper.fields],
+                ]
+            )
+            for cls in dataclass.__mro__[:-1]:
+                module = sys.modules.get(cls.__module__)
+                module_file = getattr(module, "__file__", None)
+                if module_file is None:
+                    logger.debug(f"Not caching the parser: can't find the source file of {cls}.")
+                    return None
+                if module_file not in source_files:
+                    try:
+                        stat = os.stat(module_file)
+                    except OSError:
+                        return None
+                    source_files[module_file] = [stat.st_mtime_ns, stat.st_size]
+        key_parts.append(sorted(source_files.items()))
+        try:
+            serialized = json.dumps(key_parts)
+        except TypeError:
+            # Some part of the key (e.g. an alias) isn't json-serializable.
+            return None
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Reads the cache entry with the given key, if it exists and is valid."""
+        path = self.path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"No usable parser cache entry at {path}: {e}")
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        return entry
+
+    def save(self, key: str, entry: dict[str, Any]) -> None:
+        """Atomically writes the cache entry with the given key."""
+        import tempfile
+
+        entry = {"version": CACHE_FORMAT_VERSION, **entry}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self.path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Unable to write the parser cache entry for key {key}: {e}")
+
+    def store(self, key: str, wrappers_flat: list[DataclassWrapper]) -> None:
+        """Saves the resolved option strings, help and descriptions of the (flattened) wrappers."""
+        fields: dict[str, dict[str, Any]] = {}
+        for wrapper in wrappers_flat:
+            for field in wrapper.fields:
+                fields[field.dest] = {
+                    "prefix": field.prefix,
+                    "option_strings": field.option_strings,
+                    "help": field.help,
+                }
+        descriptions = {wrapper.dest: wrapper.description for wrapper in wrappers_flat}
+        self.save(key, {"fields": fields, "descriptions": descriptions})
+
+    def restore(self, key: str, wrappers_flat: list[DataclassWrapper]) -> bool:
+        """Applies the cache entry with the given key onto the (flattened) wrappers, if possible.
+
+        Returns whether the entry was found and applied. When this returns False, the wrappers are
+        left unchanged.
+        """
+        entry = self.load(key)
+        if entry is None:
+            return False
+        cached_fields: dict[str, dict[str, Any]] = entry.get("fields", {})
+        descriptions: dict[str, str] = entry.get("descriptions", {})
+        field_wrappers = [field for wrapper in wrappers_flat for field in wrapper.fields]
+        if set(cached_fields) != {field.dest for field in field_wrappers} or set(
+            descriptions
+        ) != {wrapper.dest for wrapper in wrappers_flat}:
+            logger.debug(f"Parser cache entry {key} doesn't match the current wrappers.")
+            return False
+
+        original_prefixes = [field.prefix for field in field_wrappers]
+        for field in field_wrappers:
+            field.prefix = cached_fields[field.dest]["prefix"]
+        if any(
+            field.option_strings != cached_fields[field.dest]["option_strings"]
+            for field in field_wrappers
+        ):
+            logger.debug(f"Option strings in parser cache entry {key} are outdated.")
+            for field, prefix in zip(field_wrappers, original_prefixes):
+                field.prefix = prefix
+            return False
+
+        for field in field_wrappers:
+            cached_help = cached_fields[field.dest]["help"]
+            if cached_help is not None:
+                field.help = cached_help
+        for wrapper in wrappers_flat:
+            wrapper.description = descriptions[wrapper.dest]
+        logger.debug(f"Restored the resolved arguments from the parser cache entry {key}.")
+        return True
@@ -5,26 +5,32 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import contextvars
+import copy
 import dataclasses
 import functools
 import itertools
+import re
 import shlex
 import sys
 import typing
 from argparse import SUPPRESS, Action, HelpFormatter, Namespace, _
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Container, Iterable, Iterator, Sequence
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Callable, overload
+from typing import IO, Any, Callable, Generic, NoReturn, TypeVar, overload
 
 from simple_parsing.helpers.subgroups import SubgroupKey
 from simple_parsing.wrappers.dataclass_wrapper import DataclassWrapperType
 
 from . import utils
-from .conflicts import ConflictResolution, ConflictResolver
-from .help_formatter import SimpleHelpFormatter
-from .helpers.serialization.serializable import read_file
+from .compiled_parser import CompiledParser
+from .conflicts import ConflictResolution, ConflictResolver, unflatten
+from .help_formatter import SimpleHelpFormatter, resolve_lazy_help
+from .parse_stats import ParseStats, collect_stats, track, tracked, untracked
+from .parser_cache import ParserCache
 from .utils import (
     Dataclass,
     DataclassT,
@@ -42,6 +48,38 @@ class ParsingError(RuntimeError, SystemExit):
     pass
 
 
+class _ArgumentsNotReusableError(ParsingError):
+    """Raised when the arguments of a parser were added for other subgroups or config files."""
+
+
+T = TypeVar("T")
+
+# Set when parsing many lists of arguments: errors are then raised as `ParsingError`s, rather than
+# printing the usage and exiting.
+_raise_parsing_errors: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "raise_parsing_errors", default=False
+)
+# The messages (e.g. the help) printed while parsing one of many lists of arguments. They are
+# reported in the error raised by `exit` (e.g. after `--help`), rather than printed.
+_printed_messages: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "printed_messages", default=None
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ParseResult(Generic[T]):
+    """The result of parsing one of the lists of command-line arguments given to `parse_many`."""
+
+    args: list[str]
+    """The command-line arguments that were parsed."""
+
+    value: T | None = None
+    """The parsed value (the namespace or the config), or None if there was an error."""
+
+    error: ParsingError | None = None
+    """The error that would have made the program exit, if any."""
+
+
 class ArgumentParser(argparse.ArgumentParser):
     """Creates an ArgumentParser instance.
 
@@ -107,6 +145,20 @@ class ArgumentParser(argparse.ArgumentParser):
         When `add_config_path_arg` is also set the defaults are first updated using `config_path`, and then
         updated with the contents of the `--config_path` file(s). By setting this value it will be default set
         `add_config_path_arg` to True.
+
+    - cache_dir: str, Path, optional
+        Directory of an opt-in, persistent cache of the resolved arguments of this parser.
+        When set, the option strings, help strings and group descriptions that are resolved when
+        the arguments are first added to the parser are saved in this directory, and are reused by
+        later runs, instead of resolving conflicts and reading the source code of the dataclasses
+        again. The cache entries are keyed on the dataclass types, their source files (path,
+        modification time and size) and the options of the parser.
+
+    - collect_stats: bool, optional
+        When set to `True`, the wall time and number of calls of each phase of parsing (loading
+        config files, resolving conflicts and subgroups, running argparse, creating the
+        dataclasses, etc.) are recorded in `parser.stats`, a `ParseStats` object. See
+        `simple_parsing.parse_stats` for more info.
     """
 
     def __init__(
@@ -122,6 +174,8 @@ class ArgumentParser(argparse.ArgumentParser):
         add_config_path_arg: bool | str | None = None,
         config_path: Path | str | Sequence[Path | str] | None = None,
         add_dest_to_option_strings: bool | None = None,
+        cache_dir: Path | str | None = None,
+        collect_stats: bool = False,
         **kwargs,
     ):
         kwargs["formatter_class"] = formatter_class
@@ -137,18 +191,25 @@ class ArgumentParser(argparse.ArgumentParser):
 
         self._conflict_resolver = ConflictResolver(self.conflict_resolution)
         self._wrappers: list[DataclassWrapper] = []
+        self._parser_cache = ParserCache(cache_dir) if cache_dir is not None else None
+        self.stats: ParseStats | None = ParseStats() if collect_stats else None
 
         if add_dest_to_option_strings:
             argument_generation_mode = ArgumentGenerationMode.BOTH
 
         self._preprocessing_done: bool = False
+        # The subgroups that were chosen and the config path that was passed when the arguments
+        # were added. Used to check that `parse_many` can reuse the arguments.
+        self._chosen_subgroups: dict[str, SubgroupKey] = {}
+        self._prepared_config_path: Any = None
+        # The parser used to read the config path argument, created when first needed.
+        self._config_path_parser: ArgumentParser | None = None
+        # Set once the parser is compiled, after which no arguments can be added.
+        self._compiled: bool = False
         self.add_option_string_dash_variants = add_option_string_dash_variants
         self.argument_generation_mode = argument_generation_mode
         self.nested_mode = nested_mode
 
-        FieldWrapper.add_dash_variants = add_option_string_dash_variants
-        FieldWrapper.argument_generation_mode = argument_generation_mode
-        FieldWrapper.nested_mode = nested_mode
         self._parents = tuple(parents)
 
         self.add_help = add_help
@@ -175,11 +236,16 @@ class ArgumentParser(argparse.ArgumentParser):
         *name_or_flags: str,
         **kwargs,
     ) -> Action:
+        self._check_not_compiled()
         return super().add_argument(
             *name_or_flags,
             **kwargs,
         )
 
+    def _check_not_compiled(self) -> None:
+        if self._compiled:
+            raise RuntimeError("Can't add arguments to a parser after it was compiled.")
+
     @overload
     def add_arguments(
         self,
@@ -253,6 +319,7 @@ class ArgumentParser(argparse.ArgumentParser):
         The generated DataclassWrapper instance. Feel free to inspect / play around with this if
         you want :)
         """
+        self._check_not_compiled()
         if is_dataclass_instance(dataclass):
             if default is not None:
                 raise ValueError("Can't use `default` when `dataclass` is a dataclass instance.")
@@ -297,6 +364,39 @@ class ArgumentParser(argparse.ArgumentParser):
         # default Namespace built from parser defaults
         if namespace is None:
             namespace = Namespace()
+        with self._collecting_stats(), track("parse_known_args"):
+            args = self._prepare(args, namespace)
+
+            logger.debug(f"Parser {id(self)} is parsing args: {args}, namespace: {namespace}")
+            with track("argparse"):
+                parsed_args, unparsed_args = super().parse_known_args(args, namespace)
+
+            if unparsed_args and self._subparsers and attempt_to_reorder:
+                logger.warning(
+                    f"Unparsed arguments when using subparsers. Will "
+                    f"attempt to automatically re-order the unparsed arguments "
+                    f"{unparsed_args}."
+                )
+                index_in_start = args.index(unparsed_args[0])
+                # Simply 'cycle' the args to the right ordering.
+                new_start_args = args[index_in_start:] + args[:index_in_start]
+                with track("argparse"):
+                    parsed_args, unparsed_args = super().parse_known_args(new_start_args)
+
+            parsed_args = self._postprocessing(parsed_args)
+        return parsed_args, unparsed_args
+
+    def _collecting_stats(self) -> contextlib.AbstractContextManager[Any]:
+        """Records the stats of the parsing done in this block in `self.stats`, if enabled."""
+        if self.stats is None:
+            return contextlib.nullcontext()
+        return collect_stats(self.stats)
+
+    def _prepare(self, args: list[str], namespace: Namespace | None = None) -> list[str]:
+        """Applies the config files and adds all the arguments, if this wasn't already done.
+
+        Returns the command-line arguments, without the ones for the config path argument.
+        """
         if self.config_path:
             if isinstance(self.config_path, Path):
                 config_paths = [self.config_path]
@@ -306,61 +406,195 @@ class ArgumentParser(argparse.ArgumentParser):
                 self.set_defaults(config_file)
 
         if self.add_config_path_arg:
-            config_path_name = (
-                self.add_config_path_arg
-                if isinstance(self.add_config_path_arg, str)
-                else "config_path"
-            )
+            config_path, args = self._parse_config_path_arg(args)
+            if config_path is not None:
+                config_paths = config_path if isinstance(config_path, list) else [config_path]
+                for config_file in config_paths:
+                    self.set_defaults(config_file)
+
+            config_path_option = f"--{self._config_path_arg_name}"
+            if not self._preprocessing_done:
+                self._prepared_config_path = config_path
+            if config_path_option not in self._option_string_actions:
+                # Adding it here just so it shows up in the help message. The default will be set
+                # in the help string.
+                self.add_argument(
+                    config_path_option,
+                    type=Path,
+                    default=config_path,
+                    help="Path to a config file containing default values to use.",
+                )
+
+        assert isinstance(args, list)
+        self._preprocessing(args=args, namespace=namespace)
+        return args
+
+    @property
+    def _config_path_arg_name(self) -> str:
+        if isinstance(self.add_config_path_arg, str):
+            return self.add_config_path_arg
+        return "config_path"
+
+    def _parse_config_path_arg(self, args: list[str]) -> tuple[Any, list[str]]:
+        """Returns the value of the config path argument, and the rest of the arguments."""
+        # NOTE: The temporary parser is reused, since `parse_many` reads the config path of each
+        # list of arguments.
+        temp_parser = self._config_path_parser
+        if temp_parser is None:
             temp_parser = ArgumentParser(
                 add_config_path_arg=False,
                 add_help=False,
-                add_option_string_dash_variants=FieldWrapper.add_dash_variants,
-                argument_generation_mode=FieldWrapper.argument_generation_mode,
-                nested_mode=FieldWrapper.nested_mode,
+                add_option_string_dash_variants=self.add_option_string_dash_variants,
+                argument_generation_mode=self.argument_generation_mode,
+                nested_mode=self.nested_mode,
             )
             temp_parser.add_argument(
-                f"--{config_path_name}",
+                f"--{self._config_path_arg_name}",
                 type=Path,
                 nargs="*",
                 default=self.config_path,
                 help="Path to a config file containing default values to use.",
             )
+            self._config_path_parser = temp_parser
+        # NOTE: The phases of the temporary parser aren't recorded with the phases of this one.
+        with track("parse_config_path_arg"), untracked():
             args_with_config_path, args = temp_parser.parse_known_args(args)
-            config_path = getattr(args_with_config_path, config_path_name.replace("-", "_"))
-
-            if config_path is not None:
-                config_paths = config_path if isinstance(config_path, list) else [config_path]
-                for config_file in config_paths:
-                    self.set_defaults(config_file)
-
-            # Adding it here just so it shows up in the help message. The default will be set in
-            # the help string.
-            self.add_argument(
-                f"--{config_path_name}",
-                type=Path,
-                default=config_path,
-                help="Path to a config file containing default values to use.",
-            )
-
-        assert isinstance(args, list)
-        self._preprocessing(args=args, namespace=namespace)
+        config_path = getattr(args_with_config_path, self._config_path_arg_name.replace("-", "_"))
+        return config_path, args
 
-        logger.debug(f"Parser {id(self)} is parsing args: {args}, namespace: {namespace}")
-        parsed_args, unparsed_args = super().parse_known_args(args, namespace)
+    def parse_many(
+        self,
+        args_list: Iterable[str | Sequence[str]],
+        namespace: Namespace | None = None,
+    ) -> list[ParseResult[Namespace]]:
+        """Parses each list of command-line arguments, adding the arguments to the parser once.
+
+        This is equivalent to calling `parse_args` on each list of arguments (with a new parser
+        each time), but much faster when parsing many of them. The parser isn't modified while
+        parsing, and instead of printing the usage and exiting, the errors are returned in the
+        results, which are in the same order as the lists of arguments.
+
+        NOTE: The arguments are added for the subgroups and config files chosen in the first list
+        of arguments (or in the previous call to `parse_args`). Lists of arguments that choose
+        other subgroups or config files can't reuse these arguments, and are reported as errors.
+        Use `simple_parsing.parse_many` to also parse these.
+        """
+        return list(self.iter_parse_many(args_list, namespace=namespace))
 
-        if unparsed_args and self._subparsers and attempt_to_reorder:
-            logger.warning(
-                f"Unparsed arguments when using subparsers. Will "
-                f"attempt to automatically re-order the unparsed arguments "
-                f"{unparsed_args}."
+    def iter_parse_many(
+        self,
+        args_list: Iterable[str | Sequence[str]],
+        namespace: Namespace | None = None,
+    ) -> Iterator[ParseResult[Namespace]]:
+        """Same as `parse_many`, but yields the result of each list of arguments once parsed."""
+        for args in args_list:
+            yield self._parse_one(args, namespace=namespace)
+
+    def _parse_one(
+        self, args: str | Sequence[str], namespace: Namespace | None = None
+    ) -> ParseResult[Namespace]:
+        args = shlex.split(args) if isinstance(args, str) else list(args)
+        namespace = copy.copy(namespace) if namespace is not None else Namespace()
+        token = _raise_parsing_errors.set(True)
+        messages_token = _printed_messages.set([])
+        try:
+            with self._collecting_stats(), track("parse_many"):
+                if self._preprocessing_done:
+                    parsed_args, unparsed_args = self._parse_known_args_prepared(args, namespace)
+                else:
+                    remaining_args = self._prepare(args, namespace)
+                    with track("argparse"):
+                        parsed_args, unparsed_args = super().parse_known_args(
+                            remaining_args, namespace
+                        )
+                    parsed_args = self._postprocessing(parsed_args)
+            if unparsed_args:
+                self.error(_("unrecognized arguments: %s") % " ".join(unparsed_args))
+            return ParseResult(args, value=parsed_args)
+        except ParsingError as error:
+            return ParseResult(args, error=error)
+        finally:
+            _printed_messages.reset(messages_token)
+            _raise_parsing_errors.reset(token)
+
+    def _parse_known_args_prepared(
+        self, args: list[str], namespace: Namespace
+    ) -> tuple[Namespace, list[str]]:
+        """Parses the arguments without modifying the parser, once all arguments were added."""
+        args = self._check_can_reuse_arguments(args)
+        with track("argparse"):
+            parsed_args, unparsed_args = super().parse_known_args(args, namespace)
+        return self._postprocessing(parsed_args), unparsed_args
+
+    def compile(self, args: Sequence[str] = ()) -> CompiledParser:
+        """Adds all the arguments, and returns a frozen version of this parser.
+
+        The returned `CompiledParser` can be used to parse arguments from multiple threads at the
+        same time. The arguments are added for the subgroups and config files chosen in `args`.
+        No arguments can be added to this parser afterwards.
+        """
+        with self._collecting_stats(), track("compile"):
+            self._prepare(list(args))
+        # The subgroups that were chosen become the defaults, since they can't be changed anymore.
+        for action in self._get_subgroup_actions():
+            action.default = self._chosen_subgroups[action.dest]
+        self._compiled = True
+        return CompiledParser(self)
+
+    def _check_can_reuse_arguments(self, args: list[str]) -> list[str]:
+        """Checks that `args` choose the same config files and subgroups as when the arguments were
+        added.
+
+        Returns the arguments without the config path argument. Raises a `ParsingError` otherwise.
+        """
+        if self.add_config_path_arg:
+            config_path, args = self._parse_config_path_arg(args)
+            if config_path != self._prepared_config_path:
+                raise _ArgumentsNotReusableError(
+                    f"Can't reuse the arguments of this parser: they were added using the config "
+                    f"path {self._prepared_config_path}, not {config_path}."
+                )
+        chosen_subgroups = self._get_chosen_subgroups(args)
+        if chosen_subgroups != self._chosen_subgroups:
+            raise _ArgumentsNotReusableError(
+                f"Can't reuse the arguments of this parser: they were added for the subgroups "
+                f"{self._chosen_subgroups}, not {chosen_subgroups}."
             )
-            index_in_start = args.index(unparsed_args[0])
-            # Simply 'cycle' the args to the right ordering.
-            new_start_args = args[index_in_start:] + args[:index_in_start]
-            parsed_args, unparsed_args = super().parse_known_args(new_start_args)
-
-        parsed_args = self._postprocessing(parsed_args)
-        return parsed_args, unparsed_args
+        return args
+
+    def _get_subgroup_actions(self) -> list[Action]:
+        return [
+            self._option_string_actions[field.option_strings[0]]
+            for field in _get_subgroup_fields(self._wrappers).values()
+        ]
+
+    def _get_chosen_subgroups(self, args: list[str]) -> dict[str, SubgroupKey]:
+        """Returns the choice for each of the subgroups that the arguments were added for."""
+        actions = self._get_subgroup_actions()
+        if not actions:
+            return {}
+        option_values = _OptionValues(args, self)
+        parsed_args = _parse_subgroup_choices(self, actions, option_values, Namespace())
+        return {action.dest: getattr(parsed_args, action.dest) for action in actions}
+
+    def error(self, message: str) -> NoReturn:
+        if _raise_parsing_errors.get():
+            raise ParsingError(message)
+        super().error(message)
+
+    def exit(self, status: int = 0, message: str | None = None) -> NoReturn:
+        messages = _printed_messages.get()
+        if messages is not None:
+            # e.g. `--help` or `--version` in one of the lists of arguments given to `parse_many`.
+            raise ParsingError("".join([*messages, message or ""]))
+        super().exit(status, message)
+
+    def _print_message(self, message: str, file: IO[str] | None = None) -> None:
+        messages = _printed_messages.get()
+        if messages is not None:
+            messages.append(message)
+            return
+        super()._print_message(message, file)
 
     def add_argument_group(
         self,
@@ -382,10 +616,22 @@ class ArgumentParser(argparse.ArgumentParser):
         self._preprocessing(args=list(args) if args else [])
         return super().print_help(file)
 
+    def format_help(self) -> str:
+        # The help strings and group descriptions taken from docstrings are only retrieved now.
+        for action in self._actions:
+            action.help = resolve_lazy_help(action.help)
+        for action_group in self._action_groups:
+            action_group.description = resolve_lazy_help(action_group.description)
+        return super().format_help()
+
+    @tracked("set_defaults")
     def set_defaults(self, config_path: str | Path | None = None, **kwargs: Any) -> None:
         """Set the default argument values, either from a config file, or from the given kwargs."""
+        from .helpers.serialization.serializable import read_file
+
         if config_path:
-            defaults = read_file(config_path)
+            # NOTE: The config files are usually read again each time the parser is used.
+            defaults = read_file(config_path, cache=True)
             if self.nested_mode == NestedMode.WITHOUT_ROOT and len(self._wrappers) == 1:
                 # The file should have the same format as the command-line args, e.g. contain the
                 # fields of the 'root' dataclass directly (e.g. "foo: 123"), rather a dict with
@@ -404,7 +650,7 @@ class ArgumentParser(argparse.ArgumentParser):
                 default_for_dataclass = kwargs[wrapper.dest]
 
                 if isinstance(default_for_dataclass, (str, Path)):
-                    default_for_dataclass = read_file(path=default_for_dataclass)
+                    default_for_dataclass = read_file(path=default_for_dataclass, cache=True)
                 elif not isinstance(default_for_dataclass, dict) and not dataclasses.is_dataclass(
                     default_for_dataclass
                 ):
@@ -502,6 +748,13 @@ class ArgumentParser(argparse.ArgumentParser):
             parent=parent,
             dataclass_fn=dataclass_fn,
         )
+        # The settings of this parser are stored on the fields, rather than on the FieldWrapper
+        # class, so that parsers with different settings can be used at the same time.
+        for wrapper in [new_wrapper, *new_wrapper.descendants]:
+            for field_wrapper in wrapper.fields:
+                field_wrapper.add_dash_variants = self.add_option_string_dash_variants
+                field_wrapper.argument_generation_mode = self.argument_generation_mode
+                field_wrapper.nested_mode = self.nested_mode
 
         if new_wrapper.dest in self._defaults:
             new_wrapper.set_default(self._defaults[new_wrapper.dest])
@@ -520,6 +773,7 @@ class ArgumentParser(argparse.ArgumentParser):
 
         return new_wrapper
 
+    @tracked("preprocessing")
     def _preprocessing(self, args: Sequence[str] = (), namespace: Namespace | None = None) -> None:
         """Resolve potential conflicts, resolve subgroups, and add all the arguments."""
         logger.debug("\nPREPROCESSING\n")
@@ -530,29 +784,56 @@ class ArgumentParser(argparse.ArgumentParser):
         args = list(args)
 
         wrapped_dataclasses = self._wrappers.copy()
-        # Fix the potential conflicts between dataclass fields with the same names.
-        wrapped_dataclasses = self._conflict_resolver.resolve_and_flatten(wrapped_dataclasses)
-
-        wrapped_dataclasses, chosen_subgroups = self._resolve_subgroups(
-            wrappers=wrapped_dataclasses, args=args, namespace=namespace
-        )
+        cache_key: str | None = None
+        if self._parser_cache is not None:
+            cache_key = self._parser_cache.get_key(self, wrapped_dataclasses)
+        if cache_key is not None and self._parser_cache.restore(
+            cache_key, _flatten_wrappers(wrapped_dataclasses)
+        ):
+            # The conflicts were already resolved in a previous run.
+            wrapped_dataclasses = _flatten_wrappers(wrapped_dataclasses)
+        else:
+            # Fix the potential conflicts between dataclass fields with the same names.
+            wrapped_dataclasses = self._conflict_resolver.resolve_and_flatten(wrapped_dataclasses)
+            if cache_key is not None:
+                self._parser_cache.store(cache_key, wrapped_dataclasses)
+
+        # Undo the changes to the tree of wrappers if the subgroups can't be resolved, so that the
+        # arguments can still be added later (e.g. for the next arguments in `parse_many`).
+        children = {wrapper: wrapper._children.copy() for wrapper in wrapped_dataclasses}
+        prefixes = {
+            field: field.prefix for wrapper in wrapped_dataclasses for field in wrapper.fields
+        }
+        try:
+            wrapped_dataclasses, chosen_subgroups = self._resolve_subgroups(
+                wrappers=wrapped_dataclasses, args=args, namespace=namespace
+            )
+        except SystemExit:
+            for wrapper, wrapper_children in children.items():
+                wrapper._children[:] = wrapper_children
+            for field, prefix in prefixes.items():
+                field.prefix = prefix
+            raise
 
         # NOTE: We keep the subgroup fields in their dataclasses so they show up with the other
         # arguments.
         wrapped_dataclasses = _flatten_wrappers(wrapped_dataclasses)
 
         # Create one argument group per dataclass
-        for wrapped_dataclass in wrapped_dataclasses:
-            logger.debug(
-                f"Parser {id(self)} is Adding arguments for dataclass: {wrapped_dataclass.dataclass} "
-                f"at destinations {wrapped_dataclass.destinations}"
-            )
-            wrapped_dataclass.add_arguments(parser=self)
+        with track("add_arguments"):
+            for wrapped_dataclass in wrapped_dataclasses:
+                logger.debug(
+                    f"Parser {id(self)} is Adding arguments for dataclass: "
+                    f"{wrapped_dataclass.dataclass} at destinations {wrapped_dataclass.destinations}"
+                )
+                wrapped_dataclass.add_arguments(parser=self)
 
         self._wrappers = wrapped_dataclasses
+        self._chosen_subgroups = chosen_subgroups
         # Save this so we don't re-add all the arguments.
         self._preprocessing_done = True
 
+    @tracked("postprocessing")
     def _postprocessing(self, parsed_args: Namespace) -> Namespace:
         """Process the namespace by extract the fields and creating the objects.
 
@@ -583,7 +864,10 @@ class ArgumentParser(argparse.ArgumentParser):
         # the relevant attributes from `parsed_args`
         wrappers = _flatten_wrappers(self._wrappers)
 
-        constructor_arguments = self.constructor_arguments.copy()
+        # NOTE: The dicts are copied, so that the parser can be reused (e.g. in `parse_many`).
+        constructor_arguments = {
+            dest: arguments.copy() for dest, arguments in self.constructor_arguments.items()
+        }
         for wrapper in wrappers:
             for destination in wrapper.destinations:
                 constructor_arguments.setdefault(destination, {})
@@ -596,6 +880,7 @@ class ArgumentParser(argparse.ArgumentParser):
         )
         return parsed_args
 
+    @tracked("resolve_subgroups")
     def _resolve_subgroups(
         self,
         wrappers: list[DataclassWrapper],
@@ -645,6 +930,13 @@ class ArgumentParser(argparse.ArgumentParser):
             allow_abbrev=False,
         )
 
+        # The command-line arguments are only tokenized once. At each nesting level, the values of
+        # the subgroup arguments are looked up, rather than parsing all the arguments again.
+        option_values = _OptionValues(args, subgroup_choice_parser)
+        # The option strings of the fields are also indexed once, and the index is updated with
+        # the fields of the chosen subgroups at each nesting level.
+        option_string_index = None
+
         for current_nesting_level in itertools.count():
             # Do rounds of parsing with just the subgroup arguments, until all the subgroups
             # are resolved to a dataclass type.
@@ -652,9 +944,12 @@ class ArgumentParser(argparse.ArgumentParser):
                 f"Starting subgroup parsing round {current_nesting_level}: {list(unresolved_subgroups.keys())}"
             )
             # Add all the unresolved subgroups arguments.
+            subgroup_actions: list[Action] = []
             for dest, subgroup_field in unresolved_subgroups.items():
                 flags = subgroup_field.option_strings
-                argument_options = subgroup_field.arg_options
+                argument_options = subgroup_field.arg_options.copy()
+                # The help isn't displayed by this parser, no need to retrieve the docstring.
+                argument_options.pop("help", None)
 
                 if subgroup_field.subgroup_default is dataclasses.MISSING:
                     assert argument_options["required"]
@@ -670,15 +965,18 @@ class ArgumentParser(argparse.ArgumentParser):
                 logger.debug(
                     f"Adding subgroup argument: add_argument(*{flags} **{str(argument_options)})"
                 )
-                subgroup_choice_parser.add_argument(*flags, **argument_options)
+                subgroup_actions.append(
+                    subgroup_choice_parser.add_argument(*flags, **argument_options)
+                )
 
-            # Parse `args` repeatedly until all the subgroup choices are resolved.
-            parsed_args, unused_args = subgroup_choice_parser.parse_known_args(
-                args=args, namespace=namespace
+            parsed_args = _parse_subgroup_choices(
+                subgroup_choice_parser,
+                subgroup_actions,
+                option_values,
+                namespace=namespace if namespace is not None else argparse.Namespace(),
             )
             logger.debug(
-                f"Nesting level {current_nesting_level}: args: {args}, "
-                f"parsed_args: {parsed_args}, unused_args: {unused_args}"
+                f"Nesting level {current_nesting_level}: args: {args}, parsed_args: {parsed_args}"
             )
 
             for dest, subgroup_field in list(unresolved_subgroups.items()):
@@ -735,8 +1033,6 @@ class ArgumentParser(argparse.ArgumentParser):
                 assert new_wrapper not in parent_dataclass_wrapper._children
                 parent_dataclass_wrapper._children.append(new_wrapper)
                 assert new_wrapper.parent is parent_dataclass_wrapper
-                assert parent_dataclass_wrapper in _flatten_wrappers(wrappers)
-                assert new_wrapper in _flatten_wrappers(wrappers)
 
                 # Mark this subgroup as resolved.
                 unresolved_subgroups.pop(dest)
@@ -751,7 +1047,10 @@ class ArgumentParser(argparse.ArgumentParser):
             # For now, I'm just going to wait and see how this plays out. I'm hoping that the
             # auto conflict resolution shouldn't run into any issues in this case.
 
-            wrappers = self._conflict_resolver.resolve(wrappers)
+            wrappers_flat, option_string_index = self._conflict_resolver._resolve_and_flatten(
+                wrappers, option_string_index
+            )
+            wrappers = unflatten(wrappers_flat)
 
             all_subgroup_fields = _get_subgroup_fields(wrappers)
             unresolved_subgroups = {
@@ -791,6 +1090,7 @@ class ArgumentParser(argparse.ArgumentParser):
             parsed_args.subgroups[dest] = chosen_value
             delattr(parsed_args, dest)
 
+    @tracked("instantiate_dataclasses")
     def _instantiate_dataclasses(
         self,
         parsed_args: argparse.Namespace,
@@ -908,6 +1208,7 @@ class ArgumentParser(argparse.ArgumentParser):
 
         return parsed_args
 
+    @tracked("fill_constructor_arguments")
     def _fill_constructor_arguments_with_fields(
         self,
         parsed_args: argparse.Namespace,
@@ -1049,6 +1350,112 @@ def parse(
     return config
 
 
+def parse_many(
+    config_class: type[DataclassT],
+    args_list: Iterable[str | Sequence[str]],
+    config_path: Path | str | None = None,
+    default: DataclassT | None = None,
+    dest: str = "config",
+    *,
+    prefix: str = "",
+    nested_mode: NestedMode = NestedMode.WITHOUT_ROOT,
+    conflict_resolution: ConflictResolution = ConflictResolution.AUTO,
+    add_option_string_dash_variants: DashVariant = DashVariant.AUTO,
+    argument_generation_mode=ArgumentGenerationMode.FLAT,
+    formatter_class: type[HelpFormatter] = SimpleHelpFormatter,
+    add_config_path_arg: bool | str | None = None,
+    **kwargs,
+) -> list[ParseResult[DataclassT]]:
+    """Parse the given dataclass from each list of command-line arguments.
+
+    This gives the same configs as calling `parse` on each list of arguments, but only creates one
+    parser for each combination of subgroups and config files that is chosen in the arguments.
+    Instead of exiting, the errors are returned in the results, which are in the same order as the
+    lists of arguments.
+    """
+    if dest == add_config_path_arg:
+        raise ValueError("`add_config_path_arg` cannot be the same as `dest`.")
+
+    def _new_parser() -> ArgumentParser:
+        parser = ArgumentParser(
+            nested_mode=nested_mode,
+            add_help=False,
+            config_path=config_path,
+            conflict_resolution=conflict_resolution,
+            add_option_string_dash_variants=add_option_string_dash_variants,
+            argument_generation_mode=argument_generation_mode,
+            formatter_class=formatter_class,
+            add_config_path_arg=add_config_path_arg,
+            **kwargs,
+        )
+        parser.add_arguments(config_class, prefix=prefix, dest=dest, default=default)
+        return parser
+
+    # Used to read the config path and the subgroup options of each list of arguments.
+    key_parser = _new_parser()
+    # The parsers whose arguments were added, for each config path.
+    parsers: dict[Any, list[ArgumentParser]] = defaultdict(list)
+    # The option strings of the subgroups of all the parsers.
+    subgroup_option_strings: list[str] = []
+    # The parser to use for each (config path, values given to the subgroup options). The same
+    # values always choose the same subgroups, as long as the subgroup options don't change.
+    parser_for_key: dict[tuple[Any, tuple], ArgumentParser] = {}
+
+    results: list[ParseResult[DataclassT]] = []
+    for args in args_list:
+        args = shlex.split(args) if isinstance(args, str) else list(args)
+        try:
+            key = _parse_many_key(key_parser, args, subgroup_option_strings)
+        except ParsingError as error:
+            results.append(ParseResult(args, error=error))
+            continue
+        parser = parser_for_key.get(key)
+        if parser is not None:
+            result = parser._parse_one(args)
+        else:
+            config_path_key = key[0]
+            for parser in parsers[config_path_key]:
+                result = parser._parse_one(args)
+                if not isinstance(result.error, _ArgumentsNotReusableError):
+                    parser_for_key[key] = parser
+                    break
+            else:
+                parser = _new_parser()
+                result = parser._parse_one(args)
+                if parser._preprocessing_done:
+                    parsers[config_path_key].append(parser)
+                    # The keys that were computed without the options of the new subgroups can't
+                    # be used anymore.
+                    subgroup_option_strings = sorted(
+                        set(subgroup_option_strings).union(
+                            option_string
+                            for action in parser._get_subgroup_actions()
+                            for option_string in action.option_strings
+                        )
+                    )
+                    parser_for_key = {}
+        config = getattr(result.value, dest) if result.value is not None else None
+        results.append(ParseResult(args, value=config, error=result.error))
+    return results
+
+
+def _parse_many_key(
+    parser: ArgumentParser, args: list[str], subgroup_option_strings: Sequence[str]
+) -> tuple[Any, tuple]:
+    """Returns the config path and the values given to the subgroup options in `args`."""
+    config_path: Any = None
+    if parser.add_config_path_arg:
+        token = _raise_parsing_errors.set(True)
+        try:
+            config_path, args = parser._parse_config_path_arg(args)
+        finally:
+            _raise_parsing_errors.reset(token)
+        if isinstance(config_path, list):
+            config_path = tuple(config_path)
+    option_values = _OptionValues(args, parser)
+    return config_path, option_values.get_all(subgroup_option_strings)
+
+
 def parse_known_args(
     config_class: type[Dataclass],
     config_path: Path | str | None = None,
@@ -1094,6 +1501,144 @@ def parse_known_args(
     return config, unknown_args
 
 
+class _OptionValues:
+    """The values given to each option in the command-line arguments, which are tokenized once.
+
+    This reads options that take a single value the same way argparse does, without having to know
+    all the options in advance: `--option value`, `--option=value` and `-ovalue` are supported, and
+    the arguments after `--` are ignored.
+    """
+
+    def __init__(self, args: Sequence[str], parser: argparse.ArgumentParser):
+        self._prefix_chars = parser.prefix_chars
+        self._negative_number_matcher = parser._negative_number_matcher
+        self._has_negative_number_optionals = bool(parser._has_negative_number_optionals)
+        # option string -> list of (position in args, value, or None if the value is missing).
+        self._values: dict[str, list[tuple[int, str | None]]] = defaultdict(list)
+        # short option string -> list of (position, value, full argument) for `-ovalue`.
+        self._short_values: dict[str, list[tuple[int, str, str]]] = defaultdict(list)
+        args = list(args)
+        for position, arg in enumerate(args):
+            if arg == "--":
+                break
+            if not self._is_option(arg):
+                continue
+            if "=" in arg:
+                option_string, _, value = arg.partition("=")
+                self._values[option_string].append((position, value))
+                continue
+            next_arg = args[position + 1] if position + 1 < len(args) else None
+            if next_arg is not None and not self._is_option(next_arg):
+                self._values[arg].append((position, next_arg))
+            else:
+                self._values[arg].append((position, None))
+            if arg[1] not in self._prefix_chars and len(arg) > 2:
+                self._short_values[arg[:2]].append((position, arg[2:], arg))
+
+    def _is_option(self, arg: str) -> bool:
+        """Returns whether argparse would consider this argument an option (not a value).
+
+        This follows `ArgumentParser._parse_optional`. Since the options aren't all known, an
+        argument with a "=" is always considered an option, like argparse does when the part before
+        the "=" is a known option string.
+        """
+        if len(arg) < 2 or arg[0] not in self._prefix_chars:
+            return False
+        if "=" in arg:
+            return True
+        if self._negative_number_matcher.match(arg) and not self._has_negative_number_optionals:
+            return False
+        return " " not in arg
+
+    def get(
+        self, option_strings: Sequence[str], known_option_strings: Container[str]
+    ) -> list[tuple[int, str | None]]:
+        """Returns the (position, value) pairs given to any of these option strings, in order."""
+        values = [value for option in option_strings for value in self._values.get(option, [])]
+        for option in option_strings:
+            values.extend(
+                (position, value)
+                for position, value, arg in self._short_values.get(option, [])
+                # argparse prefers an exact match with another option string.
+                if arg not in known_option_strings
+            )
+        return sorted(values)
+
+    def get_all(self, option_strings: Sequence[str]) -> tuple[tuple[str, str | None, str], ...]:
+        """Returns all the values given to these option strings, in order, without positions.
+
+        Two lists of arguments that give the same values to the same options (in the same order)
+        choose the same subgroups.
+        """
+        values = [
+            (position, option, value, option)
+            for option in option_strings
+            for position, value in self._values.get(option, [])
+        ]
+        values.extend(
+            (position, option, value, arg)
+            for option in option_strings
+            for position, value, arg in self._short_values.get(option, [])
+        )
+        values.sort(key=lambda value: value[0])
+        return tuple(value[1:] for value in values)
+
+
+def _parse_subgroup_choices(
+    parser: argparse.ArgumentParser,
+    actions: list[Action],
+    option_values: _OptionValues,
+    namespace: Namespace,
+) -> Namespace:
+    """Sets the chosen subgroups on the namespace, like `parser.parse_known_args` would.
+
+    Uses the parser to convert and check the values, and to report errors.
+    """
+    for action in actions:
+        if action.default is not SUPPRESS and not hasattr(namespace, action.dest):
+            setattr(namespace, action.dest, action.default)
+
+    known_option_strings = parser._option_string_actions
+    occurrences = sorted(
+        (position, index, value)
+        for index, action in enumerate(actions)
+        for position, value in option_values.get(action.option_strings, known_option_strings)
+    )
+    seen_actions: set[int] = set()
+    for _position, index, value in occurrences:
+        action = actions[index]
+        try:
+            if value is None:
+                raise argparse.ArgumentError(action, _("expected one argument"))
+            setattr(namespace, action.dest, parser._get_values(action, [value]))
+        except argparse.ArgumentError as err:
+            _error(parser, str(err))
+        seen_actions.add(index)
+
+    required_actions: list[str] = []
+    for index, action in enumerate(actions):
+        if index in seen_actions:
+            continue
+        if action.required:
+            required_actions.append(argparse._get_action_name(action) or action.dest)
+        elif (
+            isinstance(action.default, str)
+            and hasattr(namespace, action.dest)
+            and action.default is getattr(namespace, action.dest)
+        ):
+            setattr(namespace, action.dest, parser._get_value(action, action.default))
+    if required_actions:
+        _error(parser, _("the following arguments are required: %s") % ", ".join(required_actions))
+    return namespace
+
+
+def _error(parser: argparse.ArgumentParser, message: str) -> NoReturn:
+    """Reports the error with the parser, or raises it when parsing many lists of arguments."""
+    if _raise_parsing_errors.get():
+        raise ParsingError(message)
+    parser.error(message)
+
+
 def _get_subgroup_fields(wrappers: list[DataclassWrapper]) -> dict[str, FieldWrapper]:
     subgroup_fields = {}
     all_wrappers = _flatten_wrappers(wrappers)
@@ -1121,7 +1666,7 @@ def _flatten_wrappers(wrappers: list[DataclassWrapper]) -> list[DataclassWrapper
     """Takes a list of nodes, returns a flattened list of all nodes in the tree."""
     _assert_no_duplicates(wrappers)
     roots_only = _unflatten_wrappers(wrappers)
-    return sum(([w] + list(w.descendants) for w in roots_only), [])
+    return list(itertools.chain.from_iterable([w, *w.descendants] for w in roots_only))
 
 
 def _unflatten_wrappers(wrappers: list[DataclassWrapper]) -> list[DataclassWrapper]:
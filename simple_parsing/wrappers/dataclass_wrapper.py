@@ -12,6 +12,7 @@ from typing_extensions import Literal
 
 from simple_parsing import docstring, utils
 from simple_parsing.docstring import dp_parse, inspect_getdoc
+from simple_parsing.help_formatter import LazyHelp
 from simple_parsing.utils import Dataclass, DataclassT, is_dataclass_instance, is_dataclass_type
 from simple_parsing.wrappers.field_wrapper import FieldWrapper
 from simple_parsing.wrappers.wrapper import Wrapper
@@ -65,6 +66,8 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         self._explicit: bool = False
         self._dest: str = ""
         self._children: list[DataclassWrapper] = []
+        # Description of the argument group, when set from the outside (e.g. from a cache).
+        self._description: str | None = None
         # the default value(s).
         # NOTE: This is a list only because of the `ConflictResolution.ALWAYS_MERGE` option.
         self._defaults: list[DataclassT] = [default] if default else []
@@ -185,7 +188,9 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
 
         parser = cast(ArgumentParser, parser)
 
-        group = parser.add_argument_group(title=self.title, description=self.description)
+        group = parser.add_argument_group(
+            title=self.title, description=LazyHelp(lambda: self.description)
+        )
 
         for wrapped_field in self.fields:
             # Note: This should be true since we don't create a FieldWrapper for fields with
@@ -322,6 +327,8 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
 
     @property
     def description(self) -> str:
+        if self._description is not None:
+            return self._description
         if self.parent and self._field:
             doc = docstring.get_attribute_docstring(self.parent.dataclass, self._field.name)
             if doc is not None:
@@ -361,6 +368,10 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
             return shortened_description
         return description
 
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+
     # @property
     # def prefix(self) -> str:
     #     return self._prefix
@@ -2,17 +2,18 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import inspect
 import sys
 import typing
 from collections.abc import Hashable
 from enum import Enum, auto
 from logging import getLogger
-from typing import Any, Callable, ClassVar, Union, cast
+from typing import Any, Callable, Union, cast
 
 from typing_extensions import Literal
 
-from simple_parsing.help_formatter import TEMPORARY_TOKEN
+from simple_parsing.help_formatter import TEMPORARY_TOKEN, LazyHelp, resolve_lazy_help
 
 from .. import docstring, utils
 from ..helpers.custom_actions import BooleanOptionalAction
@@ -88,19 +89,22 @@ class FieldWrapper(Wrapper):
     The `field` argument is the actually wrapped `dataclasses.Field` instance.
     """
 
+    # NOTE: The following are the default settings. The `ArgumentParser` sets its own settings on
+    # each of the fields it wraps, so that parsers with different settings don't interfere.
+
     # Whether or not `simple_parsing` should add option_string variants where
     # underscores in attribute names are replaced with dashes.
     # For example, when set to DashVariant.UNDERSCORE_AND_DASH,
     #   "--no-cache" and "--no_cache" could both
     # be used to point to the same attribute `no_cache` on some dataclass.
     # TODO: This can often make "--help" messages a bit crowded
-    add_dash_variants: ClassVar[DashVariant] = DashVariant.AUTO
+    add_dash_variants: DashVariant = DashVariant.AUTO
 
     # Whether to follow a flat or nested argument structure.
-    argument_generation_mode: ClassVar[ArgumentGenerationMode] = ArgumentGenerationMode.FLAT
+    argument_generation_mode: ArgumentGenerationMode = ArgumentGenerationMode.FLAT
 
     # Controls how nested arguments are generated.
-    nested_mode: ClassVar[NestedMode] = NestedMode.DEFAULT
+    nested_mode: NestedMode = NestedMode.DEFAULT
 
     def __init__(
         self, field: dataclasses.Field, parent: DataclassWrapper | None = None, prefix: str = ""
@@ -114,14 +118,7 @@ class FieldWrapper(Wrapper):
         self._option_strings: set[str] | None = None
         self._required: bool | None = None
 
-        try:
-            self._docstring = docstring.get_attribute_docstring(
-                self.parent.dataclass, self.field.name
-            )
-        except (SystemExit, Exception) as e:
-            logger.debug(f"Couldn't find attribute docstring for field {self.name}, {e}")
-            self._docstring = docstring.AttributeDocString()
-
+        self._attribute_docstring: docstring.AttributeDocString | None = None
         self._help: str | None = None
         self._metavar: str | None = None
         self._default: Any | list[Any] | None = None
@@ -131,9 +128,6 @@ class FieldWrapper(Wrapper):
         self._dest_field: FieldWrapper | None = None
         self._type: type[Any] | None = None
 
-        # stores the resulting values for each of the destination attributes.
-        self._results: dict[str, Any] = {}
-
     @property
     def arg_options(self) -> dict[str, Any]:
         """Dictionary of values to be passed to the `add_argument` method.
@@ -162,6 +156,9 @@ class FieldWrapper(Wrapper):
         options.update(self.custom_arg_options)
         # only keep the arguments used by the Action constructor.
         action = options.get("action", "store")
+        if "help" in options and not (isinstance(action, str) or action is BooleanOptionalAction):
+            # Custom actions might use the help string in their constructor.
+            options["help"] = resolve_lazy_help(options["help"])
         self._arg_options = only_keep_action_args(options, action)
         return self._arg_options
 
@@ -196,8 +193,6 @@ class FieldWrapper(Wrapper):
         else:
             values = [values]
 
-        self._results = {}
-
         for destination, value in zip(self.destinations, values):
             if self.is_subgroup:
                 logger.debug(f"Ignoring the FieldWrapper for subgroup at dest {self.dest}")
@@ -206,8 +201,6 @@ class FieldWrapper(Wrapper):
             parent_dest, attribute = utils.split_dest(destination)
             value = self.postprocess(value)
 
-            self._results[destination] = value
-
             # if destination.endswith(f"_{i}"):
             #     attribute = attribute[:-2]
             #     constructor_arguments[parent_dest][attribute] = value
@@ -250,12 +243,17 @@ class FieldWrapper(Wrapper):
         _arg_options["default"] = self.default
         _arg_options["metavar"] = get_metavar(self.type)
 
-        if self.help:
+        if self._help or self.field.metadata.get("help"):
             _arg_options["help"] = self.help
-        elif self.default is not None:
+        else:
+            # The help comes from the docstring of the field, which is only retrieved when the
+            # help is actually displayed.
             # issue 64: Need to add a temporary 'help' string, so that the formatter
             # automatically adds the (default: '123'). We then remove it.
-            _arg_options["help"] = TEMPORARY_TOKEN
+            default_is_set = self.default is not None
+            _arg_options["help"] = LazyHelp(
+                lambda: self.help or (TEMPORARY_TOKEN if default_is_set else None)
+            )
 
         # TODO: Possible duplication between utils.is_foo(Field) and self.is_foo where foo in
         # [choice, optional, list, tuple, dataclass, etc.]
@@ -590,10 +588,10 @@ class FieldWrapper(Wrapper):
                 dashes.append(dash)
 
         # Handle user passing us "True" or "only" directly.
-        add_dash_variants = DashVariant(FieldWrapper.add_dash_variants)
+        add_dash_variants = DashVariant(self.add_dash_variants)
 
-        gen_mode = type(self).argument_generation_mode
-        nested_mode = type(self).nested_mode
+        gen_mode = self.argument_generation_mode
+        nested_mode = self.nested_mode
 
         dash = "-" if len(self.name) == 1 else "--"
         option = f"{self.prefix}{self.name}"
@@ -666,13 +664,15 @@ class FieldWrapper(Wrapper):
     @property
     def dest(self) -> str:
         """Where the attribute will be stored in the Namespace."""
-        self._dest = super().dest
+        dest = super().dest
         # TODO: If a custom `dest` was passed, and it is a `Field` instance,
         # find the corresponding FieldWrapper and use its `dest` instead of ours.
         if self.dest_field:
-            self._dest = self.dest_field.dest
+            dest = self.dest_field.dest
             self.custom_arg_options.pop("dest", None)
-        return self._dest
+        # NOTE: Only set once computed, since the parser can be used from multiple threads.
+        self._dest = dest
+        return dest
 
     @property
     def is_proxy(self) -> bool:
@@ -830,8 +830,8 @@ class FieldWrapper(Wrapper):
         """Returns the wrapped field's type annotation."""
         # TODO: Refactor this. Really ugly.
         if self._type is None:
-            self._type = self.field.type
-            if isinstance(self._type, str):
+            field_type = self.field.type
+            if isinstance(field_type, str):
                 # The type of the field might be a string when using `from __future__ import annotations`.
                 # NOTE: Here we'd like to convert the fields type to an actual type, in case the
                 # `from __future__ import annotations` feature is used.
@@ -843,9 +843,9 @@ class FieldWrapper(Wrapper):
                 field_type = get_field_type_from_annotations(
                     self.parent.dataclass, self.field.name
                 )
-                self._type = field_type
-            elif isinstance(self._type, dataclasses.InitVar):
-                self._type = self._type.type
+            elif isinstance(field_type, dataclasses.InitVar):
+                field_type = field_type.type
+            self._type = field_type
         return self._type
 
     def __str__(self):
@@ -886,6 +886,18 @@ class FieldWrapper(Wrapper):
             return {(v.name if isinstance(v, Enum) else str(v)): v for v in literal_values}
         return None
 
+    @property
+    def _docstring(self) -> docstring.AttributeDocString:
+        if self._attribute_docstring is None:
+            try:
+                self._attribute_docstring = docstring.get_attribute_docstring(
+                    self.parent.dataclass, self.field.name
+                )
+            except (SystemExit, Exception) as e:
+                logger.debug(f"Couldn't find attribute docstring for field {self.name}, {e}")
+                self._attribute_docstring = docstring.AttributeDocString()
+        return self._attribute_docstring
+
     @property
     def help(self) -> str | None:
         if self._help:
@@ -1004,7 +1016,7 @@ class FieldWrapper(Wrapper):
 
         add_subparser_kwargs = dict(
             title=self.name,
-            description=self.help,
+            description=LazyHelp(lambda: self.help),
             dest=self.dest,
             parser_class=type(parser),
             required=(default_value is dataclasses.MISSING),
@@ -1030,11 +1042,19 @@ class FieldWrapper(Wrapper):
 
     def equivalent_argparse_code(self):
         arg_options = self.arg_options.copy()
+        if "help" in arg_options:
+            arg_options["help"] = resolve_lazy_help(arg_options["help"])
         arg_options_string = f"{{'type': {arg_options.pop('type', str).__qualname__}"
         arg_options_string += str(arg_options).replace("{", ", ").replace(TEMPORARY_TOKEN, " ")
         return f"group.add_argument(*{self.option_strings}, **{arg_options_string})"
 
 
+@functools.cache
+def _get_constructor_argspec(action_class: type[argparse.Action]) -> inspect.FullArgSpec:
+    # Inspecting the signature is slow, and this is done for every field of every parser.
+    return inspect.getfullargspec(action_class)
+
+
 def only_keep_action_args(options: dict[str, Any], action: str | Any) -> dict[str, Any]:
     """Remove all the arguments in `options` that aren't required by the Action.
 
@@ -1071,7 +1091,7 @@ def only_keep_action_args(options: dict[str, Any], action: str | Any) -> dict[st
 
     # Remove all the keys that aren't needed by the action constructor:
     action_class = argparse_action_classes[action]
-    argspec = inspect.getfullargspec(action_class)
+    argspec = _get_constructor_argspec(action_class)
 
     if argspec.varargs is not None or argspec.varkw is not None:
         # if the constructor takes variable arguments, pass all the options.
@@ -26,9 +26,9 @@ class Wrapper(ABC):
     def dest(self) -> str:
         """Where the attribute will be stored in the Namespace."""
         lineage_names: list[str] = [w.name for w in self.lineage()]
-        self._dest = ".".join(reversed([self.name] + lineage_names))
-        assert self._dest is not None
-        return self._dest
+        dest = ".".join(reversed([self.name] + lineage_names))
+        self._dest = dest
+        return dest
 
     def lineage(self) -> list["Wrapper"]:
         lineage: list[Wrapper] = []
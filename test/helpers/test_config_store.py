@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Union
+
+import pytest
+
+from simple_parsing import subgroups
+from simple_parsing.helpers.serialization import ConfigStore
+
+from ..testutils import needs_yaml
+
+
+@dataclass
+class Optimizer:
+    name: str = "adam"
+    lr: float = 1e-3
+    betas: tuple[float, float] = (0.9, 0.999)
+
+
+@dataclass
+class Data:
+    path: str = "data"
+    transforms: list[str] = field(default_factory=lambda: ["crop", "flip"])
+
+
+@dataclass
+class Run:
+    seed: int = 0
+    optimizer: Optimizer = field(default_factory=Optimizer)
+    data: Data = field(default_factory=Data)
+    tags: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Value:
+    value: object = None
+
+
+@dataclass
+class Adam:
+    lr: float = 0.1
+
+
+@dataclass
+class SGD:
+    lr: float = 0.1
+    momentum: float = 0.9
+
+
+@dataclass
+class Experiment:
+    optimizer: Union[Adam, SGD] = field(default_factory=Adam)
+    subgroup: Union[Adam, SGD] = subgroups({"adam": Adam, "sgd": SGD}, default_factory=Adam)
+
+
+@pytest.mark.parametrize("suffix", [".json", pytest.param(".yaml", marks=needs_yaml)])
+def test_identical_subtrees_are_stored_once(tmp_path: Path, suffix: str):
+    store = ConfigStore(tmp_path, suffix=suffix)
+    runs = [Run(seed=i, optimizer=Optimizer(lr=0.1 if i % 2 else 0.01)) for i in range(10)]
+    keys = [store.save(run) for run in runs]
+
+    assert len(set(keys)) == 10
+    # 10 runs, 2 distinct optimizers and one data config.
+    assert len(list(tmp_path.glob(f"*{suffix}"))) == 13
+    assert [store.load(Run, key) for key in keys] == runs
+    # Saving the same run again gives the same key.
+    assert store.save(Run(seed=3, optimizer=Optimizer(lr=0.1))) == keys[3]
+    assert len(list(tmp_path.glob(f"*{suffix}"))) == 13
+
+
+def test_values_of_different_types_have_different_keys(tmp_path: Path):
+    store = ConfigStore(tmp_path)
+    assert store.save(Value(1)) != store.save(Value("1"))
+    assert store.save(Value([1])) == store.save(Value((1,)))
+
+
+def test_loaded_instances_dont_share_values(tmp_path: Path):
+    store = ConfigStore(tmp_path)
+    key = store.save(Run(tags={"a": "b"}))
+    run = store.load(Run, key)
+    run.data.transforms.append("resize")
+    assert store.load(Run, key) == Run(tags={"a": "b"})
+
+
+def test_subtrees_are_read_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    store = ConfigStore(tmp_path)
+    keys = [store.save(Run(seed=i)) for i in range(5)]
+
+    read_keys: list[str] = []
+    read = store._read
+
+    def _read(key: str):
+        read_keys.append(key)
+        return read(key)
+
+    monkeypatch.setattr(store, "_read", _read)
+    assert [store.load(Run, key).seed for key in keys] == list(range(5))
+    # Each run is read, and its optimizer and data configs only once.
+    assert len(read_keys) == 5 + 2
+    assert read_keys[0] == keys[0]
+
+
+def test_reopened_store(tmp_path: Path):
+    key = ConfigStore(tmp_path).save(Run(seed=123))
+    store = ConfigStore(tmp_path)
+    assert key in store
+    assert store.load(Run, key) == Run(seed=123)
+
+
+def test_dataclasses_are_loaded_with_their_type(tmp_path: Path):
+    store = ConfigStore(tmp_path)
+    experiment = Experiment(optimizer=SGD(momentum=0.5), subgroup=SGD(lr=0.2))
+    assert store.load(Experiment, store.save(experiment)) == experiment
+    # Dataclasses of different types with the same values are saved in different documents.
+    assert store.save(Adam(lr=0.5)) != store.save(SGD(lr=0.5, momentum=0.9))
@@ -1,7 +1,14 @@
+import importlib.util
+import json
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
+from simple_parsing.helpers.serialization.decoding import _decoding_fns
+from simple_parsing.helpers.serialization.serializable import json_extension
+
 from ..nesting.example_use_cases import HyperParameters
 from ..testutils import needs_toml, needs_yaml
 
@@ -68,6 +75,98 @@ def test_save_torch(tmpdir: Path):
     assert hparams == _hparams
 
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+@pytest.mark.parametrize("filetype", [pytest.param(".yaml", marks=needs_yaml), ".json"])
+def test_save_array_sidecars(tmp_path: Path, filetype: str):
+    from dataclasses import dataclass, field
+
+    from simple_parsing.helpers import Serializable
+
+    @dataclass
+    class Layer(Serializable):
+        weights: np.ndarray
+        name: str = "layer"
+
+    @dataclass
+    class Checkpoint(Serializable):
+        layers: list[Layer]
+        step: int = 0
+        mask: np.ndarray = field(default_factory=lambda: np.ones(3, dtype=bool))
+
+    checkpoint = Checkpoint(
+        layers=[Layer(np.arange(12.0).reshape(3, 4)), Layer(np.zeros(5, dtype=np.int64))],
+        step=10,
+    )
+    path = tmp_path / ("checkpoint" + filetype)
+    checkpoint.save(path, array_sidecars=True)
+
+    assert sorted(p.name for p in tmp_path.glob("*.npy")) == [
+        f"checkpoint{filetype}.layers.0.weights.npy",
+        f"checkpoint{filetype}.layers.1.weights.npy",
+        f"checkpoint{filetype}.mask.npy",
+    ]
+    # The arrays aren't saved in the file itself.
+    assert "_ndarray_" in path.read_text()
+    assert "11.0" not in path.read_text()
+
+    loaded = Checkpoint.load(path, array_sidecars=True)
+    assert loaded.step == 10
+    assert loaded.layers[1].name == "layer"
+    for layer, loaded_layer in zip(checkpoint.layers, loaded.layers):
+        assert isinstance(loaded_layer.weights, np.memmap)
+        assert loaded_layer.weights.dtype == layer.weights.dtype
+        np.testing.assert_array_equal(loaded_layer.weights, layer.weights)
+    np.testing.assert_array_equal(loaded.mask, checkpoint.mask)
+    # Loading the arrays doesn't register a decoding function for them.
+    assert np.ndarray not in _decoding_fns
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+def test_array_sidecars_of_files_with_the_same_stem(tmp_path: Path):
+    from simple_parsing.helpers.serialization import load, save
+
+    @dataclass
+    class Weights:
+        values: np.ndarray
+
+    save(Weights(np.zeros(3)), tmp_path / "weights.json", array_sidecars=True)
+    save(Weights(np.ones(3)), tmp_path / "weights.pkl", array_sidecars=True)
+
+    zeros = load(Weights, tmp_path / "weights.json", array_sidecars=True)
+    ones = load(Weights, tmp_path / "weights.pkl", array_sidecars=True)
+    np.testing.assert_array_equal(zeros.values, np.zeros(3))
+    np.testing.assert_array_equal(ones.values, np.ones(3))
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+@pytest.mark.parametrize("file_name", ["../weights.npy", "sub/weights.npy", "weights.txt", 123])
+def test_array_sidecars_with_invalid_file_name(tmp_path: Path, file_name):
+    from simple_parsing.helpers.serialization import load
+
+    @dataclass
+    class Weights:
+        values: np.ndarray
+
+    path = tmp_path / "weights.json"
+    path.write_text(json.dumps({"values": {"_ndarray_": file_name}}))
+    with pytest.raises(ValueError, match="Invalid file name"):
+        load(Weights, path, array_sidecars=True)
+
+
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+def test_array_sidecars_refuse_dicts_that_look_like_arrays(tmp_path: Path):
+    from simple_parsing.helpers.serialization import save
+
+    with pytest.raises(ValueError, match="would be loaded as an array"):
+        save({"values": {"_ndarray_": "weights.npy"}}, tmp_path / "d.json", array_sidecars=True)
+
+
 @needs_toml
 def test_save_toml(tmpdir: Path):
     hparams = HyperParameters.setup("")
@@ -76,3 +175,193 @@ def test_save_toml(tmpdir: Path):
 
     _hparams = HyperParameters.load(tmp_path)
     assert hparams == _hparams
+
+
+def test_save_and_load_jsonl(tmp_path: Path):
+    from simple_parsing.helpers.serialization import load_jsonl, save_jsonl
+
+    hparams = [HyperParameters.setup(f"--age_group.num_layers {i}") for i in range(5)]
+    path = tmp_path / "hparams.jsonl"
+    save_jsonl((h for h in hparams), path)
+    assert len(path.read_text().splitlines()) == 5
+
+    loaded = load_jsonl(HyperParameters, path)
+    # The records are only read as they are consumed.
+    assert next(loaded) == hparams[0]
+    assert list(loaded) == hparams[1:]
+
+
+def test_save_jsonl_encodes_the_values_of_dicts(tmp_path: Path):
+    from simple_parsing.helpers.serialization import save_jsonl
+
+    path = tmp_path / "records.jsonl"
+    save_jsonl([{"path": Path("a/b")}, {"path": Path("c")}], path)
+    assert path.read_text().splitlines() == ['{"path": "a/b"}', '{"path": "c"}']
+
+
+def test_from_dicts_is_lazy():
+    from simple_parsing.helpers.serialization import from_dicts
+
+    consumed: list[int] = []
+
+    def dicts():
+        for i in range(3):
+            consumed.append(i)
+            yield {"batch_size": i}
+
+    hparams = from_dicts(HyperParameters, dicts())
+    assert consumed == []
+    assert next(hparams).batch_size == 0
+    assert consumed == [0]
+    assert [h.batch_size for h in hparams] == [1, 2]
+
+
+@pytest.mark.parametrize("executor_type", [None, "thread", "process"])
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_load_dir(tmp_path: Path, executor_type: Optional[str], chunksize: int):
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    from simple_parsing.helpers.serialization import load_dir
+
+    hparams = [HyperParameters.setup(f"--batch_size {i}") for i in range(8)]
+    for i, h in enumerate(hparams):
+        h.save(tmp_path / f"run_{i}.json")
+    (tmp_path / "run_8.json").write_text("{not json")
+    (tmp_path / "notes.txt").write_text("not a config")
+
+    if executor_type is None:
+        results = list(load_dir(HyperParameters, tmp_path, chunksize=chunksize))
+    else:
+        executor_class = ThreadPoolExecutor if executor_type == "thread" else ProcessPoolExecutor
+        with executor_class(max_workers=2) as executor:
+            results = list(
+                load_dir(HyperParameters, tmp_path, executor=executor, chunksize=chunksize)
+            )
+
+    assert [result.path.name for result in results] == [f"run_{i}.json" for i in range(9)]
+    assert [result.value for result in results[:-1]] == hparams
+    assert all(result.error is None for result in results[:-1])
+    # The errors are returned for each file.
+    assert results[-1].value is None
+    assert isinstance(results[-1].error, ValueError)
+
+
+def test_load_many_as_completed(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from simple_parsing.helpers.serialization import load_many
+
+    paths = [tmp_path / f"run_{i}.json" for i in range(10)]
+    for i, path in enumerate(paths):
+        HyperParameters(batch_size=i).save(path)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(load_many(HyperParameters, paths, executor=executor, ordered=False))
+    assert sorted(result.path for result in results) == sorted(paths)
+    assert all(result.value.batch_size == int(result.path.stem[4:]) for result in results)
+
+
+def test_read_file_cache(tmp_path: Path):
+    from simple_parsing.helpers.serialization.serializable import FileCache, read_file
+
+    cache = FileCache(maxsize=2)
+    paths = [tmp_path / f"config_{i}.json" for i in range(3)]
+    for i, path in enumerate(paths):
+        HyperParameters(batch_size=i).save(path)
+
+    contents = cache.get(paths[0], json_extension)
+    assert contents == read_file(paths[0])
+    # The cached contents can't be modified by the caller.
+    contents["batch_size"] = 123
+    contents["age_group"]["num_layers"] = 123
+    assert cache.get(paths[0], json_extension) == read_file(paths[0])
+    assert cache.cache_info() == (1, 1, 2, 1)
+
+    # The least recently used files are removed.
+    cache.get(paths[1], json_extension)
+    cache.get(paths[2], json_extension)
+    assert cache.cache_info().currsize == 2
+    cache.get(paths[0], json_extension)
+    assert cache.cache_info().misses == 4
+
+    cache.invalidate(paths[0])
+    cache.get(paths[0], json_extension)
+    assert cache.cache_info().misses == 5
+    cache.invalidate()
+    assert cache.cache_info().currsize == 0
+
+
+@needs_toml
+def test_read_file_caches_toml_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from simple_parsing.helpers.serialization import serializable
+
+    monkeypatch.setattr(serializable, "file_cache", serializable.FileCache())
+    path = tmp_path / "config.toml"
+    HyperParameters(batch_size=3).save(path)
+
+    contents = serializable.read_file(path, cache=True)
+    contents["batch_size"] = 123
+    assert serializable.read_file(path, cache=True) == serializable.read_file(path)
+    assert serializable.file_cache.cache_info() == (1, 1, 128, 1)
+
+
+@needs_yaml
+@pytest.mark.parametrize("backend", ["libyaml", "python"])
+def test_yaml_backends(tmp_path: Path, backend: str, monkeypatch: pytest.MonkeyPatch):
+    from simple_parsing.helpers.serialization.serializable import yaml_extension
+
+    if backend not in yaml_extension.available_backends():
+        pytest.skip(f"The {backend} backend isn't available.")
+    monkeypatch.setattr(yaml_extension, "backend", backend)
+    assert yaml_extension.get_backend() == backend
+
+    hparams = HyperParameters.setup("--age_group.num_layers 3")
+    path = tmp_path / "hparams.yaml"
+    hparams.save(path)
+    assert HyperParameters.load(path) == hparams
+    assert HyperParameters.loads_yaml(hparams.dumps_yaml()) == hparams
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(
+            "orjson",
+            marks=pytest.mark.skipif(
+                importlib.util.find_spec("orjson") is None, reason="orjson is not installed"
+            ),
+        ),
+        "json",
+    ],
+)
+def test_json_backends(tmp_path: Path, backend: str, monkeypatch: pytest.MonkeyPatch):
+    from simple_parsing.helpers.serialization.serializable import json_extension
+
+    monkeypatch.setattr(json_extension, "backend", backend)
+    hparams = HyperParameters.setup("--age_group.num_layers 3")
+    path = tmp_path / "hparams.json"
+    hparams.save(path)
+    assert HyperParameters.load(path) == hparams
+
+
+def test_unknown_backend_raises_error():
+    from simple_parsing.helpers.serialization.serializable import JSONExtension, YamlExtension
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        JSONExtension(backend="bob")
+    with pytest.raises(ValueError, match="Unknown backend"):
+        YamlExtension().backend = "bob"
+
+
+def test_format_methods_can_be_called_on_the_class():
+    """`JSONExtension.load` and `JSONExtension.dump` can be used like static methods."""
+    import io
+
+    from simple_parsing.helpers.serialization.serializable import JSONExtension, json_extension
+
+    f = io.StringIO()
+    JSONExtension.dump({"a": [1, 2]}, f)
+    f.seek(0)
+    assert JSONExtension.load(f) == {"a": [1, 2]}
+    # The methods are called on `json_extension`, so they use its backend.
+    assert JSONExtension._get_default() is json_extension
@@ -6,11 +6,11 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from test.testutils import TestSetup, raises
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 
 import pytest
 
-from simple_parsing import field, mutable_field
+from simple_parsing import field, mutable_field, subgroups
 from simple_parsing.helpers import FrozenSerializable, JsonSerializable, Serializable
 from simple_parsing.helpers.serialization.serializable import SerializableMixin
 
@@ -245,6 +245,38 @@ def test_decode_right_subclass(silent, Container, Base, A, B):
     assert c == parsed_val
 
 
+def test_subclass_index_picks_subclass_with_fewest_fields(silent, Base, A, B):
+    from simple_parsing.helpers.serialization.serializable import get_subclass_index
+
+    @dataclass(frozen=issubclass(Base, FrozenSerializable))
+    class AB(A):
+        favorite_color: str = "red"
+
+    index = get_subclass_index(Base)
+    assert index.smallest_superset({"name", "age"}) is A
+    assert index.smallest_superset({"favorite_color"}) is B
+    assert index.smallest_superset({"age", "favorite_color"}) is AB
+    assert index.smallest_superset({"unknown"}) is None
+    assert get_subclass_index(Base) is index
+
+    assert Base.from_dict({"name": "C", "age": 1, "favorite_color": "green"}) == AB(
+        name="C", age=1, favorite_color="green"
+    )
+
+
+def test_subclass_index_is_updated_with_new_subclasses(silent, Base, A):
+    from simple_parsing.helpers.serialization.serializable import get_subclass_index
+
+    assert get_subclass_index(Base).smallest_superset({"height"}) is None
+
+    @dataclass(frozen=issubclass(Base, FrozenSerializable))
+    class Tall(A):
+        height: float = 2.0
+
+    assert get_subclass_index(Base).smallest_superset({"height"}) is Tall
+    assert isinstance(Base.from_dict({"height": 1.8}), Tall)
+
+
 def test_forward_ref_dict(silent, frozen: bool):
     @dataclass(frozen=frozen)
     class LossWithDict(FrozenSerializable if frozen else Serializable):
@@ -579,3 +611,335 @@ def test_path(frozen: bool):
     assert isinstance(d["path"], str)
     assert Foo.from_dict(d) == foo
     assert isinstance(Foo.from_dict(d).path, Path)
+
+
+def test_to_dict_encoder_is_compiled_once_per_type(frozen: bool):
+    from simple_parsing.helpers.serialization import serializable
+
+    @dataclass(frozen=frozen)
+    class Inner(FrozenSerializable if frozen else Serializable):
+        value: float = 1.5
+
+    @dataclass(frozen=frozen)
+    class Outer(FrozenSerializable if frozen else Serializable):
+        name: str = "bob"
+        inner: Inner = field(default_factory=Inner)
+        hidden: int = field(default=0, to_dict=False)
+        tags: tuple = ("a", "b")
+
+    assert Outer().to_dict() == {"name": "bob", "inner": {"value": 1.5}, "tags": ["a", "b"]}
+    encoder = serializable._get_dict_encoder(Outer, dict, True, False)
+    assert Outer(name="alice").to_dict() == {
+        "name": "alice",
+        "inner": {"value": 1.5},
+        "tags": ["a", "b"],
+    }
+    assert serializable._get_dict_encoder(Outer, dict, True, False) is encoder
+
+
+def test_to_dict_uses_encoding_fns_registered_afterwards(frozen: bool):
+    from simple_parsing.helpers.serialization import encode
+
+    class Celsius(float):
+        pass
+
+    @dataclass(frozen=frozen)
+    class Temperature(FrozenSerializable if frozen else Serializable):
+        value: float = 0.0
+
+    assert Temperature(value=Celsius(12.5)).to_dict() == {"value": 12.5}
+
+    encode.register(Celsius, lambda c: f"{float(c)}C")
+    assert Temperature(value=Celsius(12.5)).to_dict() == {"value": "12.5C"}
+
+
+def test_to_dict_uses_encoding_fns_registered_again(frozen: bool):
+    """Replacing the encoding function of a type also discards the compiled encoders."""
+    from simple_parsing.helpers.serialization import encode, serializable
+
+    class Fahrenheit(float):
+        pass
+
+    @dataclass(frozen=frozen)
+    class Temperature(FrozenSerializable if frozen else Serializable):
+        value: float = 0.0
+
+    def _get_encoder():
+        return serializable._get_dict_encoder(Temperature, dict, True, False)
+
+    encode.register(Fahrenheit, lambda f: f"{float(f)}F")
+    assert Temperature(value=Fahrenheit(50.0)).to_dict() == {"value": "50.0F"}
+    encoder = _get_encoder()
+
+    @encode.register(Fahrenheit)
+    def _encode_fahrenheit(f: Fahrenheit) -> str:
+        return f"{float(f)} degrees F"
+
+    assert _get_encoder() is not encoder
+    assert Temperature(value=Fahrenheit(50.0)).to_dict() == {"value": "50.0 degrees F"}
+    encoder = _get_encoder()
+
+    @encode.register
+    def _encode_fahrenheit_again(f: Fahrenheit) -> float:
+        return (float(f) - 32) * 5 / 9
+
+    assert _get_encoder() is not encoder
+    assert Temperature(value=Fahrenheit(50.0)).to_dict() == {"value": 10.0}
+
+
+def test_compiled_encoders_dont_keep_dataclasses_alive():
+    import gc
+    import weakref
+
+    from simple_parsing.helpers.serialization import to_dict
+
+    def _make_dataclass() -> weakref.ref[type]:
+        @dataclass
+        class Local:
+            value: int = 1
+
+        assert to_dict(Local(), save_dc_types=True) == {"value": 1}
+        return weakref.ref(Local)
+
+    with pytest.warns(RuntimeWarning, match="defined in a function scope"):
+        local_ref = _make_dataclass()
+    gc.collect()
+    assert local_ref() is None
+
+
+class _Buffer:
+    def __init__(self, values: list):
+        self.values = values
+
+
+def test_to_dict_copy_mode(frozen: bool):
+    @dataclass(frozen=frozen)
+    class Layer(FrozenSerializable if frozen else Serializable):
+        name: str = "layer"
+        blob: bytes = b"\x00" * 1024
+        buffer: _Buffer = field(default_factory=lambda: _Buffer([1, 2, 3]))
+
+    @dataclass(frozen=frozen)
+    class Model(FrozenSerializable if frozen else Serializable):
+        layers: list[Layer] = field(default_factory=lambda: [Layer(), Layer()])
+
+    layer = Layer()
+    d = layer.to_dict()
+    # Immutable values are never copied.
+    assert d["blob"] is layer.blob
+    assert d["buffer"] is not layer.buffer
+    assert d["buffer"].values == layer.buffer.values
+    assert d["buffer"].values is not layer.buffer.values
+
+    d = layer.to_dict(copy_mode="shallow")
+    assert d["blob"] is layer.blob
+    assert d["buffer"] is not layer.buffer
+    assert d["buffer"].values is layer.buffer.values
+
+    assert layer.to_dict(copy_mode="none")["buffer"] is layer.buffer
+
+    # The copy mode is also used for the nested dataclasses.
+    model = Model()
+    d = model.to_dict(copy_mode="shallow")
+    assert d["layers"][1]["buffer"].values is model.layers[1].buffer.values
+    d = model.to_dict()
+    assert d["layers"][1]["buffer"].values is not model.layers[1].buffer.values
+
+    with pytest.raises(ValueError, match="Unknown copy mode"):
+        layer.to_dict(copy_mode="copy")
+
+
+def test_save_with_shallow_copies(tmp_path: Path, frozen: bool):
+    @dataclass(frozen=frozen)
+    class Config(FrozenSerializable if frozen else Serializable):
+        name: str = "bob"
+        sizes: tuple[int, ...] = tuple(range(100))
+        options: dict[str, list[int]] = field(default_factory=lambda: {"a": [1, 2]})
+
+    config = Config()
+    assert config.dumps(copy_mode="shallow") == config.dumps()
+    config.save(tmp_path / "config.json", copy_mode="shallow")
+    assert Config.load(tmp_path / "config.json") == config
+
+
+@dataclass
+class _Point:
+    x: int = 0
+    y: int = 0
+
+
+@dataclass
+class _Segment:
+    start: _Point = field(default_factory=_Point)
+    end: _Point = field(default_factory=_Point)
+
+
+def test_saved_dc_types_are_not_registered(monkeypatch: pytest.MonkeyPatch):
+    from simple_parsing.helpers.serialization import serializable
+    from simple_parsing.helpers.serialization.serializable import (
+        from_dict,
+        only_use_registered_dc_types,
+        to_dict,
+    )
+
+    monkeypatch.setattr(serializable, "_registered_dc_types", {})
+    monkeypatch.setattr(serializable, "_located_dc_types", {})
+    d = to_dict(_Segment(end=_Point(1, 2)), save_dc_types=True)
+    assert d["end"]["_type_"] == f"{__name__}._Point"
+    assert to_dict(_Segment(), only_non_default=True) == {"_type_": f"{__name__}._Segment"}
+    # Saving a type doesn't allow loading it when only the registered types can be loaded.
+    assert serializable._registered_dc_types == {}
+    only_use_registered_dc_types()
+    try:
+        with pytest.raises(ImportError, match="isn't registered"):
+            from_dict(_Segment, d)
+    finally:
+        only_use_registered_dc_types(False)
+
+    assert from_dict(_Segment, d) == _Segment(end=_Point(1, 2))
+
+    # The located types are cached.
+    def _locate(path: str):
+        raise AssertionError(f"Shouldn't need to import {path} again")
+
+    monkeypatch.setattr(serializable, "_locate", _locate)
+    assert from_dict(_Segment, d) == _Segment(end=_Point(1, 2))
+
+
+def test_only_registered_dc_types(monkeypatch: pytest.MonkeyPatch):
+    from simple_parsing.helpers.serialization import serializable
+    from simple_parsing.helpers.serialization.serializable import (
+        from_dict,
+        only_use_registered_dc_types,
+        register_dc_type,
+    )
+
+    monkeypatch.setattr(serializable, "_registered_dc_types", {})
+    monkeypatch.setattr(serializable, "_located_dc_types", {})
+    only_use_registered_dc_types()
+    try:
+        with pytest.raises(ImportError, match="isn't registered"):
+            from_dict(_Segment, {"_type_": "os.path.join"})
+        with pytest.raises(ImportError, match="isn't registered"):
+            from_dict(_Segment, {"_type_": f"{__name__}._Segment"})
+
+        register_dc_type(_Segment)
+        assert from_dict(_Segment, {"_type_": f"{__name__}._Segment"}) == _Segment()
+    finally:
+        only_use_registered_dc_types(False)
+    assert from_dict(_Point, {"_type_": f"{__name__}._Point", "x": 1}) == _Point(x=1)
+    assert serializable._located_dc_types == {f"{__name__}._Point": _Point}
+
+
+@dataclass
+class _Adam:
+    lr: float = 1e-3
+    betas: tuple[float, float] = (0.9, 0.999)
+
+
+@dataclass
+class _SGD:
+    lr: float = 0.1
+    momentum: float = 0.0
+
+
+@dataclass
+class _TrainConfig(Serializable):
+    epochs: int = 10
+    tags: list[str] = field(default_factory=list)
+    start: _Point = field(default_factory=lambda: _Point(x=1))
+    optimizer: Union[_Adam, _SGD] = subgroups({"adam": _Adam, "sgd": _SGD}, default="adam")
+
+
+def test_to_dict_only_non_default():
+    # The type of the dataclass is always saved.
+    config_type = f"{__name__}._TrainConfig"
+    assert _TrainConfig().to_dict(only_non_default=True) == {"_type_": config_type}
+
+    config = _TrainConfig(epochs=20, start=_Point(x=1, y=2), optimizer=_Adam(lr=0.01))
+    assert config.to_dict(only_non_default=True) == {
+        "_type_": config_type,
+        "epochs": 20,
+        "start": {"y": 2},
+        "optimizer": {"lr": 0.01},
+    }
+    # The nested dataclasses are compared with the default value of their field.
+    assert _TrainConfig(start=_Point(x=0)).to_dict(only_non_default=True) == {
+        "_type_": config_type,
+        "start": {"x": 0},
+    }
+    # A dataclass of a different type is saved entirely, with its type.
+    assert _TrainConfig(optimizer=_SGD()).to_dict(only_non_default=True) == {
+        "_type_": config_type,
+        "optimizer": {"_type_": f"{__name__}._SGD", "lr": 0.1, "momentum": 0.0},
+    }
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        _TrainConfig(),
+        _TrainConfig(epochs=20, tags=["a"], start=_Point(x=1, y=2)),
+        _TrainConfig(start=_Point(x=0), optimizer=_Adam(betas=(0.5, 0.5))),
+        _TrainConfig(optimizer=_SGD(momentum=0.9)),
+    ],
+)
+def test_save_and_load_only_non_default(tmp_path: Path, config: _TrainConfig):
+    path = tmp_path / "config.json"
+    config.save(path, only_non_default=True)
+    loaded = _TrainConfig.load(path, only_non_default=True)
+    assert loaded == config
+    # The default values aren't shared between the loaded instances.
+    loaded.tags.append("b")
+    assert _TrainConfig.load(path, only_non_default=True) == config
+
+
+@dataclass
+class _LongTrainConfig(_TrainConfig):
+    epochs: int = 100
+    warmup: int = 0
+
+
+def test_load_only_non_default_uses_the_defaults_of_the_saved_type(tmp_path: Path):
+    path = tmp_path / "config.json"
+    config = _LongTrainConfig(warmup=5)
+    config.save(path, only_non_default=True)
+    assert _TrainConfig.load(path, only_non_default=True) == config
+
+
+def test_only_non_default_uses_encoding_fns_registered_again():
+    """Replacing the encoding function of a type also discards the encoded default values."""
+    from simple_parsing.helpers.serialization import encode, to_dict
+
+    class Kelvin(float):
+        pass
+
+    @dataclass
+    class Reading:
+        value: float = Kelvin(300.0)
+
+    encode.register(Kelvin, lambda k: f"{float(k)}K")
+    assert to_dict(Reading(), only_non_default=True) == {}
+
+    encode.register(Kelvin, float)
+    assert to_dict(Reading(), only_non_default=True) == {}
+    assert to_dict(Reading(Kelvin(0.0)), only_non_default=True) == {"value": 0.0}
+
+
+def test_only_non_default_doesnt_keep_dataclasses_alive():
+    import gc
+    import weakref
+
+    from simple_parsing.helpers.serialization import to_dict
+
+    def _make_dataclass() -> weakref.ref[type]:
+        @dataclass
+        class Local:
+            value: int = 1
+
+        assert to_dict(Local(value=2), only_non_default=True) == {"value": 2}
+        return weakref.ref(Local)
+
+    local_ref = _make_dataclass()
+    gc.collect()
+    assert local_ref() is None
@@ -0,0 +1,139 @@
+"""Tests for the frozen, thread-safe `CompiledParser`."""
+
+from __future__ import annotations
+
+import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import pytest
+
+from simple_parsing import (
+    ArgumentGenerationMode,
+    ArgumentParser,
+    DashVariant,
+    NestedMode,
+    ParsingError,
+    subgroups,
+)
+from simple_parsing.compiled_parser import CompiledParser
+
+
+@dataclass
+class Optimizer:
+    """Optimizer settings."""
+
+    learning_rate: float = 0.1  # The learning rate.
+    momentum: float = 0.9
+
+
+@dataclass
+class ModelA:
+    num_layers: int = 2
+
+
+@dataclass
+class ModelB:
+    hidden_size: int = 16
+
+
+@dataclass
+class Config:
+    optimizer: Optimizer = field(default_factory=Optimizer)
+    model: ModelA | ModelB = subgroups({"a": ModelA, "b": ModelB}, default="a")
+    batch_size: int = 32
+
+
+def _compile(*args: str, **kwargs) -> CompiledParser:
+    parser = ArgumentParser(**kwargs)
+    parser.add_arguments(Config, dest="config")
+    return parser.compile(args)
+
+
+def test_compiled_parser_parses_like_the_parser():
+    compiled = _compile()
+    args = ["--learning_rate", "0.5", "--num_layers", "4", "--batch_size", "8"]
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    assert compiled.parse_args(args).config == parser.parse_args(args).config
+    assert compiled.parse_args([]).config == Config()
+
+
+def test_compiled_parser_is_frozen():
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    compiled = parser.compile()
+    with pytest.raises(AttributeError):
+        compiled.nested_mode = NestedMode.WITHOUT_ROOT  # type: ignore
+    with pytest.raises(RuntimeError):
+        parser.add_arguments(Optimizer, dest="other")
+    with pytest.raises(RuntimeError):
+        parser.add_argument("--foo")
+
+
+def test_compiled_parser_uses_the_subgroups_it_was_compiled_with(capsys: pytest.CaptureFixture):
+    compiled = _compile("--model", "b")
+    assert compiled.parse_args(["--hidden_size", "3"]).config.model == ModelB(hidden_size=3)
+    with pytest.raises(SystemExit):
+        compiled.parse_args(["--model", "a"])
+    err = capsys.readouterr().err
+    assert "usage:" in err
+    assert "error: Can't reuse the arguments" in err
+
+
+def test_help_of_compiled_parser():
+    compiled = _compile()
+    file = io.StringIO()
+    compiled.print_help(file)
+    assert file.getvalue() == compiled.format_help()
+    assert "The learning rate." in file.getvalue()
+
+
+def test_settings_are_not_shared_between_parsers():
+    dash_parser = ArgumentParser(add_option_string_dash_variants=DashVariant.DASH)
+    # Creating another parser used to change the settings of all the parsers.
+    _ = ArgumentParser(add_option_string_dash_variants=DashVariant.UNDERSCORE)
+    dash_parser.add_arguments(Config, dest="config")
+    config = dash_parser.parse_args(["--learning-rate", "0.2"]).config
+    assert config.optimizer.learning_rate == 0.2
+
+
+def test_parse_from_many_threads():
+    """Parses with compiled parsers that have different settings from many threads at once."""
+    parsers = {
+        "flat": (_compile(), "--{}"),
+        "dash": (_compile(add_option_string_dash_variants=DashVariant.DASH), "--{}"),
+        "nested": (
+            _compile(
+                argument_generation_mode=ArgumentGenerationMode.NESTED,
+                nested_mode=NestedMode.WITHOUT_ROOT,
+            ),
+            "--optimizer.{}",
+        ),
+    }
+    rng = random.Random(123)
+    tasks = []
+    for i in range(2000):
+        name = rng.choice(list(parsers))
+        learning_rate = rng.random()
+        option = "learning-rate" if name == "dash" else "learning_rate"
+        tasks.append((name, [parsers[name][1].format(option), str(learning_rate)], learning_rate))
+
+    def parse(task: tuple[str, list[str], float]) -> float:
+        name, args, _ = task
+        return parsers[name][0].parse_args(args).config.optimizer.learning_rate
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(parse, tasks))
+    assert results == [learning_rate for _, _, learning_rate in tasks]
+
+
+def test_parse_many_from_many_threads():
+    compiled = _compile()
+    args_lists = [[f"--batch_size {i}", "--batch_size foo"] for i in range(500)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(compiled.parse_many, args_lists))
+    for i, (valid, invalid) in enumerate(results):
+        assert valid.value.config.batch_size == i
+        assert "invalid int value: 'foo'" in str(invalid.error)
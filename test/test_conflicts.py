@@ -1,9 +1,12 @@
 """Tests for weird conflicts."""
 import argparse
 import functools
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, make_dataclass
 
-from simple_parsing import ArgumentParser
+import pytest
+
+from simple_parsing import ArgumentParser, ConflictResolution
+from simple_parsing.conflicts import ConflictResolutionError, ConflictResolver
 
 from .testutils import TestSetup, raises
 
@@ -81,3 +84,35 @@ def test_parent_child_conflict():
     p: Parent2 = Parent2.setup()
     assert p.child.batch_size == 32
     assert p.batch_size == 48
+
+
+@dataclass
+class Layer:
+    units: int = 32
+    dropout: float = 0.1
+
+
+def test_many_repeated_dataclasses():
+    """Conflicts between hundreds of instances of the same dataclass are all resolved."""
+    num_layers = 200
+    Network = make_dataclass(
+        "Network", [(f"layer_{i}", Layer, field(default_factory=Layer)) for i in range(num_layers)]
+    )
+    parser = ArgumentParser()
+    parser.add_arguments(Network, dest="network")
+    args = parser.parse_args(["--layer_0.units", "1", "--layer_199.dropout", "0.5"])
+    assert args.network.layer_0 == Layer(units=1)
+    assert args.network.layer_199 == Layer(dropout=0.5)
+    assert args.network.layer_100 == Layer()
+
+
+@pytest.mark.parametrize(
+    "conflict_resolution", [ConflictResolution.AUTO, ConflictResolution.EXPLICIT]
+)
+def test_max_attempts_can_be_set(conflict_resolution: ConflictResolution):
+    parser = ArgumentParser(conflict_resolution=conflict_resolution)
+    for i in range(3):
+        parser.add_arguments(Layer, dest=f"layer_{i}")
+    resolver = ConflictResolver(conflict_resolution, max_attempts=1)
+    with pytest.raises(ConflictResolutionError, match="maximum number of attempts"):
+        resolver.resolve_and_flatten(parser._wrappers)
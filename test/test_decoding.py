@@ -322,3 +322,163 @@ def test_issue_227_unsafe_int_casting_on_load(
         obj = loads_json(class_to_use, json.dumps(serialized_dict))
         assert obj == expected_result
     assert len(record.list) == 1
+
+
+def test_field_decoders_are_created_once_per_class():
+    from simple_parsing.helpers.serialization.decoding import get_field_decoders
+    from simple_parsing.helpers.serialization.serializable import from_dict
+
+    @dataclass
+    class Point:
+        x: int = 0
+        y: "list[float]" = field(default_factory=list)
+
+    field_decoders = get_field_decoders(Point)
+    assert [field_decoder.field_type for field_decoder in field_decoders] == [int, list[float]]
+    assert from_dict(Point, {"x": 1, "y": [1, 2]}) == Point(x=1, y=[1.0, 2.0])
+    assert get_field_decoders(Point) is field_decoders
+
+
+def test_field_decoders_use_decoding_fns_registered_afterwards():
+    from simple_parsing.helpers.serialization.serializable import from_dict
+
+    @dataclass
+    class Temperature:
+        celsius: float = 0.0
+
+    assert from_dict(Temperature, {"celsius": "12.5"}) == Temperature(celsius=12.5)
+
+    register_decoding_fn(float, lambda v: float(v.rstrip("C")), overwrite=True)
+    assert from_dict(Temperature, {"celsius": "12.5C"}) == Temperature(celsius=12.5)
+
+
+def test_unsafe_casting_is_reported_for_each_field():
+    @dataclass
+    class ThreeInts:
+        a: int = 0
+        b: int = 0
+        c: int = 0
+
+    with pytest.warns(RuntimeWarning) as record:
+        obj = loads_json(ThreeInts, json.dumps({"a": 1.5, "b": 2, "c": 3.5}))
+    assert obj == ThreeInts(a=1, b=2, c=3)
+    messages = [str(warning.message) for warning in record.list]
+    assert len(messages) == 2
+    assert "field 'a'" in messages[0]
+    assert "field 'c'" in messages[1]
+
+
+def test_get_decoding_fn_is_cached():
+    get_decoding_fn.cache_clear()
+    decoding_fn = get_decoding_fn(dict[str, list[tuple[int, float]]])
+    misses = get_decoding_fn.cache_info().misses
+    assert misses > 0
+
+    assert get_decoding_fn(dict[str, list[tuple[int, float]]]) is decoding_fn
+    cache_info = get_decoding_fn.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == misses
+    assert cache_info.currsize == misses
+
+
+def test_get_decoding_fn_cache_is_cleared_when_registering_decoding_fn():
+    decoding_fn = get_decoding_fn(list[float])
+    assert decoding_fn(["1.5"]) == [1.5]
+
+    register_decoding_fn(float, lambda v: float(v.rstrip("C")), overwrite=True)
+    assert get_decoding_fn(list[float]) is not decoding_fn
+    assert get_decoding_fn(list[float])(["1.5C"]) == [1.5]
+
+
+def test_get_decoding_fn_cache_respects_union_order():
+    # NOTE: `Union[int, float] == Union[float, int]`, but the types are tried in order.
+    assert get_decoding_fn(list[Union[int, float]])([1.5]) == [1]
+    assert get_decoding_fn(list[Union[float, int]])([1.5]) == [1.5]
+
+
+def test_get_decoding_fn_cache_distinguishes_equal_literal_values():
+    """`Literal[1]`, `Literal[True]` and `Literal[1.0]` have different decoding functions."""
+    decoding_fns = [get_decoding_fn(Literal[value]) for value in (1, True, 1.0)]
+    assert len({id(decoding_fn) for decoding_fn in decoding_fns}) == 3
+    assert get_decoding_fn(Literal[True]) is decoding_fns[1]
+
+
+def test_get_decoding_fn_with_unhashable_annotation():
+    from typing import Annotated
+
+    uncacheable = get_decoding_fn.cache_info().uncacheable
+    with pytest.warns(UserWarning, match="Unable to find a decoding function"):
+        assert get_decoding_fn(Annotated[int, ["unhashable"]]) is not None
+    assert get_decoding_fn.cache_info().uncacheable == uncacheable + 1
+
+
+class Outer:
+    class Celsius(float):
+        pass
+
+
+def test_string_annotation_lookup_by_name_and_qualname():
+    from simple_parsing.helpers.serialization.decoding import _decoding_fns
+
+    def decode_celsius(v: str) -> Outer.Celsius:
+        return Outer.Celsius(v.rstrip("C"))
+
+    assert _decoding_fns.classes_with_name("Celsius") == []
+    register_decoding_fn(Outer.Celsius, decode_celsius)
+    assert _decoding_fns.classes_with_name("Celsius") == [Outer.Celsius]
+    assert get_decoding_fn("Celsius") is decode_celsius
+    assert get_decoding_fn("Outer.Celsius") is decode_celsius
+
+    del _decoding_fns[Outer.Celsius]
+    assert _decoding_fns.classes_with_name("Outer.Celsius") == []
+
+
+def test_ambiguous_string_annotation_tries_each_decoding_fn():
+    class Celsius(float):
+        pass
+
+    register_decoding_fn(Outer.Celsius, lambda v: Outer.Celsius(v.rstrip("C")))
+    register_decoding_fn(Celsius, lambda v: Celsius(v.rstrip("°")))
+
+    decoding_fn = get_decoding_fn("Celsius")
+    assert get_decoding_fn("Celsius") is decoding_fn
+    assert decoding_fn("12C") == 12
+    assert decoding_fn("13°") == 13
+
+
+def test_get_decoding_fn_keys_string_annotations_with_their_scope():
+    from simple_parsing.helpers.serialization.decoding import _decoding_fn_cache_key
+
+    assert _decoding_fn_cache_key("Foo", "a") != _decoding_fn_cache_key("Foo", "b")
+    decoding_fn = get_decoding_fn("Path", containing_class=Outer)
+    assert decoding_fn("a/b") == Path("a/b")
+    assert get_decoding_fn("Path", containing_class=Outer) is decoding_fn
+
+
+def test_get_decoding_fn_doesnt_keep_local_dataclasses_alive():
+    import gc
+    import weakref
+
+    from simple_parsing.helpers.serialization import from_dict
+
+    def _decode_local_dataclasses() -> list[weakref.ref[type]]:
+        @dataclass
+        class Inner:
+            a: int = 1
+
+        @dataclass
+        class Wrapper:
+            inner: Inner = field(default_factory=Inner)
+            inners: list[Inner] = field(default_factory=list)
+
+        value = from_dict(Wrapper, {"inner": {"a": 2}, "inners": [{"a": 3}]})
+        assert value == Wrapper(inner=Inner(a=2), inners=[Inner(a=3)])
+        del value
+        return [weakref.ref(Inner), weakref.ref(Wrapper)]
+
+    refs = _decode_local_dataclasses()
+    # NOTE: The entries of the weakly-keyed caches are removed when `Wrapper` is collected, after
+    # which `Inner` can be collected too.
+    gc.collect()
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None]
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
-from simple_parsing import field
+import pytest
+
+import simple_parsing
+from simple_parsing import ArgumentParser, field
 from simple_parsing.docstring import AttributeDocString, get_attribute_docstring
 
 from .testutils import TestSetup
@@ -216,3 +219,29 @@ def test_help_takes_value_from_docstring():
     assert get_attribute_docstring(Args, "verbose") == AttributeDocString(
         desc_from_cls_docstring="Display logs",
     )
+
+
+def test_docstrings_are_only_retrieved_when_help_is_displayed(monkeypatch: pytest.MonkeyPatch):
+    """Parsing arguments shouldn't read the source code of the dataclasses, only --help should."""
+    calls: list[tuple[type, str]] = []
+
+    def _get_attribute_docstring(dataclass: type, field_name: str) -> AttributeDocString:
+        calls.append((dataclass, field_name))
+        return get_attribute_docstring(dataclass, field_name)
+
+    monkeypatch.setattr(
+        simple_parsing.docstring, "get_attribute_docstring", _get_attribute_docstring
+    )
+
+    parser = ArgumentParser()
+    parser.add_arguments(Extended, dest="extended")
+    args = parser.parse_args(["--a", "1", "--e", "2"])
+    assert args.extended == Extended(a=1, e=2.0)
+    assert calls == []
+
+    help_text = parser.format_help()
+    assert calls
+    assert "docstring for attribute 'a'" in help_text
+    assert "inline comment on attribute 'b'" in help_text
+    assert "docstring for 'd' in Extended." in help_text
+    assert "Some extension of base-class `Base`" in help_text
@@ -254,3 +254,77 @@ def test_missing_annotation_on_subclass():
     assert SubclassOfOptimizerConfig.setup("--lr_scheduler cosine") == SubclassOfOptimizerConfig(
         lr_scheduler="cosine"
     )
+
+
+def test_annotations_of_class_are_resolved_once(monkeypatch: pytest.MonkeyPatch):
+    """Test that the annotations of all the fields of a class are evaluated at once and cached."""
+    from simple_parsing.annotation_utils import get_field_annotations
+
+    @dataclass
+    class LocalConfig:
+        a: int = 1
+        b: list[str] = dataclasses.field(default_factory=list)
+        c: int | float = 1.0
+
+    resolved_classes: list[type] = []
+    _resolve_field_types = get_field_annotations._resolve_field_types
+
+    def _counting_resolve_field_types(some_class: type):
+        resolved_classes.append(some_class)
+        return _resolve_field_types(some_class)
+
+    monkeypatch.setattr(
+        get_field_annotations, "_resolve_field_types", _counting_resolve_field_types
+    )
+    assert get_field_type_from_annotations(LocalConfig, "a") is int
+    assert get_field_type_from_annotations(LocalConfig, "b") == list[str]
+    assert get_field_type_from_annotations(LocalConfig, "c") == typing.Union[int, float]
+    assert get_field_type_from_annotations(LocalConfig, "a") is int
+    assert resolved_classes == [LocalConfig]
+
+
+def test_unresolved_annotations_are_evaluated_again():
+    """The annotations that can't be evaluated aren't cached, so they can be evaluated later."""
+
+    @dataclass
+    class LocalConfig:
+        a: int = 1
+        b: Later = None  # type: ignore
+
+    assert get_field_type_from_annotations(LocalConfig, "b") == "Later"
+    assert get_field_type_from_annotations(LocalConfig, "a") is int
+
+    @dataclass
+    class Later:
+        c: int = 2
+
+    assert get_field_type_from_annotations(LocalConfig, "b") is Later
+
+
+def test_field_types_are_not_saved_on_the_class():
+    @dataclass
+    class LocalConfig:
+        a: int = 1
+
+    names_before = set(vars(LocalConfig))
+    assert get_field_type_from_annotations(LocalConfig, "a") is int
+    assert set(vars(LocalConfig)) == names_before
+
+
+def test_self_referential_class_can_be_garbage_collected():
+    import gc
+    import weakref
+
+    def _make_node_class() -> weakref.ref[type]:
+        @dataclass
+        class Node:
+            children: list[Node] = dataclasses.field(default_factory=list)
+
+        field_type = get_field_type_from_annotations(Node, "children")
+        assert field_type == list[Node]
+        del field_type
+        return weakref.ref(Node)
+
+    node_ref = _make_node_class()
+    gc.collect()
+    assert node_ref() is None
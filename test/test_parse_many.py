@@ -0,0 +1,199 @@
+"""Tests for parsing many lists of command-line arguments with the same parser."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+import simple_parsing
+from simple_parsing import ArgumentParser, ParsingError, subgroups
+
+
+@dataclass
+class A:
+    a: int = 1
+
+
+@dataclass
+class B:
+    b: str = "b"
+
+
+@dataclass
+class AB:
+    inner: A | B = subgroups({"a": A, "b": B}, default="a")
+
+
+@dataclass
+class Config:
+    model: A | B | AB = subgroups({"a": A, "b": B, "ab": AB}, default="a")
+    lr: float = 0.1
+    tags: list[str] = field(default_factory=list)
+
+
+ARGS_LIST = [
+    "",
+    "--lr 0.5",
+    "--a 3 --tags foo bar",
+    "--model b --b hello",
+    "--model ab --inner b --b bye",
+    "--model ab",
+    "--lr 1e-3",
+]
+
+
+def test_parse_many_gives_the_same_configs_as_parse():
+    results = simple_parsing.parse_many(Config, ARGS_LIST)
+    assert [result.error for result in results] == [None] * len(ARGS_LIST)
+    assert [result.value for result in results] == [
+        simple_parsing.parse(Config, args=args) for args in ARGS_LIST
+    ]
+    assert results[1].args == ["--lr", "0.5"]
+
+
+def test_arguments_are_only_parsed_by_the_parser_for_their_subgroups(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Once the parsers are created, each list of arguments is parsed once, by the right parser."""
+    parsed: list[list[str]] = []
+    parse_one = ArgumentParser._parse_one
+
+    def _parse_one(self: ArgumentParser, args, namespace=None):
+        parsed.append(args)
+        return parse_one(self, args, namespace=namespace)
+
+    monkeypatch.setattr(ArgumentParser, "_parse_one", _parse_one)
+    calls_before_last_round: list[int] = []
+
+    def args_list():
+        yield from ARGS_LIST * 2
+        calls_before_last_round.append(len(parsed))
+        yield from ARGS_LIST
+
+    results = simple_parsing.parse_many(Config, args_list())
+    assert [result.error for result in results] == [None] * len(ARGS_LIST) * 3
+    assert len(parsed) - calls_before_last_round[0] == len(ARGS_LIST)
+
+
+def test_errors_are_collected(capsys: pytest.CaptureFixture):
+    results = simple_parsing.parse_many(
+        Config, ["--lr foo", "--lr 0.2", "--model c", "--bob 1", "--model ab --inner c"]
+    )
+    assert results[1].value == Config(lr=0.2)
+    errors = [result.error for result in results]
+    assert all(isinstance(error, ParsingError) for error in errors[:1] + errors[2:])
+    assert "invalid float value: 'foo'" in str(errors[0])
+    assert "invalid choice: 'c'" in str(errors[2])
+    assert "unrecognized arguments: --bob 1" in str(errors[3])
+    assert "invalid choice: 'c'" in str(errors[4])
+    # Nothing is printed, and the program doesn't exit.
+    assert capsys.readouterr().err == ""
+
+
+def test_parser_is_reused_and_not_modified():
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    first = parser.parse_many(["--lr 0.5 --a 2", "", "--tags foo"])
+    second = parser.parse_many(["--lr 0.5 --a 2", "", "--tags foo"])
+    assert first == second
+    assert [result.value.config for result in first] == [
+        Config(model=A(a=2), lr=0.5),
+        Config(),
+        Config(tags=["foo"]),
+    ]
+    # The parser can still be used normally afterwards.
+    assert parser.parse_args(["--a", "4"]).config == Config(model=A(a=4))
+
+
+def test_parser_only_reuses_the_arguments_for_the_same_subgroups():
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    with_a, with_b = parser.parse_many(["--a 2", "--model b"])
+    assert with_a.value.config == Config(model=A(a=2))
+    assert isinstance(with_b.error, ParsingError)
+    assert "Can't reuse the arguments of this parser" in str(with_b.error)
+
+
+@pytest.mark.parametrize("option", ["--help", "--version"])
+def test_help_and_version_dont_stop_the_other_arguments(
+    option: str, capsys: pytest.CaptureFixture[str]
+):
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    parser.add_argument("--version", action="version", version="1.2.3")
+    before, exited, after = parser.parse_many(["--lr 0.2", option, "--lr 0.3"])
+    assert before.value.config == Config(lr=0.2)
+    assert after.value.config == Config(lr=0.3)
+    assert isinstance(exited.error, ParsingError)
+    assert ("usage:" if option == "--help" else "1.2.3") in str(exited.error)
+    # The help and version are in the error, instead of being printed.
+    assert capsys.readouterr().out == ""
+    # The parser still exits normally afterwards.
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--version"])
+    assert capsys.readouterr().out == "1.2.3\n"
+
+
+def test_iter_parse_many_is_lazy():
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+
+    def args_list():
+        yield "--lr 0.3"
+        raise RuntimeError("Shouldn't be consumed.")
+
+    results = parser.iter_parse_many(args_list())
+    assert next(results).value.config == Config(lr=0.3)
+
+
+def test_error_in_nested_subgroup_doesnt_break_the_parser():
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    error, result = parser.parse_many(["--model ab --inner c", "--model ab --inner b --b x"])
+    assert "invalid choice: 'c'" in str(error.error)
+    assert result.value.config == Config(model=AB(inner=B(b="x")))
+
+
+def test_namespace_is_not_modified():
+    namespace = argparse.Namespace(foo=123)
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    [result] = parser.parse_many(["--lr 0.2"], namespace=namespace)
+    assert result.value.foo == 123
+    assert result.value.config == Config(lr=0.2)
+    assert vars(namespace) == {"foo": 123}
+
+
+def test_config_path_arg(tmp_path: Path):
+    config_a = tmp_path / "a.json"
+    config_a.write_text(json.dumps({"lr": 0.5}))
+    config_b = tmp_path / "b.json"
+    config_b.write_text(json.dumps({"lr": 0.7}))
+
+    results = simple_parsing.parse_many(
+        Config,
+        [
+            f"--config_path {config_a}",
+            f"--config_path {config_b} --a 2",
+            "",
+            f"--config_path {config_a} --a 3",
+        ],
+        add_config_path_arg=True,
+    )
+    assert [result.value for result in results] == [
+        Config(lr=0.5),
+        Config(model=A(a=2), lr=0.7),
+        Config(),
+        Config(model=A(a=3), lr=0.5),
+    ]
+
+
+def test_parse_args_can_be_called_twice_with_config_path_arg(tmp_path: Path):
+    parser = ArgumentParser(add_config_path_arg=True)
+    parser.add_arguments(Config, dest="config")
+    assert parser.parse_args(["--lr", "0.2"]).config == Config(lr=0.2)
+    assert parser.parse_args(["--lr", "0.3"]).config == Config(lr=0.3)
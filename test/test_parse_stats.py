@@ -0,0 +1,122 @@
+"""Tests for the opt-in per-phase statistics of parsing."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import simple_parsing
+from simple_parsing import ArgumentParser, ParseStats, subgroups
+from simple_parsing.docstring import inspect_getsource
+from simple_parsing.parse_stats import _current_stats, collect_stats
+
+
+@dataclass
+class Optimizer:
+    """Optimizer settings."""
+
+    lr: float = 0.1  # The learning rate.
+
+
+@dataclass
+class ModelA:
+    num_layers: int = 2
+
+
+@dataclass
+class ModelB:
+    hidden_size: int = 16
+
+
+@dataclass
+class Config:
+    optimizer: Optimizer = field(default_factory=Optimizer)
+    model: ModelA | ModelB = subgroups({"a": ModelA, "b": ModelB}, default="a")
+
+
+def test_stats_are_not_collected_by_default():
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+    parser.parse_args([])
+    assert parser.stats is None
+    assert _current_stats.get() is None
+
+
+def test_stats_of_each_phase(tmp_path: Path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"config": {"optimizer": {"lr": 0.5}}}))
+    parser = ArgumentParser(collect_stats=True, config_path=config_file)
+    parser.add_arguments(Config, dest="config")
+
+    config = parser.parse_args(["--model", "b"]).config
+    assert config == Config(optimizer=Optimizer(lr=0.5), model=ModelB())
+
+    stats = parser.stats
+    assert isinstance(stats, ParseStats)
+    for phase in [
+        "parse_known_args",
+        "set_defaults",
+        "read_file",
+        "parse_config_path_arg",
+        "preprocessing",
+        "conflict_resolution",
+        "resolve_subgroups",
+        "add_arguments",
+        "argparse",
+        "postprocessing",
+        "fill_constructor_arguments",
+        "instantiate_dataclasses",
+    ]:
+        assert stats[phase].calls >= 1, phase
+        assert stats[phase].time >= 0
+    assert stats["parse_known_args"].time >= stats["postprocessing"].time
+    assert "parse_known_args" in stats.summary()
+    # The stats are only collected while parsing.
+    assert _current_stats.get() is None
+
+    parser.parse_args([])
+    assert stats["parse_known_args"].calls == 2
+    # The arguments are only added once.
+    assert stats["add_arguments"].calls == 1
+
+    stats.reset()
+    assert "parse_known_args" not in stats
+    assert stats["parse_known_args"].calls == 0
+
+
+def test_helpers_are_counted():
+    inspect_getsource.cache_clear()
+    parser = ArgumentParser(collect_stats=True)
+    parser.add_arguments(Config, dest="config")
+    parser.parse_args([])
+    # The docstrings are only retrieved when formatting the help.
+    assert parser.stats["inspect.getsource"].calls == 0
+
+    with collect_stats(parser.stats):
+        assert "The learning rate." in parser.format_help()
+    assert parser.stats["inspect.getsource"].calls >= 1
+
+
+def test_collect_stats_context_manager():
+    @dataclass
+    class NewConfig:
+        lr: float = 0.1
+
+    with collect_stats() as stats:
+        simple_parsing.parse(NewConfig, args="--lr 0.2")
+        simple_parsing.parse_many(NewConfig, ["--lr 0.3", "--lr foo"])
+    assert stats["parse_known_args"].calls == 1
+    assert stats["parse_many"].calls == 2
+    assert stats["typing.get_type_hints"].calls >= 1
+
+
+def test_stats_of_compiled_parser():
+    parser = ArgumentParser(collect_stats=True)
+    parser.add_arguments(Config, dest="config")
+    compiled = parser.compile()
+    assert parser.stats["compile"].calls == 1
+    compiled.parse_args(["--lr", "0.3"])
+    compiled.parse_args([])
+    assert parser.stats["parse_known_args"].calls == 2
+    assert parser.stats["preprocessing"].calls == 1
@@ -0,0 +1,92 @@
+"""Tests for the opt-in on-disk cache of the resolved arguments of the parser."""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from simple_parsing import ArgumentParser, ConflictResolution, DashVariant
+from simple_parsing.conflicts import ConflictResolver
+
+
+@dataclass
+class Optimizer:
+    """Settings of an optimizer."""
+
+    lr: float = 0.1  # Learning rate.
+    momentum: float = 0.9
+    """Momentum coefficient."""
+
+
+@dataclass
+class Config:
+    """Some config with a conflict between two optimizers."""
+
+    generator: Optimizer = field(default_factory=Optimizer)
+    discriminator: Optimizer = field(default_factory=Optimizer)
+    seed: int = 123  # Random seed.
+
+
+def _make_parser(cache_dir: Path, **kwargs) -> ArgumentParser:
+    parser = ArgumentParser(cache_dir=cache_dir, **kwargs)
+    parser.add_arguments(Config, dest="config")
+    return parser
+
+
+def _help(parser: ArgumentParser) -> str:
+    file = io.StringIO()
+    parser.print_help(file)
+    return file.getvalue()
+
+
+def test_cache_is_created_and_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    args = "--generator.lr 0.5 --discriminator.momentum 0.1 --seed 1"
+    expected = Config(
+        generator=Optimizer(lr=0.5), discriminator=Optimizer(momentum=0.1), seed=1
+    )
+    assert _make_parser(tmp_path).parse_args(args.split()).config == expected
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def _should_not_be_called(*args, **kwargs):
+        raise RuntimeError("Conflicts shouldn't be resolved again when using the cache.")
+
+    monkeypatch.setattr(ConflictResolver, "resolve_and_flatten", _should_not_be_called)
+    assert _make_parser(tmp_path).parse_args(args.split()).config == expected
+
+
+def test_help_is_the_same_with_cache(tmp_path: Path):
+    help_without_cache = _help(_make_parser(tmp_path / "unused"))
+    _help(_make_parser(tmp_path))
+    help_with_cache = _help(_make_parser(tmp_path))
+    assert help_with_cache == help_without_cache
+    assert "Learning rate." in help_with_cache
+    assert "Momentum coefficient." in help_with_cache
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"conflict_resolution": ConflictResolution.EXPLICIT},
+        {"add_option_string_dash_variants": DashVariant.DASH},
+    ],
+)
+def test_parser_options_are_part_of_the_key(tmp_path: Path, kwargs: dict):
+    _make_parser(tmp_path).parse_args([])
+    _make_parser(tmp_path, **kwargs).parse_args([])
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_always_merge_is_not_cached(tmp_path: Path):
+    parser = _make_parser(tmp_path, conflict_resolution=ConflictResolution.ALWAYS_MERGE)
+    parser.parse_args([])
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_corrupted_cache_entry_is_ignored(tmp_path: Path):
+    _make_parser(tmp_path).parse_args([])
+    [entry] = tmp_path.glob("*.json")
+    entry.write_text("{not json")
+    config = _make_parser(tmp_path).parse_args(["--generator.lr", "0.2"]).config
+    assert config == Config(generator=Optimizer(lr=0.2))
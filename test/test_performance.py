@@ -1,8 +1,9 @@
 import functools
 import importlib
+import subprocess
 import sys
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Callable, TypeVar, Union
 
 import pytest
 from pytest_benchmark.fixture import BenchmarkFixture
@@ -11,6 +12,20 @@ from .testutils import needs_yaml
 
 C = TypeVar("C", bound=Callable)
 
+IMPORT_TIME_BUDGET_SECONDS = 0.3
+"""Maximum time that `import simple_parsing` should take in a fresh interpreter."""
+
+LAZILY_IMPORTED_MODULES = [
+    "yaml",
+    "numpy",
+    "docstring_parser",
+    "simple_parsing.decorators",
+    "simple_parsing.helpers.hparams",
+    "simple_parsing.helpers.partial",
+    "simple_parsing.helpers.serialization",
+]
+"""Modules that shouldn't be imported by `import simple_parsing`, only when they are used."""
+
 
 def import_sp():
     assert "simple_parsing" not in sys.modules
@@ -28,8 +43,14 @@ def unimport_sp():
 
 
 def clear_lru_caches():
-    from simple_parsing.docstring import dp_parse, inspect_getdoc, inspect_getsource
+    from simple_parsing.docstring import (
+        _get_attribute_docstrings,
+        dp_parse,
+        inspect_getdoc,
+        inspect_getsource,
+    )
 
+    _get_attribute_docstrings.cache_clear()
     dp_parse.cache_clear()
     inspect_getdoc.cache_clear()
     inspect_getsource.cache_clear()
@@ -52,13 +73,85 @@ def test_import_performance(benchmark: BenchmarkFixture):
     benchmark(call_before(unimport_sp, import_sp))
 
 
+def _run_in_fresh_interpreter(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _import_time_in_fresh_interpreter() -> float:
+    """Returns the time taken by `import simple_parsing`, without the interpreter startup."""
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import simple_parsing\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    return float(_run_in_fresh_interpreter(code))
+
+
+def test_import_time_budget():
+    # Take the best of a few runs to reduce the noise.
+    import_time = min(_import_time_in_fresh_interpreter() for _ in range(3))
+    assert import_time < IMPORT_TIME_BUDGET_SECONDS
+
+
+@pytest.mark.benchmark(
+    group="import",
+)
+def test_import_time_in_fresh_interpreter(benchmark: BenchmarkFixture):
+    """Measures the time taken by `import simple_parsing` in a fresh interpreter.
+
+    The time of the import itself (without the interpreter startup) is saved in the `extra_info`
+    of the benchmark.
+    """
+    import_times: list[float] = []
+
+    def run():
+        import_times.append(_import_time_in_fresh_interpreter())
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["import_time"] = min(import_times)
+
+
+def test_heavy_modules_are_imported_lazily():
+    code = (
+        "import sys\n"
+        "from dataclasses import dataclass\n"
+        "import simple_parsing\n"
+        "@dataclass\n"
+        "class Config:\n"
+        "    a: int = 1\n"
+        "assert simple_parsing.parse(Config, args='--a 2') == Config(a=2)\n"
+        f"print(','.join(m for m in {LAZILY_IMPORTED_MODULES!r} if m in sys.modules))\n"
+    )
+    assert _run_in_fresh_interpreter(code).strip() == ""
+
+
+def test_lazy_attributes_are_importable():
+    import simple_parsing
+    import simple_parsing.helpers
+    import simple_parsing.helpers.serialization
+    from simple_parsing.helpers.serialization.serializable import Serializable
+
+    assert simple_parsing.Serializable is Serializable
+    assert simple_parsing.helpers.JsonSerializable is Serializable
+    assert simple_parsing.helpers.serialization.Serializable is Serializable
+    for module in [simple_parsing, simple_parsing.helpers, simple_parsing.helpers.serialization]:
+        assert len(set(module.__all__)) == len(module.__all__)
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+            assert name in dir(module)
+    with pytest.raises(AttributeError):
+        simple_parsing.helpers.serialization.does_not_exist  # noqa: B018
+
+
 @pytest.mark.benchmark(
     group="parse",
 )
 def test_parse_performance(benchmark: BenchmarkFixture):
-    from test.nesting.example_use_cases import HyperParameters
-
     import simple_parsing as sp
+    from test.nesting.example_use_cases import HyperParameters
 
     benchmark(
         call_before(clear_lru_caches, sp.parse),
@@ -67,14 +160,191 @@ def test_parse_performance(benchmark: BenchmarkFixture):
     )
 
 
+@pytest.mark.benchmark(
+    group="parse",
+)
+@pytest.mark.parametrize("format_help", [False, True], ids=["parse_only", "parse_and_help"])
+def test_parse_docstring_overhead(benchmark: BenchmarkFixture, format_help: bool):
+    """Compares parsing arguments with and without the docstring work required by --help."""
+    import simple_parsing as sp
+    from test.nesting.example_use_cases import HyperParameters
+
+    def parse():
+        clear_lru_caches()
+        parser = sp.ArgumentParser()
+        parser.add_arguments(HyperParameters, dest="hparams")
+        args = parser.parse_args(["--age_group.num_layers", "5"])
+        if format_help:
+            parser.format_help()
+        return args
+
+    benchmark(parse)
+
+
+@pytest.mark.benchmark(
+    group="parse_many",
+)
+@pytest.mark.parametrize("batch", [False, True], ids=["parse_loop", "parse_many"])
+def test_parse_many_performance(benchmark: BenchmarkFixture, batch: bool):
+    """Parses many command-lines, with `parse_many` or by calling `parse` on each of them."""
+    import simple_parsing as sp
+    from test.nesting.example_use_cases import HyperParameters
+
+    args_list = [f"--age_group.num_layers {i % 10} --age_group.num_units {i}" for i in range(200)]
+
+    def parse_all():
+        if batch:
+            return [result.value for result in sp.parse_many(HyperParameters, args_list)]
+        return [sp.parse(HyperParameters, args=args) for args in args_list]
+
+    configs = benchmark(parse_all)
+    assert [config.age_group.num_units for config in configs] == list(range(200))
+
+
+@pytest.mark.benchmark(
+    group="parse_stats",
+)
+@pytest.mark.parametrize("collect_stats", [False, True], ids=["disabled", "enabled"])
+def test_parse_stats_overhead(benchmark: BenchmarkFixture, collect_stats: bool):
+    """Parses with and without collecting the stats of each phase of parsing."""
+    from simple_parsing import ArgumentParser
+    from test.nesting.example_use_cases import HyperParameters
+
+    def parse():
+        parser = ArgumentParser(collect_stats=collect_stats)
+        parser.add_arguments(HyperParameters, dest="hparams")
+        return parser.parse_args(["--age_group.num_layers", "3"]).hparams
+
+    hparams = benchmark(parse)
+    assert hparams.age_group.num_layers == 3
+
+
+def _make_nested_subgroups_config(depth: int, width: int) -> type:
+    """Creates a dataclass with `depth` levels of nested subgroups and `width` subgroups each."""
+    from dataclasses import field, make_dataclass
+
+    from simple_parsing import subgroups
+
+    A = make_dataclass("A", [("x", int, 1), ("y", float, 0.5)])
+    B = make_dataclass("B", [("x", int, 2), ("z", str, "b")])
+    child: type | None = None
+    for level in reversed(range(depth)):
+        fields: list[tuple] = [
+            (f"leaf_{level}_{i}", A, subgroups({"a": A, "b": B}, default="a"))
+            for i in range(width)
+        ]
+        if child is not None:
+            fields.append(
+                (f"level_{level + 1}", child, subgroups({"deep": child, "a": A}, default="deep"))
+            )
+        fields.append((f"value_{level}", int, field(default=level)))
+        child = make_dataclass(f"Level{level}", fields)
+    assert child is not None
+    return child
+
+
+@pytest.mark.benchmark(
+    group="subgroups",
+)
+@pytest.mark.parametrize(("depth", "width"), [(5, 2), (6, 8), (8, 4)])
+def test_nested_subgroups_performance(benchmark: BenchmarkFixture, depth: int, width: int):
+    """Parses a config with many levels of nested subgroups, and dozens of subgroup fields."""
+    from simple_parsing import ArgumentParser
+
+    Config = _make_nested_subgroups_config(depth, width)
+    # NOTE: The names of the fields are unique, so they don't get a prefix.
+    args = ["--leaf_0_0", "b", f"--leaf_{depth - 1}_0", "b"]
+
+    def parse():
+        parser = ArgumentParser()
+        parser.add_arguments(Config, dest="config")
+        return parser.parse_args(args)
+
+    config = benchmark(parse).config
+    deepest = config
+    for level in range(1, depth):
+        deepest = getattr(deepest, f"level_{level}")
+    assert type(config.leaf_0_0).__name__ == "B"
+    assert type(getattr(deepest, f"leaf_{depth - 1}_0")).__name__ == "B"
+    assert type(getattr(deepest, f"leaf_{depth - 1}_1")).__name__ == "A"
+
+
+@pytest.mark.benchmark(
+    group="conflicts",
+)
+@pytest.mark.parametrize("num_repeats", [10, 100, 500])
+def test_conflict_resolution_performance(benchmark: BenchmarkFixture, num_repeats: int):
+    """Resolves the conflicts between many instances of the same (nested) dataclass."""
+    from dataclasses import field, make_dataclass
+
+    from simple_parsing import ArgumentParser
+    from test.nesting.example_use_cases import HParams
+
+    Config = make_dataclass(
+        "Config",
+        [(f"model_{i}", HParams, field(default_factory=HParams)) for i in range(num_repeats)],
+    )
+
+    def resolve():
+        parser = ArgumentParser()
+        parser.add_arguments(Config, dest="config")
+        return parser._conflict_resolver.resolve_and_flatten(parser._wrappers)
+
+    wrappers = benchmark(resolve)
+    assert len(wrappers) == num_repeats + 1
+
+
+@pytest.mark.benchmark(
+    group="docstrings",
+)
+@pytest.mark.parametrize("num_fields", [50, 500, 1000])
+def test_wide_dataclass_docstrings(
+    benchmark: BenchmarkFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    num_fields: int,
+):
+    """Retrieves the docstrings of all the fields of a dataclass with many fields."""
+    from simple_parsing.docstring import get_attribute_docstring
+
+    module_name = f"_wide_dataclass_{num_fields}"
+    lines = [
+        "from dataclasses import dataclass",
+        "",
+        "",
+        "@dataclass",
+        "class Wide:",
+        '    """A dataclass with lots of fields."""',
+        "",
+    ]
+    for i in range(num_fields):
+        lines += [
+            f"    # Comment above field_{i}",
+            f"    field_{i}: int = {i}  # Inline comment of field_{i}",
+            f'    """Docstring of field_{i}."""',
+            "",
+        ]
+    (tmp_path / f"{module_name}.py").write_text("\n".join(lines))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    wide_dataclass = importlib.import_module(module_name).Wide
+
+    def get_all_docstrings():
+        clear_lru_caches()
+        return [get_attribute_docstring(wide_dataclass, f"field_{i}") for i in range(num_fields)]
+
+    docstrings = benchmark(get_all_docstrings)
+    assert docstrings[-1].docstring_below == f"Docstring of field_{num_fields - 1}."
+    assert docstrings[-1].comment_above == f"Comment above field_{num_fields - 1}"
+
+
 @pytest.mark.benchmark(
     group="serialization",
 )
 @pytest.mark.parametrize("filetype", [pytest.param(".yaml", marks=needs_yaml), ".json", ".pkl"])
 def test_serialization_performance(benchmark: BenchmarkFixture, tmp_path: Path, filetype: str):
-    from test.test_huggingface_compat import TrainingArguments
-
     from simple_parsing.helpers.serialization import load, save
+    from test.test_huggingface_compat import TrainingArguments
 
     args = TrainingArguments()
     path = (tmp_path / "bob").with_suffix(filetype)
@@ -88,3 +358,411 @@ def test_serialization_performance(benchmark: BenchmarkFixture, tmp_path: Path,
         assert load(TrainingArguments, path) == args
 
     benchmark(save_and_load)
+
+
+@pytest.mark.benchmark(
+    group="to_dict",
+)
+@pytest.mark.parametrize("encoder", ["compiled", "recompiled", "asdict"])
+def test_to_dict_performance(benchmark: BenchmarkFixture, encoder: str):
+    """Serializes many small dataclasses to dicts.
+
+    - compiled: `to_dict`, with the encoder of each dataclass type compiled once;
+    - recompiled: `to_dict`, compiling the encoders again for each batch;
+    - asdict: `dataclasses.asdict`, for reference.
+    """
+    import dataclasses
+
+    from simple_parsing.helpers.serialization import serializable, to_dict
+
+    Optimizer = dataclasses.make_dataclass(
+        "Optimizer", [("name", str, "adam"), ("lr", float, 1e-3), ("betas", tuple, (0.9, 0.99))]
+    )
+    Result = dataclasses.make_dataclass(
+        "Result",
+        [
+            ("step", int, 0),
+            ("loss", float, 0.0),
+            ("done", bool, False),
+            ("optimizer", Optimizer, dataclasses.field(default_factory=Optimizer)),
+        ],
+    )
+    results = [Result(step=i, loss=1 / (i + 1)) for i in range(1000)]
+
+    def encode_all():
+        if encoder == "asdict":
+            return [dataclasses.asdict(result) for result in results]
+        if encoder == "recompiled":
+            serializable._dict_encoders.clear()
+        return [to_dict(result) for result in results]
+
+    dicts = benchmark(encode_all)
+    assert dicts[-1]["step"] == 999
+    assert dicts[-1]["optimizer"]["name"] == "adam"
+
+
+@pytest.mark.benchmark(
+    group="to_dict_copy_mode",
+)
+@pytest.mark.parametrize("copy_mode", ["deep", "shallow"])
+def test_to_dict_copy_mode_performance(benchmark: BenchmarkFixture, copy_mode: str):
+    """Serializes a dataclass with large field values, with each copy mode of `to_dict`.
+
+    The peak memory used while encoding is saved in the `extra_info` of the benchmark.
+    """
+    import dataclasses
+    import tracemalloc
+
+    from simple_parsing.helpers.serialization import to_dict
+
+    class State:
+        def __init__(self, size: int):
+            self.weights = [float(i) for i in range(size)]
+
+    Checkpoint = dataclasses.make_dataclass(
+        "Checkpoint",
+        [
+            ("description", str, "x" * 1_000_000),
+            ("blob", bytes, b"\x00" * 1_000_000),
+            ("shape", tuple, tuple(range(10_000))),
+            ("state", State, dataclasses.field(default_factory=lambda: State(100_000))),
+        ],
+    )
+    checkpoint = Checkpoint()
+
+    tracemalloc.start()
+    to_dict(checkpoint, copy_mode=copy_mode)
+    benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    d = benchmark(to_dict, checkpoint, copy_mode=copy_mode)
+    assert d["blob"] is checkpoint.blob
+    assert d["state"].weights == checkpoint.state.weights
+
+
+@pytest.mark.benchmark(
+    group="from_dict",
+)
+@pytest.mark.parametrize("decoders", ["compiled", "recompiled"])
+def test_from_dict_performance(benchmark: BenchmarkFixture, decoders: str):
+    """Decodes many small (nested) dataclasses from dicts.
+
+    - compiled: `from_dict`, with the field decoders of each dataclass type created once;
+    - recompiled: `from_dict`, creating the field decoders again for each batch.
+    """
+    import dataclasses
+
+    from simple_parsing.helpers.serialization import decoding, from_dict
+
+    Optimizer = dataclasses.make_dataclass(
+        "Optimizer", [("name", str, "adam"), ("lr", float, 1e-3), ("betas", tuple, (0.9, 0.99))]
+    )
+    Result = dataclasses.make_dataclass(
+        "Result",
+        [
+            ("step", int, 0),
+            ("loss", float, 0.0),
+            ("done", bool, False),
+            ("optimizer", Optimizer, dataclasses.field(default_factory=Optimizer)),
+        ],
+    )
+    dicts = [
+        {"step": i, "loss": 1 / (i + 1), "done": False, "optimizer": {"name": "sgd", "lr": 0.1}}
+        for i in range(1000)
+    ]
+
+    def decode_all():
+        if decoders == "recompiled":
+            decoding._clear_compiled_decoders()
+        return [from_dict(Result, d) for d in dicts]
+
+    results = benchmark(decode_all)
+    assert results[-1].step == 999
+    assert results[-1].optimizer.name == "sgd"
+
+
+_FORMAT_BACKENDS = [
+    pytest.param(".yaml", "libyaml", marks=needs_yaml, id="yaml-libyaml"),
+    pytest.param(".yaml", "python", marks=needs_yaml, id="yaml-python"),
+    pytest.param(".json", "orjson", id="json-orjson"),
+    pytest.param(".json", "json", id="json-json"),
+]
+
+
+@pytest.mark.parametrize("operation", ["read_file", "load", "save"])
+@pytest.mark.parametrize(("filetype", "backend"), _FORMAT_BACKENDS)
+def test_format_backend_performance(
+    benchmark: BenchmarkFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    filetype: str,
+    backend: str,
+    operation: str,
+):
+    """Compares the backends of the yaml and json formats for reading, loading and saving."""
+    from simple_parsing.helpers.serialization import load, save
+    from simple_parsing.helpers.serialization.serializable import get_extension, read_file
+    from test.test_huggingface_compat import TrainingArguments
+
+    format = get_extension("args" + filetype)
+    if backend not in format.available_backends():
+        pytest.skip(f"The {backend} backend isn't available.")
+    monkeypatch.setattr(format, "backend", backend)
+    benchmark.group = f"format-{filetype[1:]}-{operation}"
+
+    args = TrainingArguments()
+    path = (tmp_path / "args").with_suffix(filetype)
+    save(args, path)
+
+    if operation == "read_file":
+        assert benchmark(read_file, path)["output_dir"] == args.output_dir
+    elif operation == "load":
+        assert benchmark(load, TrainingArguments, path) == args
+    else:
+        benchmark(save, args, path)
+        assert load(TrainingArguments, path) == args
+
+
+@pytest.mark.benchmark(
+    group="only_non_default",
+)
+@pytest.mark.parametrize("only_non_default", [False, True], ids=["full", "only_non_default"])
+def test_only_non_default_performance(
+    benchmark: BenchmarkFixture, tmp_path: Path, only_non_default: bool
+):
+    """Saves and loads a config with many fields, of which only a few are not at their default."""
+    from simple_parsing.helpers.serialization import load, save
+    from test.test_huggingface_compat import TrainingArguments
+
+    args = TrainingArguments(seed=123, learning_rate=1e-4, output_dir="runs/123")
+    path = tmp_path / "args.json"
+
+    def save_and_load():
+        save(args, path, only_non_default=only_non_default)
+        return load(TrainingArguments, path, only_non_default=only_non_default)
+
+    assert benchmark(save_and_load) == args
+    benchmark.extra_info["file_size"] = path.stat().st_size
+
+
+@needs_yaml
+@pytest.mark.benchmark(
+    group="config_path",
+)
+@pytest.mark.parametrize("cache_size", [0, 128], ids=["uncached", "cached"])
+def test_config_path_performance(
+    benchmark: BenchmarkFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    cache_size: int,
+):
+    """Parses the arguments with a config file many times, with and without the file cache."""
+    import dataclasses
+
+    from simple_parsing import ArgumentParser
+    from simple_parsing.helpers.serialization import serializable, to_dict
+    from test.test_huggingface_compat import TrainingArguments
+
+    monkeypatch.setattr(serializable, "file_cache", serializable.FileCache(maxsize=cache_size))
+    config_path = tmp_path / "args.yaml"
+    args = to_dict(TrainingArguments(seed=123))
+    init_fields = [f.name for f in dataclasses.fields(TrainingArguments) if f.init]
+    serializable.save({"args": {name: args[name] for name in init_fields}}, config_path)
+
+    def parse():
+        parser = ArgumentParser(config_path=config_path)
+        parser.add_arguments(TrainingArguments, dest="args")
+        return parser.parse_args([])
+
+    assert benchmark(parse).args.seed == 123
+
+
+@pytest.mark.benchmark(
+    group="load_dir",
+)
+@pytest.mark.parametrize("executor_type", ["none", "thread", "process"])
+def test_load_dir_performance(benchmark: BenchmarkFixture, tmp_path: Path, executor_type: str):
+    """Loads a directory of saved configs, in this thread or with a pool of 4 workers."""
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    from simple_parsing.helpers.serialization import load_dir, save
+    from test.test_huggingface_compat import TrainingArguments
+
+    num_files = 200
+    for i in range(num_files):
+        save(TrainingArguments(seed=i), tmp_path / f"run_{i:03}.json")
+
+    executor = None
+    if executor_type == "thread":
+        executor = ThreadPoolExecutor(max_workers=4)
+    elif executor_type == "process":
+        executor = ProcessPoolExecutor(max_workers=4)
+
+    def load_all():
+        return list(load_dir(TrainingArguments, tmp_path, executor=executor, chunksize=25))
+
+    try:
+        results = benchmark(load_all)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    assert [result.value.seed for result in results] == list(range(num_files))
+
+
+def _make_wide_config(width: int) -> tuple[type, list[str]]:
+    """A dataclass with `width` fields."""
+    from dataclasses import field, make_dataclass
+
+    Config = make_dataclass("Wide", [(f"field_{i}", int, field(default=i)) for i in range(width)])
+    return Config, ["--field_0", "1", f"--field_{width - 1}", "2"]
+
+
+def _make_deep_config(depth: int) -> tuple[type, list[str]]:
+    """A dataclass with `depth` levels of nested dataclasses, each with a unique field."""
+    from dataclasses import field, make_dataclass
+
+    child: type | None = None
+    for level in reversed(range(depth)):
+        fields: list[tuple] = [(f"value_{level}", int, field(default=level))]
+        if child is not None:
+            fields.append((f"level_{level + 1}", child, field(default_factory=child)))
+        child = make_dataclass(f"Level{level}", fields)
+    assert child is not None
+    return child, ["--value_0", "1", f"--value_{depth - 1}", "2"]
+
+
+def _make_reused_config(num_repeats: int) -> tuple[type, list[str]]:
+    """A dataclass with the same (nested) dataclass at `num_repeats` destinations."""
+    from dataclasses import field, make_dataclass
+
+    Optimizer = make_dataclass("Optimizer", [("lr", float, 0.1), ("momentum", float, 0.9)])
+    Model = make_dataclass(
+        "Model",
+        [("num_layers", int, 2), ("optimizer", Optimizer, field(default_factory=Optimizer))],
+    )
+    Config = make_dataclass(
+        "Reused", [(f"model_{i}", Model, field(default_factory=Model)) for i in range(num_repeats)]
+    )
+    # NOTE: The option strings depend on the conflict resolution mode, so only defaults are used.
+    return Config, []
+
+
+def _make_subgroups_config(depth: int, width: int) -> tuple[type, list[str]]:
+    return _make_nested_subgroups_config(depth, width), ["--leaf_0_0", "b"]
+
+
+def _make_subparsers_config(num_commands: int) -> tuple[type, list[str]]:
+    """A dataclass with `num_commands` sub-commands, each with a few fields."""
+    from dataclasses import make_dataclass
+
+    from simple_parsing import subparsers
+
+    commands = {
+        f"cmd_{i}": make_dataclass(f"Command{i}", [("x", int, 0), ("name", str, f"cmd_{i}")])
+        for i in range(num_commands)
+    }
+    Command = Union[tuple(commands.values())]  # type: ignore
+    Config = make_dataclass(
+        "WithCommands", [("command", Command, subparsers(commands)), ("verbose", bool, False)]
+    )
+    return Config, ["cmd_0", "--x", "3"]
+
+
+_SCALING_CASES = [
+    *[
+        pytest.param("width", _make_wide_config, (n,), {}, id=f"width-{n}")
+        for n in (10, 100, 1000)
+    ],
+    *[pytest.param("depth", _make_deep_config, (n,), {}, id=f"depth-{n}") for n in (2, 8, 32)],
+    *[
+        pytest.param(
+            "reuse",
+            _make_reused_config,
+            (n,),
+            {"conflict_resolution": mode},
+            id=f"reuse-{n}-{mode}",
+        )
+        for mode in ("AUTO", "EXPLICIT", "ALWAYS_MERGE")
+        for n in (10, 50)
+    ],
+    *[
+        pytest.param(
+            "subgroups",
+            _make_subgroups_config,
+            (depth, width),
+            {},
+            id=f"subgroups-{depth}x{width}",
+        )
+        for depth, width in ((2, 2), (5, 4), (8, 4))
+    ],
+    *[
+        pytest.param("subparsers", _make_subparsers_config, (n,), {}, id=f"subparsers-{n}")
+        for n in (2, 16, 64)
+    ],
+]
+
+
+@pytest.mark.parametrize("phase", ["construct", "parse", "help"])
+@pytest.mark.parametrize(("axis", "make_config", "sizes", "parser_kwargs"), _SCALING_CASES)
+def test_scaling(
+    benchmark: BenchmarkFixture,
+    axis: str,
+    make_config: Callable[..., tuple[type, list[str]]],
+    sizes: tuple[int, ...],
+    parser_kwargs: dict,
+    phase: str,
+):
+    """Measures how each phase scales with the size of the dataclass tree along one axis.
+
+    - construct: creating the parser and adding all the arguments;
+    - parse: parsing the arguments and instantiating the dataclasses, once the arguments are added;
+    - help: rendering the help, once the arguments are added.
+
+    The peak memory used by the phase (measured with `tracemalloc`) is stored in the `extra_info`
+    of the benchmark.
+    """
+    import tracemalloc
+
+    from simple_parsing import ArgumentParser, ConflictResolution
+
+    benchmark.group = f"scaling-{axis}-{phase}"
+    Config, args = make_config(*sizes)
+    if "conflict_resolution" in parser_kwargs:
+        # NOTE: simple_parsing isn't imported at the module level (see `test_import_performance`).
+        mode = ConflictResolution[parser_kwargs["conflict_resolution"]]
+        parser_kwargs = {**parser_kwargs, "conflict_resolution": mode}
+
+    def construct():
+        parser = ArgumentParser(**parser_kwargs)
+        parser.add_arguments(Config, dest="config")
+        return parser.compile(args)
+
+    def setup():
+        clear_lru_caches()
+        if phase == "construct":
+            return (), {}
+        return (construct(),), {}
+
+    def run(compiled=None):
+        if phase == "construct":
+            return construct()
+        if phase == "parse":
+            return compiled.parse_args(args)
+        return compiled.format_help()
+
+    run_args, run_kwargs = setup()
+    tracemalloc.start()
+    try:
+        run(*run_args, **run_kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["axis"] = axis
+    benchmark.extra_info["sizes"] = list(sizes)
+    benchmark.extra_info["peak_memory_kib"] = round(peak / 1024, 1)
+
+    result = benchmark.pedantic(run, setup=setup, rounds=3, warmup_rounds=0)
+    if phase == "parse":
+        assert result.config is not None
+    elif phase == "help":
+        assert "usage:" in result
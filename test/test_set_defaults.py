@@ -133,3 +133,24 @@ def test_with_nested_field(tmp_path: Path, add_arguments_before: bool, with_root
 
     args = parser.parse_args("--a 111".split())
     assert args.config == ConfigWithFoo(foo=Foo(a=111, b="BYE BYE"))
+
+
+def test_config_file_is_read_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from simple_parsing.helpers.serialization import serializable
+
+    monkeypatch.setattr(serializable, "file_cache", serializable.FileCache())
+    config_path = tmp_path / "foo.yaml"
+    save({"foo": to_dict(Foo(a=456))}, config_path)
+
+    for _ in range(3):
+        parser = ArgumentParser(config_path=config_path)
+        parser.add_arguments(Foo, dest="foo")
+        assert parser.parse_args("").foo == Foo(a=456)
+    assert serializable.file_cache.cache_info().misses == 1
+
+    # The file is read again once it is modified.
+    save({"foo": to_dict(Foo(a=4567))}, config_path)
+    parser = ArgumentParser(config_path=config_path)
+    parser.add_arguments(Foo, dest="foo")
+    assert parser.parse_args("").foo == Foo(a=4567)
+    assert serializable.file_cache.cache_info().misses == 2
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import dataclasses
 import functools
 import inspect
@@ -934,3 +935,68 @@ def test_ordering_of_args_doesnt_matter():
         model=ModelAConfig(lr=0.0003, optimizer="Adam", betas=(0.0, 1.0)),
         dataset=Dataset2Config(data_dir="data/bar", bar=1.2),
     )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        "",
+        "--model b",
+        "--model=b",
+        "--model b --model c",
+        "--model b --seed 1 -e c",
+        "-eb",
+        "-e=c",
+        "--model",
+        "--model --seed 1",
+        "--model d",
+        "--model=",
+        "--seed 1 -- --model b",
+        "--model -1",
+        "--models b",
+        "--other b --model c -e a",
+        "+m b",
+        "+mc",
+        "--model +m",
+        "--model b +m c",
+    ],
+)
+@pytest.mark.parametrize("required", [False, True])
+@pytest.mark.parametrize("prefix_chars", ["-", "-+"])
+@pytest.mark.parametrize("negative_number_option", [False, True])
+def test_subgroup_choices_are_parsed_like_argparse(
+    args: str,
+    required: bool,
+    prefix_chars: str,
+    negative_number_option: bool,
+    capsys: pytest.CaptureFixture,
+):
+    """The subgroup choices are found in the tokenized args the same way argparse would."""
+    from simple_parsing.parsing import _OptionValues, _parse_subgroup_choices
+
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False, prefix_chars=prefix_chars)
+    model_flags = ["--model", "+m"] if "+" in prefix_chars else ["--model"]
+    actions = [
+        parser.add_argument(*model_flags, default="a", choices=["a", "b", "c", "-1", "+m"]),
+        parser.add_argument("-e", "--encoder", choices=["a", "b", "c"], required=required),
+    ]
+    if negative_number_option:
+        # argparse doesn't consider negative numbers to be values when an option looks like one.
+        parser.add_argument("-2", dest="two", default=argparse.SUPPRESS)
+
+    def _argparse_result():
+        return parser.parse_known_args(shlex.split(args))[0]
+
+    def _result():
+        option_values = _OptionValues(shlex.split(args), parser)
+        return _parse_subgroup_choices(parser, actions, option_values, argparse.Namespace())
+
+    try:
+        expected = _argparse_result()
+    except SystemExit:
+        expected_error = capsys.readouterr().err
+        with pytest.raises(SystemExit):
+            _result()
+        assert capsys.readouterr().err == expected_error
+    else:
+        assert _result() == expected